@@ -4,7 +4,7 @@ from pygame.locals import *
 from .global_dict import SETTINGS, Globals
 from .engine import Application, GameObject, Scene, Serializer, register_class
 from .components import AnimatedSprite, Button, Label, ProgressBar, Sprite, TextBox, VBox, HBox, UIContainer
-from .physics import Area, Body, CircleCollider, Collider, PhysicsObject, PolyCollider, Ray, RayCollider, RectCollider
+from .physics import Area, Body, CapsuleCollider, CircleCollider, Collider, PhysicsObject, PolyCollider, Ray, RayCollider, RectCollider, TileCollider
 from .animation import *
 from .utils import (
     Rect,
@@ -19,6 +19,8 @@ from .utils import (
     COLLIDER_CIRCLE,
     COLLIDER_POLY,
     COLLIDER_RAY,
+    COLLIDER_CAPSULE,
+    COLLIDER_TILE,
 )
 from .primatives import Draw
 
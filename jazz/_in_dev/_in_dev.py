@@ -30,10 +30,20 @@ MIN_HORIZONAL_VELOCITY = 1.0
 MIN_Y_NORMAL = 0.15
 MIN_VERTICAL_VELOCITY = 80.0
 GROUND_CAST_DISTANCE = 10
+SLEEP_FRAMES = 30
+SLEEP_VELOCITY = 1.0
 
 
 class DynamicBody(Body):
-    """Dynamic physical body component that integrates gravity, damping, elastic collision response, and resting sleep states."""
+    """Dynamic physical body component that integrates gravity, damping, and resting sleep states.
+
+    Contacts are resolved by the scene's contact solver, which applies the body's
+    restitution and friction to its velocity.
+
+    A body that stays on the ground below SLEEP_VELOCITY, touching the same bodies, for
+    SLEEP_FRAMES frames asks its island to sleep. Once every body in the island has settled the whole island sleeps
+    and skips its updates until it is moved, pushed or loses a static support.
+    """
 
     def __init__(self, velocity: Vec2 | tuple[float, float] | None = None, restitution: float = 0.5, **kwargs) -> None:
         """Initializes the DynamicBody component.
@@ -45,45 +55,84 @@ class DynamicBody(Body):
         """
         kwargs.setdefault("name", "DynamicBody")
         super().__init__(**kwargs)
+        if velocity is not None:
+            self._kwargs["velocity"] = velocity
         self.velocity = Vec2(velocity or (0, 0))
         self.restitution = restitution
         self.on_ground = False
 
-    def move_and_collide(self, direction: Vec2, _visited: set[str] | None = None) -> list[tuple[Body, tuple[float, Vec2]]]:
-        """Moves the dynamic body and wakes it up from resting state if displacement is non-zero.
+    def reset(self, **overrides) -> None:
+        """Restores the body for reuse with its initial velocity, off the ground.
+
+        Args:
+            **overrides: Values to use instead of the ones the body was created with.
+        """
+        super().reset(**overrides)
+        self.velocity = Vec2(overrides.get("velocity", self._kwargs.get("velocity")) or (0, 0))
+        self.on_ground = False
+
+    def move_and_collide(self, direction: Vec2) -> list[tuple[Body, tuple[float, Vec2]]]:
+        """Moves the dynamic body and lifts it out of its resting state if moved upwards.
+
+        Sideways and downward pushes keep the resting state, the ground probe in update
+        re-checks the support on the next frame.
 
         Args:
             direction (Vec2): The displacement vector to move along.
-            _visited (set[str], optional): Set of object IDs already processed. Defaults to None.
 
         Returns:
             list[tuple[Body, tuple[float, Vec2]]]: Sensed collision records.
         """
-        if direction != Vec2(0, 0):
+        if direction.y < 0:
             self.on_ground = False
-        return super().move_and_collide(direction, _visited)
+        return super().move_and_collide(direction)
 
     def update(self, delta: float) -> None:
-        """Applies forces, integrates velocity, handles resting/sleep settling, and resolves collisions.
+        """Steps the body once per frame unless the application runs a fixed timestep.
 
         Args:
             delta (float): Time since the last frame.
         """
-        # If resting on ground, verify we are still touching a support surface
+        if Globals.scene.fixed_delta is None:
+            self._simulate(delta)
+
+    def fixed_update(self, delta: float) -> None:
+        """Steps the body once per physics tick when the application runs a fixed timestep.
+
+        Args:
+            delta (float): The fixed tick length.
+        """
+        self._simulate(delta)
+
+    def _simulate(self, delta: float) -> None:
+        """Applies forces, integrates velocity, handles resting/sleep settling, and resolves collisions.
+
+        Args:
+            delta (float): Time step to integrate over.
+        """
+        if self._sleeping:
+            return
+
+        contacts = []
+        # If resting on ground, probe a copy of the collider just below the body for a support surface
         if self.on_ground and not self.static:
-            self.move(Vec2(0, GROUND_CAST_DISTANCE))
-            collisions = Globals.scene.get_AABB_collisions(self)
+            collider = self.collider
+            overlaps = Globals.scene.overlap_shape(
+                collider,
+                collider.pos + Vec2(0, GROUND_CAST_DISTANCE),
+                collider.rotation,
+                self.collision_layers,
+                ignore=(self,),
+            )
 
             still_on_ground = False
-            if collisions:
-                for other in collisions:
-                    depth, normal = self.collider.collide_sat(other.collider)
-                    if depth > 0 and normal.y > MIN_Y_NORMAL:  # other is below us
-                        if other.static or getattr(other, "on_ground", False):
-                            still_on_ground = True
-                            break
+            for other, (_, normal) in overlaps:
+                if normal.y > MIN_Y_NORMAL:  # other is below us
+                    if other.static or getattr(other, "on_ground", False):
+                        still_on_ground = True
+                        contacts.append(other)
+                        break
 
-            self.move(Vec2(0, -GROUND_CAST_DISTANCE))  # Shift back AFTER precise check
             self.on_ground = still_on_ground
             if self.on_ground:
                 self.velocity.y = 0
@@ -99,14 +148,10 @@ class DynamicBody(Body):
 
         if not self.static:
             # Move and resolve collisions
+            # Bounces and friction are applied by the scene's contact solver
             collisions = self.move_and_collide(self.velocity * delta)
             if collisions:
-                for other, (depth, normal) in collisions:
-                    # Resolve velocity reflection
-                    vel_dot_normal = self.velocity.dot(normal)
-                    if vel_dot_normal > 0:
-                        # Reflect along normal with restitution
-                        self.velocity -= normal * (1 + self.restitution) * vel_dot_normal
+                contacts += [other for other, _ in collisions]
 
                 # Check if we should settle to ground
                 for other, (depth, normal) in collisions:
@@ -119,6 +164,21 @@ class DynamicBody(Body):
                                     self.velocity.x = 0
                                 break
 
+            contacts_changed = Globals.scene.islands.set_contacts(self, contacts)
+
+            # Count frames spent at rest with the same contacts, the island sleeps once all
+            # of its bodies have settled
+            if (
+                self.on_ground
+                and not contacts_changed
+                and self.velocity.magnitude_squared() < SLEEP_VELOCITY * SLEEP_VELOCITY
+            ):
+                self._still_frames += 1
+                if self._still_frames >= SLEEP_FRAMES and self.can_sleep:
+                    Globals.scene.islands.try_sleep(self, SLEEP_FRAMES)
+            else:
+                self._still_frames = 0
+
         # Delete if fell way off screen
         if self.pos.y > 850:
             self.queue_kill()
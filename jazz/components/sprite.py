@@ -19,6 +19,8 @@ class Sprite(GameObject):
             alpha (int, optional): Initial opacity transparency (0 to 255). Defaults to 255.
             texture (str | Texture | Surface, optional): Initial texture asset/ID. Defaults to "default".
             anchor (tuple, optional): Horizontal and vertical alignment values (e.g. ("center", "center")). Defaults to None.
+            interpolate (bool, optional): Blend the drawn transform between physics ticks when the
+                application runs a fixed timestep. Defaults to True.
         """
         super().__init__(name, **kwargs)
         self._flip_x: bool = kwargs.get("flip_x", False)
@@ -28,6 +30,11 @@ class Sprite(GameObject):
         self._anchor: list[int] = [1, 1]
         self._real_size: Vec2 = Vec2(0, 0)
 
+        # Transforms at the start and end of the last fixed tick
+        self.interpolate: bool = kwargs.get("interpolate", True)
+        self._previous_transform: tuple[Vec2, float] | None = None
+        self._fixed_transform: tuple[Vec2, float] | None = None
+
         self._texture: Texture | Image = None
         self.texture = kwargs.get("texture", "default")
 
@@ -48,20 +55,69 @@ class Sprite(GameObject):
         """Registers the sprite to the active scene's draw list on mount."""
         Globals.scene.add_sprite(self)
 
+    def reset(self, **overrides) -> None:
+        """Restores the sprite for reuse, dropping the transforms it was interpolating between.
+
+        Args:
+            **overrides: Values to use instead of the ones the sprite was created with.
+        """
+        super().reset(**overrides)
+        self._previous_transform = None
+        self._fixed_transform = None
+
+    def _begin_fixed_step(self) -> None:
+        """Engine method. Records the transform at the start of a fixed tick."""
+        self._previous_transform = (self.pos, self.rotation)
+
+    def _end_fixed_step(self) -> None:
+        """Engine method. Records the transform at the end of a fixed tick."""
+        self._fixed_transform = (self.pos, self.rotation)
+
+    def _render_transform(self) -> tuple[Vec2, float]:
+        """Gets the position and rotation to draw the sprite at.
+
+        With a fixed timestep the sprite is drawn between its transforms at the start and
+        end of the last tick, by how far the frame is into the next one. Sprites that were
+        moved outside of the tick are drawn where they are.
+
+        Returns:
+            tuple[Vec2, float]: The position and rotation to draw at.
+        """
+        pos = self.pos
+        rotation = self.rotation
+        alpha = Globals.scene._interpolation
+        if (
+            alpha is None
+            or not self.interpolate
+            or self._previous_transform is None
+            or self._fixed_transform is None
+        ):
+            return pos, rotation
+
+        fixed_pos, fixed_rotation = self._fixed_transform
+        if fixed_pos != pos or fixed_rotation != rotation:
+            return pos, rotation
+
+        previous_pos, previous_rotation = self._previous_transform
+        # Turn through the shorter way round
+        turn = (rotation - previous_rotation + 180) % 360 - 180
+        return previous_pos.lerp(pos, alpha), (previous_rotation + turn * alpha) % 360
+
     def render(self, offset: Vec2) -> None:
         """Draws the sprite texture onto the screen/canvas.
 
         Args:
             offset (Vec2): Viewport rendering offset to apply.
         """
+        pos, rotation = self._render_transform()
         dest = Rect(
-            self.draw_pos + offset, self._size.elementwise() * self._scale
+            pos + self._draw_offset + offset, self._size.elementwise() * self._scale
         )
         if isinstance(self._texture, Texture):
             self._texture.draw(
                 None,
                 dest,
-                self.rotation,
+                rotation,
                 -self._draw_offset,
                 self.flip_x,
                 self.flip_y,
@@ -69,7 +125,7 @@ class Sprite(GameObject):
         else:
             self._texture.flip_x = self.flip_x
             self._texture.flip_y = self.flip_y
-            self._texture.angle = -self.rotation
+            self._texture.angle = -rotation
             self._texture.alpha = self._alpha
             self._texture.draw(None, dest)
 
@@ -2,6 +2,8 @@ from .application import Application
 from .base_object import GameObject
 from .group import Group
 from .input_handler import InputHandler, Mouse, Keyboard
+from .object_pool import ObjectPool
+from .prefab import Prefab
 from .scene import Scene
 from .resource_manager import ResourceManager
 from .sound_manager import SoundManager
@@ -28,6 +28,8 @@ class Application:
         fps_max: int = 60,
         vsync: bool = False,
         experimental: bool = False,
+        fixed_rate: int | None = None,
+        max_substeps: int = 5,
     ) -> None:
         """Initializes the Application object and pygame, creates the
         application window
@@ -40,6 +42,11 @@ class Application:
             fps_max (int, optional): Sets the max fps that the window will be limited to. Defaults to 60.
             vsync (bool, optional): Controls if the window will try to use vsync. Defaults to False.
             experimental (bool, optional): Unused experimental parameter kept for compatibility. Defaults to False.
+            fixed_rate (int | None, optional): Physics ticks per second. When set, scenes get a
+                fixed_update call at this rate independent of the frame rate and sprites are drawn
+                interpolated between ticks. Defaults to None, one variable step per frame.
+            max_substeps (int, optional): Most fixed ticks run in a single frame. Time beyond
+                that is dropped so a slow frame cannot snowball into slower ones. Defaults to 5.
         """
         if self.instance is not None:
             raise JazzException("Application has already been initialized.")
@@ -70,6 +77,9 @@ class Application:
         self.max_frame_time: float = 1 / 15
         self.running: bool = True
         self.fps_max: int = fps_max
+        self.fixed_rate: int | None = fixed_rate
+        self.max_substeps: int = max_substeps
+        self._accumulator: float = 0
 
         Globals.app = self
         Globals.input = self._input
@@ -134,6 +144,8 @@ class Application:
             # Load next scene
             self._active_scene = self._load_scene(self._next_scene)
             Globals.scene = self._active_scene
+            self._accumulator = 0
+            self._active_scene._fixed_delta = 1 / self.fixed_rate if self.fixed_rate else None
             self._active_scene.on_load(scene_transfer_data)
 
             # Main scene loop
@@ -143,6 +155,8 @@ class Application:
 
                 # call hook functions
                 self._input.update()
+                if self.fixed_rate:
+                    self._step_fixed(self._active_scene)
                 self._active_scene._game_update(self._delta)
 
                 # render game window
@@ -155,10 +169,31 @@ class Application:
 
             # Allow for transfer of data between scenes
             scene_transfer_data = self._active_scene.on_unload()
+            self._active_scene._physics_world.narrowphase.shutdown()
 
         self._window.destroy()
         pygame.quit()
 
+    def _step_fixed(self, scene: Scene) -> None:
+        """Runs as many fixed ticks as the time since the last frame allows and stores how
+        far the frame is into the next tick for rendering.
+
+        Args:
+            scene (Scene): The scene to step.
+        """
+        step = 1 / self.fixed_rate
+        self._accumulator += self._delta
+        substeps = 0
+        while self._accumulator >= step:
+            if substeps >= self.max_substeps:
+                # Drop the backlog instead of trying to catch up
+                self._accumulator %= step
+                break
+            scene._fixed_update(step)
+            self._accumulator -= step
+            substeps += 1
+        scene._interpolation = self._accumulator / step
+
     def stop(self) -> None:
         """Sets the neccessary flags to stop the main game loop"""
         self.running = False
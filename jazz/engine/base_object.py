@@ -1,4 +1,4 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import uuid
 from typing import TypeVar
 
@@ -6,9 +6,27 @@ from ..global_dict import Globals
 from ..utils import Color, Vec2, angle_from_vec, unit_from_angle, JazzException
 from ..primatives import Draw
 
+if TYPE_CHECKING:
+    from .group import Group
+    from .object_pool import ObjectPool
+
 
 T = TypeVar("T", bound="GameObject")
 
+# Hooks the scene's UpdateDispatch calls, see jazz.engine.dispatch
+_DISPATCH_HOOKS = frozenset(
+    (
+        "_update",
+        "_engine_update",
+        "update",
+        "_late_update",
+        "_engine_late_update",
+        "late_update",
+        "_fixed_update",
+        "fixed_update",
+    )
+)
+
 class BaseObject:
     """Base class for all objects in the scene"""
 
@@ -34,6 +52,7 @@ class GameObject:
             screen_space (bool, optional): Whether the object is in screen space or world space. Defaults to False.
             pos (Vec2, optional): The object's local position. Defaults to Vec2(0,0).
             rotation (float, optional): The object's local rotation. Defaults to 0.
+            tags (Iterable[str], optional): Tags the scene can look the object up by. Defaults to no tags.
 
         """
         # Saving args
@@ -54,8 +73,10 @@ class GameObject:
         self._kwargs["properties"] = self._properties
 
         # Engine Attributes
-        self.name = name
+        self._name = name
         self.id = str(uuid.uuid1())
+        self._tags: set[str] = set(kwargs.get("tags", ()))
+        self._groups: set["Group"] = set()
 
         # Child properties
         self._children = {}
@@ -63,10 +84,12 @@ class GameObject:
         self._depth = 0
 
         # Engine flags
-        self.pause_process = kwargs.get("pause_process", False)
-        self.game_process = kwargs.get("game_process", True)
-        self.do_kill = False
         self._loaded: bool = False
+        self._pause_process = kwargs.get("pause_process", False)
+        self._game_process = kwargs.get("game_process", True)
+        self._do_kill = False
+        # The ObjectPool the object is recycled through, if any
+        self._pool: "ObjectPool | None" = None
 
         # Rendering flags
         self._visible = kwargs.get("visible", True)
@@ -98,6 +121,14 @@ class GameObject:
             delta (float): Time since last frame
         """
 
+    def fixed_update(self, delta: float) -> None:
+        """Base method that can be overwritten. Called once per physics tick when the
+        application runs with a fixed timestep, before the frame's update.
+
+        Args:
+            delta (float): The fixed tick length in seconds.
+        """
+
     def render_debug(self, offset: Vec2) -> None:
         """Base method that can be overwritten. Draws a circle at the object's world
         position and a line in it's look direction.
@@ -122,6 +153,16 @@ class GameObject:
         self._engine_update(delta)
         self.update(delta)
 
+    def _fixed_update(self, delta: float) -> None:
+        """Engine method that propogates the fixed_update call to it's children
+
+        Args:
+            delta (float): The fixed tick length in seconds
+        """
+        for child in self._children.values():
+            child._fixed_update(delta)
+        self.fixed_update(delta)
+
     def _engine_update(self, delta: float) -> None:
         """Engine method method that can be overwritten for engine classes. Called in the update loop"""
 
@@ -177,6 +218,7 @@ class GameObject:
             obj._set_transform_dirty()
             if getattr(self, "_loaded", False):
                 obj._on_load()
+                Globals.scene.child_added(self, obj)
             return obj
         else:
             raise JazzException(
@@ -194,6 +236,8 @@ class GameObject:
             JazzException: If obj is not a child of the calling object
         """
         if obj.id in self._children:
+            if self._loaded:
+                Globals.scene.child_removed(self, obj)
             self._children.pop(obj.id)
             obj._parent = None
             obj._set_transform_dirty()
@@ -239,6 +283,139 @@ class GameObject:
         for child in self._children.copy().values():
             self.remove_child(child)
 
+        for group in tuple(self._groups):
+            group.discard(self)
+        self._pool = None
+
+    def reset(self, **overrides) -> None:
+        """Restores the object, and its children, to the state it was created with so an
+        ObjectPool can hand it out again.
+
+        Only cheap engine state is restored: the local transform, visibility and the
+        process flags. Subclasses that keep other state per use override this and call
+        super().reset(**overrides).
+
+        Args:
+            **overrides: Values to use instead of the ones the object was created with,
+                e.g. pos, rotation or visible.
+        """
+        kwargs = self._kwargs
+        self._do_kill = False
+        self._game_process = overrides.get("game_process", kwargs.get("game_process", True))
+        self._pause_process = overrides.get("pause_process", kwargs.get("pause_process", False))
+        self._visible = overrides.get("visible", kwargs.get("visible", True))
+        self._pos.update(overrides.get("pos", kwargs.get("pos", (0, 0))))
+        self._rotation = overrides.get("rotation", kwargs.get("rotation", 0))
+        for child in self._children.values():
+            child.reset()
+        self._set_transform_dirty()
+
+    def add_tag(self, tag: str) -> None:
+        """Tags the object so the scene can find it with Scene.tagged.
+
+        Args:
+            tag (str): The tag to add.
+        """
+        if tag not in self._tags:
+            self._tags.add(tag)
+            self._kwargs["tags"] = sorted(self._tags)
+            if self._loaded:
+                Globals.scene.tag_changed(self, tag)
+
+    def remove_tag(self, tag: str) -> None:
+        """Removes a tag from the object.
+
+        Args:
+            tag (str): The tag to remove.
+        """
+        if tag in self._tags:
+            self._tags.discard(tag)
+            self._kwargs["tags"] = sorted(self._tags)
+            if self._loaded:
+                Globals.scene.tag_changed(self, tag)
+
+    def has_tag(self, tag: str) -> bool:
+        """Checks whether the object carries a tag.
+
+        Args:
+            tag (str): The tag to check.
+
+        Returns:
+            bool: True if the object is tagged with it.
+        """
+        return tag in self._tags
+
+    def add_group(self, group: "Group") -> None:
+        """Adds the object to a group.
+
+        Args:
+            group (Group): The group to join.
+        """
+        if group not in self._groups:
+            group.add(self)
+
+    def remove_group(self, group: "Group") -> None:
+        """Removes the object from a group.
+
+        Args:
+            group (Group): The group to leave.
+        """
+        group.discard(self)
+
+    @property
+    def name(self) -> str:
+        """str: The object's name, which the scene can look it up by."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+        if self.__dict__.get("_loaded"):
+            Globals.scene.rename_object(self)
+
+    @property
+    def tags(self) -> frozenset[str]:
+        """frozenset[str]: The tags the object carries."""
+        return frozenset(self._tags)
+
+    @property
+    def groups(self) -> frozenset["Group"]:
+        """frozenset[Group]: The groups the object is in, including the groups of its tags."""
+        return frozenset(self._groups)
+
+    @property
+    def game_process(self) -> bool:
+        """bool: Whether the object and its children update every frame."""
+        return self._game_process
+
+    @game_process.setter
+    def game_process(self, game_process: bool) -> None:
+        self._game_process = game_process
+        if self._loaded:
+            Globals.scene.mark_dispatch_dirty(self)
+
+    @property
+    def pause_process(self) -> bool:
+        """bool: Whether the object and its children keep updating while the scene is paused."""
+        return self._pause_process
+
+    @pause_process.setter
+    def pause_process(self, pause_process: bool) -> None:
+        self._pause_process = pause_process
+        if self._loaded:
+            Globals.scene.mark_dispatch_dirty(self)
+
+    @property
+    def do_kill(self) -> bool:
+        """bool: Whether the object is destroyed at the end of the frame."""
+        return self._do_kill
+
+    @do_kill.setter
+    def do_kill(self, do_kill: bool) -> None:
+        self._do_kill = do_kill
+        if do_kill and self._loaded:
+            Globals.scene.mark_killed(self)
+
     @property
     def root(self) -> "GameObject":
         """Returns the root of the object's children tree.
@@ -502,6 +679,8 @@ class GameObject:
             props[name] = value
             return
         super().__setattr__(name, value)
+        if name in _DISPATCH_HOOKS and self.__dict__.get("_loaded"):
+            Globals.scene.mark_dispatch_dirty(self)
 
     def __getattr__(self, name: str) -> Any:
         """Returns the attribute value, checking properties if necessary.
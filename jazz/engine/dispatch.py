@@ -0,0 +1,180 @@
+from typing import Any, Callable
+
+from .base_object import GameObject
+
+# Hooks of each phase: the recursive engine method, the engine hook and the user hook
+UPDATE = ("_update", "_engine_update", "update")
+LATE_UPDATE = ("_late_update", "_engine_late_update", "late_update")
+FIXED_UPDATE = ("_fixed_update", None, "fixed_update")
+PHASES = (UPDATE, LATE_UPDATE, FIXED_UPDATE)
+
+
+def _overrides(obj: GameObject, name: str) -> bool:
+    """Checks whether an object replaces a GameObject hook, on its class or on itself.
+
+    Args:
+        obj (GameObject): The object to check.
+        name (str): Name of the hook.
+
+    Returns:
+        bool: True if calling the hook can do anything.
+    """
+    return name in obj.__dict__ or getattr(type(obj), name) is not getattr(GameObject, name)
+
+
+def _collect(obj: Any, phase: tuple[str, str | None, str], calls: list[Callable[[float], None]]) -> None:
+    """Appends the hooks one phase has to call for an object and its children.
+
+    Children come before their parent and a parent's engine hook before its user hook,
+    the order the recursive engine methods run them in. Objects that replace the
+    recursive method itself, and objects that are not GameObjects, are called through
+    it as a whole.
+
+    Args:
+        obj (Any): The object to collect hooks from.
+        phase (tuple[str, str | None, str]): The hooks of the phase.
+        calls (list[Callable[[float], None]]): The list to append to.
+    """
+    recursive, engine, user = phase
+    if not isinstance(obj, GameObject):
+        method = getattr(obj, recursive, None)
+        if method is not None:
+            calls.append(method)
+        return
+    if _overrides(obj, recursive):
+        calls.append(getattr(obj, recursive))
+        return
+    for child in obj._children.values():
+        _collect(child, phase, calls)
+    if engine is not None and _overrides(obj, engine):
+        calls.append(getattr(obj, engine))
+    if _overrides(obj, user):
+        calls.append(getattr(obj, user))
+
+
+class UpdateDispatch:
+    """Keeps flat lists of the per-frame hooks that a scene's objects actually override.
+
+    Every top-level object of the scene is flattened into the hooks its tree has to
+    call in each phase. Objects that override nothing, and whole trees without work,
+    are left out, so a frame only touches objects that do something. Separate lists
+    hold the objects that run while the scene is paused. Trees are only flattened
+    again after they were marked dirty by a change to their children, hooks or
+    game_process and pause_process flags, and the lists keep the order in which the
+    objects were added to the scene.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty UpdateDispatch."""
+        self._order: dict[Any, int] = {}
+        self._next = 0
+        self._dirty: dict[Any, None] = {}
+        # (phase, paused) -> {root: calls}
+        self._lists: dict[tuple[tuple, bool], dict[Any, tuple[Callable[[float], None], ...]]] = {
+            (phase, paused): {} for phase in PHASES for paused in (False, True)
+        }
+        self._unsorted: set[tuple[tuple, bool]] = set()
+        self._kills: dict[Any, None] = {}
+
+    def __repr__(self) -> str:
+        return f"\nUpdateDispatch: {len(self._order)} objects, {len(self._lists[(UPDATE, False)])} updating"
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, obj: Any) -> None:
+        """Starts dispatching a top-level object of the scene.
+
+        Args:
+            obj (Any): The object that was added to the scene.
+        """
+        self._order[obj] = self._next
+        self._next += 1
+        self._dirty[obj] = None
+        if getattr(obj, "do_kill", False):
+            self._kills[obj] = None
+
+    def remove(self, obj: Any) -> None:
+        """Stops dispatching a top-level object.
+
+        Args:
+            obj (Any): The object that left the scene.
+        """
+        if self._order.pop(obj, None) is None:
+            return
+        self._dirty.pop(obj, None)
+        self._kills.pop(obj, None)
+        for entries in self._lists.values():
+            entries.pop(obj, None)
+
+    def mark_dirty(self, obj: Any) -> None:
+        """Queues the tree an object belongs to for flattening before the next phase runs.
+
+        Args:
+            obj (Any): An object whose children, hooks or flags changed.
+        """
+        root = obj.root if isinstance(obj, GameObject) else obj
+        if root in self._order:
+            self._dirty[root] = None
+
+    def queue_kill(self, obj: Any) -> None:
+        """Queues a top-level object that set do_kill for removal at the end of the frame.
+
+        Args:
+            obj (Any): The object to kill.
+        """
+        if obj in self._order:
+            self._kills[obj] = None
+
+    def take_kills(self) -> list[Any]:
+        """Takes the objects queued with queue_kill.
+
+        Returns:
+            list[Any]: The objects to kill.
+        """
+        kills = list(self._kills)
+        self._kills.clear()
+        return kills
+
+    def calls(self, phase: tuple[str, str | None, str], paused: bool) -> list[tuple[Any, tuple[Callable[[float], None], ...]]]:
+        """Gets the objects with work in a phase together with the hooks to call.
+
+        Args:
+            phase (tuple[str, str | None, str]): UPDATE, LATE_UPDATE or FIXED_UPDATE.
+            paused (bool): Whether the scene is paused, keeping only pause_process objects.
+
+        Returns:
+            list[tuple[Any, tuple[Callable[[float], None], ...]]]: Each top-level object
+                and its hooks, in the order the objects were added. The list is a copy,
+                so objects may be added or removed while it is walked.
+        """
+        if self._dirty:
+            self._flatten()
+        key = (phase, paused)
+        entries = self._lists[key]
+        if key in self._unsorted:
+            order = self._order
+            self._lists[key] = entries = dict(sorted(entries.items(), key=lambda item: order[item[0]]))
+            self._unsorted.discard(key)
+        return list(entries.items())
+
+    def _flatten(self) -> None:
+        """Flattens every dirty tree and moves it into the lists it belongs to."""
+        order = self._order
+        for root in self._dirty:
+            game_process = getattr(root, "game_process", True)
+            pause_process = getattr(root, "pause_process", False)
+            for phase in PHASES:
+                calls: list[Callable[[float], None]] = []
+                if game_process:
+                    _collect(root, phase, calls)
+                for paused in (False, True):
+                    key = (phase, paused)
+                    entries = self._lists[key]
+                    if calls and (pause_process or not paused):
+                        if root not in entries and entries and order[next(reversed(entries))] > order[root]:
+                            self._unsorted.add(key)
+                        entries[root] = tuple(calls)
+                    else:
+                        entries.pop(root, None)
+        self._dirty.clear()
@@ -1,42 +1,52 @@
-from typing import Iterator
+from typing import Iterable, Iterator
 from .base_object import GameObject
 
 
-# TODO Rework "Group" into some other tag type system
-
 class Group:
-    """A container for Entities that allows for checking of collisions and other methods"""
+    """A set of GameObjects with constant time membership checks, adding and removing.
+
+    Objects keep track of the groups they are in through GameObject.groups and leave
+    them when they are killed. Iteration follows the order objects were added in.
+    """
 
-    def __init__(self, initial_items: list[GameObject] | None = None, name: str = "group") -> None:
+    def __init__(self, initial_items: Iterable[GameObject] | None = None, name: str = "group") -> None:
         """Initializes the Group container.
 
         Args:
-            initial_items (list[GameObject], optional): Initial list of game objects to populate the group with.
+            initial_items (Iterable[GameObject], optional): Initial game objects to populate the group with.
             name (str, optional): The name of the group. Defaults to "group".
         """
         self.name = name
-        self._entities = []
+        self._entities: dict[GameObject, None] = {}
+        # Members in insertion order for indexing, rebuilt after the group changes
+        self._ordered: tuple[GameObject, ...] | None = None
         if initial_items:
             self.add_entities(initial_items)
 
+    def __repr__(self) -> str:
+        return f"\nGroup {self.name}: {len(self._entities)} objects"
+
     def __len__(self) -> int:
         return len(self._entities)
 
     def __iter__(self) -> Iterator[GameObject]:
-        return iter(self._entities)
+        # Iterate over a snapshot so members may leave the group while it is walked
+        return iter(self._members())
 
     def __getitem__(self, i: int) -> GameObject:
-        return self._entities[i]
-
-    def __setitem__(self, i: int, val: GameObject) -> None:
-        self._entities[i] = val
+        return self._members()[i]
 
     def __delitem__(self, i: int) -> None:
-        self.remove(self._entities[i])
+        self.remove(self[i])
 
     def __contains__(self, key: GameObject) -> bool:
         return key in self._entities
 
+    def _members(self) -> tuple[GameObject, ...]:
+        if self._ordered is None:
+            self._ordered = tuple(self._entities)
+        return self._ordered
+
     def add(self, entity: GameObject) -> None:
         """
         Add an Entity to the group and ensure that the group is referenced
@@ -48,9 +58,9 @@ class Group:
         if not isinstance(entity, GameObject):
             raise ValueError("Only Entity objects may be added to an EntityGroup")
         if entity not in self._entities:
-            self._entities.append(entity)
-            if self not in entity.groups:
-                entity.add_group(self)
+            self._entities[entity] = None
+            self._ordered = None
+            entity._groups.add(self)
         else:
             print("Entity already in group")
 
@@ -65,11 +75,26 @@ class Group:
         if entity not in self._entities:
             print("Entity not in group")
         else:
-            if self in entity.groups:
-                entity.remove_group(self)
-            self._entities.remove(entity)
+            self.discard(entity)
+
+    def discard(self, entity: GameObject) -> None:
+        """Removes an entity from the group if it is a member.
 
-    def add_entities(self, entities: list[GameObject]) -> None:
+        Args:
+            entity (GameObject): The entity to remove.
+        """
+        if self._entities.pop(entity, 0) is None:
+            self._ordered = None
+            entity._groups.discard(self)
+
+    def clear(self) -> None:
+        """Removes every entity from the group."""
+        for entity in self._entities:
+            entity._groups.discard(self)
+        self._entities.clear()
+        self._ordered = None
+
+    def add_entities(self, entities: Iterable[GameObject]) -> None:
         """
         Iterates through a list of Entities and adds them to the group.
 
@@ -0,0 +1,122 @@
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from ..global_dict import Globals
+from ..utils import JazzException
+from .base_object import GameObject
+
+if TYPE_CHECKING:
+    from .scene import Scene
+
+T = TypeVar("T", bound=GameObject)
+
+
+class ObjectPool(Generic[T]):
+    """Reuses objects of one class instead of creating and destroying them.
+
+    Released objects are taken out of the scene without being destroyed. They keep
+    their id, children, colliders and textures, and are skipped by updates, drawing and
+    physics. acquire hands a released object back through its cheap reset path, and
+    only constructs and loads a new one when none is free. Objects of a pool that call
+    queue_kill or set do_kill are released at the end of the frame instead of being
+    killed, so existing spawn and despawn code recycles them without changes.
+    """
+
+    def __init__(self, prototype_cls: type[T], scene: "Scene | None" = None, **defaults) -> None:
+        """Initializes the ObjectPool.
+
+        Args:
+            prototype_cls (type[T]): The class of the pooled objects.
+            scene (Scene, optional): The scene objects are spawned into. Defaults to the
+                active scene at the time of each call.
+            **defaults: Constructor arguments for new objects.
+        """
+        self.prototype_cls = prototype_cls
+        self.defaults = defaults
+        self._scene = scene
+        # Free objects, each with the drawables it had registered, or None if never loaded
+        self._free: list[tuple[T, list[Any] | None]] = []
+        self._free_set: set[T] = set()
+        self.created = 0
+
+    def __repr__(self) -> str:
+        return f"\nObjectPool of {self.prototype_cls.__name__}: {len(self._free)} free, {self.created} created"
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @property
+    def scene(self) -> "Scene":
+        """Scene: The scene objects are spawned into."""
+        return self._scene if self._scene is not None else Globals.scene
+
+    def prewarm(self, count: int) -> None:
+        """Creates free objects up front so later spawns never construct any.
+
+        Args:
+            count (int): Number of objects to create.
+        """
+        for _ in range(count):
+            obj = self._create()
+            self._free.append((obj, None))
+            self._free_set.add(obj)
+
+    def acquire(self, **overrides) -> T:
+        """Adds an object to the scene, reusing a released one when possible.
+
+        Args:
+            **overrides: Values passed to the object's reset, e.g. pos or rotation.
+
+        Returns:
+            T: The object, now in the scene.
+        """
+        scene = self.scene
+        if self._free:
+            obj, drawables = self._free.pop()
+            self._free_set.discard(obj)
+            obj.reset(**overrides)
+            if drawables is None:
+                scene.add_object(obj)
+            else:
+                scene.attach_object(obj, drawables)
+            return obj
+        obj = self._create()
+        if overrides:
+            obj.reset(**overrides)
+        scene.add_object(obj)
+        return obj
+
+    def release(self, obj: T) -> None:
+        """Takes an object out of the scene and keeps it for the next acquire.
+
+        Args:
+            obj (T): An object acquired from this pool.
+
+        Raises:
+            JazzException: If the object does not belong to this pool.
+        """
+        if obj._pool is not self:
+            raise JazzException(f"{obj.id}:{obj.name} does not belong to this pool")
+        if obj in self._free_set:
+            return
+        drawables = self.scene.detach_object(obj)
+        self._free.append((obj, drawables))
+        self._free_set.add(obj)
+
+    def clear(self) -> None:
+        """Destroys every free object, purging their textures."""
+        for obj, _ in self._free:
+            obj._pool = None
+            obj.kill()
+        self._free.clear()
+        self._free_set.clear()
+
+    def _create(self) -> T:
+        """Constructs a new object of the pool.
+
+        Returns:
+            T: The object, not yet in the scene.
+        """
+        obj = self.prototype_cls(**self.defaults)
+        obj._pool = self
+        self.created += 1
+        return obj
@@ -0,0 +1,222 @@
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ..global_dict import Globals
+from ..utils import JazzException
+from .serializer import Serializer
+
+if TYPE_CHECKING:
+    from .base_object import GameObject
+
+
+def _fresh(value: Any) -> Any:
+    """Copies the lists and dicts of a value so instances never share them.
+
+    Args:
+        value (Any): A JSON-like value.
+
+    Returns:
+        Any: The copied value.
+    """
+    if isinstance(value, list):
+        return [_fresh(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _fresh(item) for key, item in value.items()}
+    return value
+
+
+class _Node:
+    """One object of a prefab tree with everything needed to build it resolved."""
+
+    __slots__ = ("cls", "options", "mutable", "scripts", "children", "name_kwarg")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Compiles a serialized object dictionary.
+
+        Args:
+            data (dict[str, Any]): Payload in the format of Serializer.serialize_object.
+        """
+        self.cls = Serializer.get_class(data.get("Class", "GameObject"))
+        options = dict(data.get("options", {}))
+        scripts = data.get("scripts", options.pop("scripts", None))
+        options.setdefault("name", "Object")
+        self.options = options
+        # Keys whose values have to be copied for every instance
+        self.mutable = tuple(key for key, value in options.items() if isinstance(value, (list, dict)))
+        self.scripts: list[tuple[str, str, Callable[..., Any]]] = []
+        if isinstance(scripts, dict):
+            for hook, path in scripts.items():
+                if isinstance(path, str):
+                    self.scripts.append((hook, path, Serializer.resolve_script(path)))
+        self.children = [_Node(child) for child in data.get("children", [])]
+        # Whether the class accepts name as a constructor argument, found on first build
+        self.name_kwarg: bool | None = None
+
+    def build(self, overrides: dict[str, Any] | None = None) -> Any:
+        """Constructs a new object tree from the node.
+
+        Args:
+            overrides (dict[str, Any], optional): Constructor arguments replacing the
+                prefab's own for this object only.
+
+        Returns:
+            Any: The new object.
+        """
+        kwargs = dict(self.options)
+        for key in self.mutable:
+            kwargs[key] = _fresh(kwargs[key])
+        if overrides:
+            kwargs.update(overrides)
+        obj = self._construct(kwargs)
+        for hook, path, func in self.scripts:
+            if hasattr(obj, "_scripts"):
+                obj._scripts[hook] = path
+            setattr(obj, hook, func)
+        for child in self.children:
+            obj.add_child(child.build())
+        return obj
+
+    def _construct(self, kwargs: dict[str, Any]) -> Any:
+        if self.name_kwarg is None:
+            try:
+                obj = self.cls(**kwargs)
+                self.name_kwarg = True
+                return obj
+            except TypeError:
+                self.name_kwarg = False
+        if self.name_kwarg:
+            return self.cls(**kwargs)
+        name = kwargs.pop("name")
+        obj = self.cls(**kwargs)
+        if hasattr(obj, "name"):
+            obj.name = name
+        return obj
+
+
+class Prefab:
+    """A reusable object template that is parsed once and instantiated many times.
+
+    The payload uses the format of Serializer.serialize_object. Classes and scripts are
+    resolved when the prefab is created, and each node keeps its constructor arguments
+    ready, so instantiating skips the JSON parsing, registry lookups and script imports
+    that Serializer.deserialize_object repeats for every object.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initializes the Prefab.
+
+        Args:
+            data (dict[str, Any]): Serialized object payload of the template's root.
+
+        Raises:
+            JazzException: If a class or script of the template cannot be resolved.
+        """
+        self.data = data
+        self._root = _Node(data)
+
+    def __repr__(self) -> str:
+        return f"\nPrefab of {self._root.cls.__name__}: {self._root.options.get('name')}"
+
+    @property
+    def prototype_cls(self) -> type:
+        """type: The class of the template's root object."""
+        return self._root.cls
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Prefab":
+        """Creates a prefab from a serialized object dictionary.
+
+        Args:
+            data (dict[str, Any]): Serialized object payload.
+
+        Returns:
+            Prefab: The compiled prefab.
+        """
+        return cls(data)
+
+    @classmethod
+    def from_json(cls, filepath_or_json: str) -> "Prefab":
+        """Creates a prefab from a JSON file path or a raw JSON string.
+
+        Args:
+            filepath_or_json (str): File path to a .json object document or raw JSON string.
+
+        Returns:
+            Prefab: The compiled prefab.
+
+        Raises:
+            JazzException: If file loading or JSON parsing fails.
+        """
+        if os.path.exists(filepath_or_json):
+            with open(filepath_or_json, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            try:
+                data = json.loads(filepath_or_json)
+            except Exception as e:
+                raise JazzException(f"Failed to parse prefab JSON string or find JSON file '{filepath_or_json}': {e}") from e
+        return cls(data)
+
+    @classmethod
+    def from_object(cls, obj: "GameObject") -> "Prefab":
+        """Creates a prefab from an existing object and its children.
+
+        Args:
+            obj (GameObject): The object to use as the template.
+
+        Returns:
+            Prefab: The compiled prefab.
+        """
+        return cls(Serializer.serialize_object(obj))
+
+    def instantiate(
+        self, n: int | None = None, positions: Iterable[Any] | None = None, **overrides
+    ) -> "GameObject | list[GameObject]":
+        """Builds new object trees from the template. The objects are not added to a scene.
+
+        Args:
+            n (int, optional): Number of objects to build. Defaults to the number of
+                positions, or a single object if neither is given.
+            positions (Iterable, optional): Position of each root object. When shorter
+                than n, the remaining objects keep the prefab's position.
+            **overrides: Constructor arguments replacing the prefab's own on every root.
+
+        Returns:
+            GameObject | list[GameObject]: The object when called without n and positions,
+                otherwise the list of objects.
+        """
+        root = self._root
+        if n is None and positions is None:
+            return root.build(overrides)
+        positions = list(positions) if positions is not None else []
+        if n is None:
+            n = len(positions)
+        objects = []
+        for i in range(n):
+            if i < len(positions):
+                objects.append(root.build({**overrides, "pos": positions[i]}))
+            else:
+                objects.append(root.build(overrides))
+        return objects
+
+
+def _handle_prefab(data: dict[str, Any]) -> Any:
+    """Resource handler function for prefab resource declarations.
+
+    Args:
+        data (dict[str, Any]): Prefab resource configuration dictionary, with either
+            a "path" to a JSON file or an inline "object" payload.
+
+    Returns:
+        Any: The registered Prefab.
+    """
+    path = data.get("path")
+    prefab = Prefab.from_json(path) if path else Prefab(data.get("object", {}))
+    res_id = data.get("id", path)
+    if Globals.resource is not None:
+        return Globals.resource.add_resource("prefab", res_id, prefab)
+    return prefab
+
+
+Serializer.register_resource_handler("prefab", _handle_prefab)
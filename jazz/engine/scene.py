@@ -7,12 +7,15 @@ from typing import TYPE_CHECKING, Callable, Any, Iterable, Type, Iterator, TypeV
 from dataclasses import dataclass
 
 from ..camera import Camera
+from .dispatch import FIXED_UPDATE, LATE_UPDATE, UPDATE, UpdateDispatch
+from .object_pool import ObjectPool
+from .prefab import Prefab
+from .scene_index import SceneIndex
 from ..global_dict import Globals
-from ..physics import Ray, PhysicsGrid
+from ..physics import PhysicsGrid, PhysicsWorld
 from ..animation import Timer
 from ..utils import (
     dist_to,
-    direction_to,
     SPRITE_SHEET,
     SURFACE,
     TEXTURE,
@@ -24,8 +27,17 @@ from ..utils import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .base_object import GameObject
+    from .group import Group
     from ..physics._physics_object import PhysicsObject
+    from ..physics.area_tracker import AreaTracker
+    from ..physics.batch_raycast import RaycastHits
+    from ..physics.colliders import Collider
+    from ..physics.islands import IslandGraph
+    from ..physics.pair_cache import PairCache
+    from ..physics.solver import ContactSolver
     from ..components import Sprite
 
 
@@ -36,12 +48,21 @@ class Scene:
     """The class that encapsulates a game scene in Jazz Engine."""
 
     name = "unnamed"
+    physics_layers: int = 32
+    broadphase: type = PhysicsGrid
+    layer_broadphase: dict[int, type] = {}
+    static_broadphase: type = PhysicsGrid
+    narrowphase_workers: int | None = 1
 
     def __init__(self) -> None:
         """Initializes the Scene instance.
 
         Sets up the default Camera, collections for objects, sprites, timers,
-        and allocates a default 4-layer physics partitioning grid.
+        and a PhysicsWorld with physics_layers layers that indexes every layer in
+        one shared index of the class's broadphase type. Layers listed in
+        layer_broadphase get their own index of the given type, and static bodies
+        are kept in a separate static_broadphase index. Large narrowphase batches are
+        split across narrowphase_workers threads when the interpreter has no GIL.
         """
         self.camera = Camera()
         self._objects: dict[str, "GameObject"] = {}
@@ -49,14 +70,21 @@ class Scene:
         self._sprites_set: set["Sprite"] = set()
         self._sprites_dirty: bool = False
         self._moved_objects: set[Any] = set()
+        self._physics_moved: set[Any] = set()
         self._timers: list[Timer] = []
-        #TODO: Wrap Scene physics methods and properties into a dynamic PhysicsWorld class
-        self._physics_world = {
-            0: PhysicsGrid(),
-            1: PhysicsGrid(),
-            2: PhysicsGrid(),
-            3: PhysicsGrid(),
-        }
+        self._dispatch = UpdateDispatch()
+        self._index = SceneIndex()
+        self._physics_world = PhysicsWorld(
+            self.physics_layers,
+            self.broadphase,
+            self.static_broadphase,
+            self.layer_broadphase,
+            self.narrowphase_workers,
+        )
+
+        # Set by the Application when it runs a fixed timestep
+        self._fixed_delta: float | None = None
+        self._interpolation: float | None = None
 
         self._debug = False
         self.running = True
@@ -98,6 +126,19 @@ class Scene:
             delta (float): Time since last frame
         """
 
+    def fixed_update(self, delta: float) -> None:
+        """Base method that can be overwritten. Called once per physics tick when the
+        application runs with a fixed timestep, after every object's fixed_update.
+
+        Args:
+            delta (float): The fixed tick length in seconds.
+        """
+
+    @property
+    def fixed_delta(self) -> float | None:
+        """float | None: The fixed tick length when the application runs a fixed timestep, None otherwise."""
+        return self._fixed_delta
+
     def mark_moved(self, obj: Any) -> None:
         """Registers an object whose transform changed during the current frame.
 
@@ -106,6 +147,106 @@ class Scene:
         """
         self._moved_objects.add(obj)
 
+    def mark_dispatch_dirty(self, obj: "GameObject") -> None:
+        """Marks an object's tree to be re-checked for update hooks before the next phase,
+        after its children, hooks or process flags changed.
+
+        Args:
+            obj (GameObject): The object that changed.
+        """
+        self._dispatch.mark_dirty(obj)
+
+    def child_added(self, parent: "GameObject", child: "GameObject") -> None:
+        """Registers a child added to an object that is already in the scene.
+
+        Args:
+            parent (GameObject): The object the child was added to.
+            child (GameObject): The new child.
+        """
+        self._dispatch.mark_dirty(parent)
+        if parent in self._index:
+            self._index.add(child)
+
+    def child_removed(self, parent: "GameObject", child: "GameObject") -> None:
+        """Unregisters a child removed from an object that is in the scene.
+
+        Args:
+            parent (GameObject): The object the child was removed from.
+            child (GameObject): The removed child.
+        """
+        self._dispatch.mark_dirty(parent)
+        self._index.remove(child)
+
+    def rename_object(self, obj: "GameObject") -> None:
+        """Updates the name index after an object was renamed.
+
+        Args:
+            obj (GameObject): The renamed object.
+        """
+        self._index.rename(obj)
+
+    def tag_changed(self, obj: "GameObject", tag: str) -> None:
+        """Updates the tag index after a tag was added to or removed from an object.
+
+        Args:
+            obj (GameObject): The object whose tags changed.
+            tag (str): The tag that was added or removed.
+        """
+        if obj.has_tag(tag):
+            self._index.tag(obj, tag)
+        else:
+            self._index.untag(obj, tag)
+
+    def find_by_name(self, name: str) -> "GameObject | None":
+        """Finds an object in the scene, at any depth, by name.
+
+        Args:
+            name (str): The name to look up.
+
+        Returns:
+            GameObject | None: The first object added with that name, or None.
+        """
+        return self._index.find_by_name(name)
+
+    def find_all(self, cls: type[T]) -> list[T]:
+        """Finds every object in the scene, at any depth, that is an instance of a class.
+
+        Args:
+            cls (type[T]): The class to look up, subclasses included.
+
+        Returns:
+            list[T]: The matching objects.
+        """
+        return self._index.find_all(cls)
+
+    def tagged(self, tag: str) -> "Group":
+        """Gets the objects in the scene, at any depth, that carry a tag.
+
+        Args:
+            tag (str): The tag to look up.
+
+        Returns:
+            Group: A live group that follows objects gaining and losing the tag. It
+                can be kept, e.g. as an Area's target_group.
+        """
+        return self._index.tagged(tag)
+
+    def mark_killed(self, obj: "GameObject") -> None:
+        """Queues an object that set do_kill for removal at the end of the frame.
+
+        Args:
+            obj (GameObject): The object to remove.
+        """
+        self._dispatch.queue_kill(obj)
+
+    def mark_static_moved(self, obj: "PhysicsObject") -> None:
+        """Invalidates the static index entry of a static body that was explicitly moved.
+
+        Args:
+            obj (PhysicsObject): The static body that moved.
+        """
+        self._physics_world.mark_static_moved(obj)
+
     def _sync_sprites(self) -> None:
         """Filters removed sprites and sorts active sprites by Z-index if dirty."""
         if self._sprites_dirty:
@@ -177,12 +318,12 @@ class Scene:
 
         Args:
             collider (PhysicsObject): The physics object/collider to check against.
-            layer (int, optional): The physics grid layer index. Defaults to 0.
+            layer (int, optional): The layer number, layer n is bit 1 << n of a layer mask. Defaults to 0.
 
         Returns:
             list[PhysicsObject]: A list of physics objects overlapping the query collider's bounds.
         """
-        return self._physics_world[layer].get_AABB_collisions(collider)
+        return self._physics_world.get_layer_collisions(collider, layer)
 
     def add_object(self, obj: T) -> T:
         """Adds an object to the scene.
@@ -199,24 +340,111 @@ class Scene:
         if obj.id not in self._objects:
             obj._on_load()
             self._objects[obj.id] = obj
+            self._dispatch.add(obj)
+            self._index.add(obj)
             return obj
         else:
             raise JazzException(f"{obj.id}:{obj.name} already in the scene")
 
-    # TODO clean this up
+    def create_pool(self, prototype_cls: type[T], **defaults) -> "ObjectPool[T]":
+        """Creates a pool that recycles objects of a class in this scene.
+
+        Args:
+            prototype_cls (type[T]): The class of the pooled objects.
+            **defaults: Constructor arguments for new objects.
+
+        Returns:
+            ObjectPool[T]: The pool.
+        """
+        return ObjectPool(prototype_cls, self, **defaults)
+
+    def spawn_many(
+        self, prefab: Prefab, n: int | None = None, positions: Iterable[Any] | None = None, **overrides
+    ) -> list["GameObject"]:
+        """Instantiates a prefab several times and adds every instance to the scene.
+
+        Args:
+            prefab (Prefab): The template to instantiate.
+            n (int, optional): Number of instances. Defaults to the number of positions, or 1.
+            positions (Iterable, optional): Position of each instance.
+            **overrides: Constructor arguments replacing the prefab's own on every instance.
+
+        Returns:
+            list[GameObject]: The new objects, in the scene.
+        """
+        if n is None and positions is None:
+            n = 1
+        objects = prefab.instantiate(n, positions, **overrides)
+        for obj in objects:
+            self.add_object(obj)
+        return objects
+
+    def detach_object(self, obj: "GameObject") -> list[Any]:
+        """Takes a top-level object out of the scene without destroying it. Its children,
+        colliders and textures are kept, and it is no longer updated, drawn or collided with.
+
+        Args:
+            obj (GameObject): The object to take out.
+
+        Returns:
+            list[Any]: The objects of its tree that were in the draw list, for attach_object.
+        """
+        from ..physics._physics_object import PhysicsObject
+
+        drawables = []
+        if obj.id not in self._objects:
+            return drawables
+        self._objects.pop(obj.id)
+        self._dispatch.remove(obj)
+        self._index.remove(obj)
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            if node in self._sprites_set:
+                self.remove_sprite(node)
+                drawables.append(node)
+            if isinstance(node, PhysicsObject):
+                self.remove_physics_object(node)
+            stack.extend(node._children.values())
+        return drawables
+
+    def attach_object(self, obj: "GameObject", drawables: Iterable[Any] = ()) -> None:
+        """Puts an object taken out with detach_object back into the scene. Unlike
+        add_object its on_load hooks do not run again.
+
+        Args:
+            obj (GameObject): The object to put back.
+            drawables (Iterable[Any], optional): The draw list entries detach_object returned. Defaults to none.
+
+        Raises:
+            JazzException: Raises an exception if the object is already in the scene.
+        """
+        from ..physics._physics_object import PhysicsObject
+
+        if obj.id in self._objects:
+            raise JazzException(f"{obj.id}:{obj.name} already in the scene")
+        self._objects[obj.id] = obj
+        self._dispatch.add(obj)
+        self._index.add(obj)
+        for drawable in drawables:
+            self.add_sprite(drawable)
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, PhysicsObject):
+                self.mark_moved(node)
+                self.add_physics_object(node, node._layers)
+            stack.extend(node._children.values())
+
     def add_physics_object(self, obj: "PhysicsObject", layers: str | int) -> None:
-        """Adds an object to the scene's physics layers
+        """Adds an object to the scene's physics layers. Static bodies go into
+        the static index, which is built once and not maintained per frame.
 
         Args:
             obj (PhysicsObject): The object to add to the scene
             layers (str | int): Layer mask
         """
-        if isinstance(layers, str):
-            layers = int(layers, 2)
-        num_layers = len(self._physics_world)
-        for layer in range(num_layers):
-            if (layers & (1 << (num_layers - 1 - layer))) != 0:
-                self._physics_world[layer].add_object(obj)
+        self._physics_world.add_object(obj, layers, getattr(obj, "static", False))
 
     def add_sprite(self, sprite: "Sprite") -> None:
         """Adds an object to the draw list.
@@ -237,6 +465,8 @@ class Scene:
         """
         if obj.id in self._objects:
             self._objects.pop(obj.id)
+            self._dispatch.remove(obj)
+            self._index.remove(obj)
             self._cleanup_object(obj)
 
     def _cleanup_object(self, obj: "GameObject") -> None:
@@ -264,8 +494,7 @@ class Scene:
         Args:
             obj (PhysicsObject): The object to remove
         """
-        for layer, grid in self._physics_world.items():
-            grid.remove_object(obj)
+        self._physics_world.remove_object(obj)
 
     def remove_sprite(self, sprite: "Sprite") -> None:
         """Removes an object from the draw list.
@@ -282,23 +511,65 @@ class Scene:
     ) -> list["GameObject"]:
         """Gets collisions from the scene using Axis Aligned Bounding Boxes.
 
+        Every layer in the object's collision_layers is queried in a single lookup,
+        and each colliding object is reported once. Static bodies only query the
+        dynamic index, so static-vs-static candidates are never produced.
+
         Args:
             physics_object (PhysicsObject): The object to check for collisions against
 
         Returns:
             list[GameObject]: The list of objects that collide
         """
-        collisions = []
-        layers = physics_object.collision_layers
-        if isinstance(layers, str):
-            layers = int(layers, 2)
-        num_layers = len(self._physics_world)
-        for layer in range(num_layers):
-            if (layers & (1 << (num_layers - 1 - layer))) != 0:
-                collisions += self._physics_world[layer].get_AABB_collisions(
-                    physics_object
-                )
-        return collisions
+        return self._physics_world.get_AABB_collisions(physics_object)
+
+    def get_swept_collisions(self, physics_object: "PhysicsObject", direction: Vec2) -> list["PhysicsObject"]:
+        """Gets the objects whose bounds overlap the area an object covers while moving.
+
+        Args:
+            physics_object (PhysicsObject): The moving object.
+            direction (Vec2): The displacement of the move.
+
+        Returns:
+            list[PhysicsObject]: The objects the move may hit.
+        """
+        return self._physics_world.get_swept_collisions(physics_object, direction)
+
+    def get_collision_pairs(self) -> list[tuple["PhysicsObject", "PhysicsObject"]]:
+        """Gets the candidate collision pairs found by the scene's broadphase this frame.
+
+        Only broadphases that produce pair lists, such as SweepAndPrune, contribute pairs.
+        Each pair of objects sharing a physics layer is reported once. Pairs between
+        dynamic objects and static bodies are included, static-vs-static pairs are not.
+
+        Returns:
+            list[tuple[PhysicsObject, PhysicsObject]]: Pairs of objects whose bounds overlap.
+        """
+        return self._physics_world.get_pairs()
+
+    def cell_snapshot(self, physics_object: "PhysicsObject") -> "list[tuple[object, set[str], int]] | None":
+        """Records the grid cells an object's bounds query depends on, for caching its result.
+
+        Args:
+            physics_object (PhysicsObject): The querying object.
+
+        Returns:
+            list[tuple[object, set[str], int]] | None: The snapshot, or None if the broadphase
+                does not track cell changes and results cannot be cached.
+        """
+        return self._physics_world.cell_snapshot(physics_object)
+
+    def cells_unchanged(self, snapshot: "list[tuple[object, set[str], int]]") -> bool:
+        """Checks that no object entered, left or moved in the cells of a snapshot,
+        including objects that moved earlier this frame.
+
+        Args:
+            snapshot (list[tuple[object, set[str], int]]): A result of cell_snapshot.
+
+        Returns:
+            bool: True if a cached query result is still valid.
+        """
+        return self._physics_world.cells_unchanged(snapshot, self._moved_objects)
 
     def physics_raycast(
         self,
@@ -316,13 +587,200 @@ class Scene:
             blacklist (list[PhysicsObject], optional): List of physics objects to ignore during queries. Defaults to None.
 
         Returns:
-            list[tuple]: List of hit tuples detailing collision points and distances.
+            tuple[GameObject | None, Vec2 | None]: The closest object hit and the hit point, or (None, None).
+        """
+        return self._physics_world.raycast(start, Vec2(end) - Vec2(start), dist_to(start, end), layers, blacklist)
+
+    def raycast(
+        self,
+        origin: Vec2,
+        direction: Vec2,
+        max_dist: float,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> "tuple[PhysicsObject | None, Vec2 | None]":
+        """Finds the first physics object along a ray without creating any objects.
+
+        Args:
+            origin (Vec2): Start of the ray.
+            direction (Vec2): Direction of the ray, it does not need to be normalized.
+            max_dist (float): Length of the ray.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects the ray passes through. Defaults to None.
+
+        Returns:
+            tuple[PhysicsObject | None, Vec2 | None]: The closest object hit and the hit point, or (None, None).
+        """
+        return self._physics_world.raycast(origin, direction, max_dist, mask, ignore)
+
+    def raycast_batch(
+        self,
+        origins: "np.ndarray",
+        directions: "np.ndarray",
+        lengths: "np.ndarray | float",
+        mask: str | int | None = None,
+    ) -> "RaycastHits":
+        """Casts many rays at once, for sensors and spreads that need dozens to thousands of rays.
+
+        Requires numpy. Candidates are gathered once for the area covered by every ray and
+        the intersections of all rays are computed with array operations.
+
+        Args:
+            origins (np.ndarray): (N, 2) ray origins, or a single origin shared by every ray.
+            directions (np.ndarray): (N, 2) ray directions, they do not need to be normalized.
+            lengths (np.ndarray | float): (N,) ray lengths, or one length for every ray.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+
+        Returns:
+            RaycastHits: Arrays of hit distances, points, normals and indices into its objects list.
+        """
+        return self._physics_world.raycast_batch(origins, directions, lengths, mask)
+
+    def overlap_shape(
+        self,
+        shape: "Collider",
+        pos: Vec2,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the physics objects a collider's shape would overlap at a position,
+        without moving the collider or its owner.
+
+        Args:
+            shape (Collider): The collider whose shape to test.
+            pos (Vec2): Where to place the shape.
+            rotation (float, optional): Rotation of the shape in degrees. Defaults to 0.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with the
+                penetration depth and the normal pointing from the shape to each object.
+        """
+        return self._physics_world.overlap_shape(shape, pos, rotation, mask, ignore)
+
+    def overlap_circle(
+        self,
+        pos: Vec2,
+        radius: float,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the physics objects overlapping a circle.
+
+        Args:
+            pos (Vec2): Center of the circle.
+            radius (float): Radius of the circle.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with their depth and normal.
+        """
+        return self._physics_world.overlap_circle(pos, radius, mask, ignore)
+
+    def overlap_rect(
+        self,
+        pos: Vec2,
+        w: float,
+        h: float,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the physics objects overlapping a rectangle.
+
+        Args:
+            pos (Vec2): Center of the rectangle.
+            w (float): Width of the rectangle.
+            h (float): Height of the rectangle.
+            rotation (float, optional): Rotation of the rectangle in degrees. Defaults to 0.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with their depth and normal.
+        """
+        return self._physics_world.overlap_rect(pos, w, h, rotation, mask, ignore)
+
+    def overlap_point(
+        self,
+        point: Vec2,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list["PhysicsObject"]:
+        """Finds the physics objects containing a point, such as the ones under the mouse.
+
+        Args:
+            point (Vec2): The point to test.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[PhysicsObject]: The objects whose shapes contain the point.
+        """
+        return self._physics_world.overlap_point(point, mask, ignore)
+
+    def shape_cast(
+        self,
+        shape: "Collider",
+        start: Vec2,
+        end: Vec2,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> "tuple[PhysicsObject | None, float, Vec2]":
+        """Sweeps a collider's shape between two positions and finds the first physics
+        object it touches, without moving the collider or its owner.
+
+        Args:
+            shape (Collider): The collider whose shape to sweep.
+            start (Vec2): Where the sweep starts.
+            end (Vec2): Where the sweep ends.
+            rotation (float, optional): Rotation of the shape in degrees. Defaults to 0.
+            mask (str | int, optional): Binary string or int mask of layers to check. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects the shape passes through. Defaults to None.
+
+        Returns:
+            tuple[PhysicsObject | None, float, Vec2]: The first object hit, the fraction of the
+                sweep before the contact and the contact normal, or (None, 1.0, Vec2()) if the path is clear.
         """
-        ray_cast = Ray(pos=start, length=dist_to(start, end), layers=layers)
-        ray_cast.facing = direction_to(start, end)
-        return ray_cast.cast(blacklist)
+        return self._physics_world.shape_cast(shape, start, end, rotation, mask, ignore)
 
     # Engine Methods
+    def _build_physics(self) -> None:
+        """Engine Method. Re-hashes only the objects that moved since the last build."""
+        physics_moved = self._physics_moved
+        physics_moved.update(self._moved_objects)
+        self._physics_world.build(physics_moved)
+        physics_moved.clear()
+
+    def _fixed_update(self, delta: float) -> None:
+        """Engine Method. Runs one fixed physics tick and records the transforms sprites
+            interpolate between.
+
+        Args:
+            delta (float): The fixed tick length in seconds.
+        """
+        sprites = self._sprites
+        for sprite in sprites:
+            sprite._begin_fixed_step()
+
+        self._build_physics()
+        for obj, calls in self._dispatch.calls(FIXED_UPDATE, self._paused):
+            if obj.do_kill:
+                continue
+            for call in calls:
+                call(delta)
+
+        # Resolve every contact reported during the tick
+        self._physics_world.solver.solve()
+        self.fixed_update(delta)
+
+        for sprite in sprites:
+            sprite._end_fixed_step()
+
     def _game_update(self, delta: float) -> None:
         """Engine Method. Updates the scene
             and deletes objects marked for deletion.
@@ -330,40 +788,36 @@ class Scene:
         Args:
             delta (float): Time in seconds since the last frame.
         """
-
-        for grid in self._physics_world.values():
-            grid.build_grid()
+        self._build_physics()
 
         kill_items = set()
-        objects = list(self._objects.values())
+        dispatch = self._dispatch
+        # Only objects that override an update hook are visited, see UpdateDispatch
+        updates = dispatch.calls(UPDATE, self._paused)
+        late_updates = dispatch.calls(LATE_UPDATE, self._paused)
 
-        for obj in objects:
-            if getattr(obj, "do_kill", False):
+        for obj, calls in updates:
+            if obj.do_kill:
                 kill_items.add(obj)
                 continue
-            if hasattr(obj, "_update"):
-                if obj.game_process:
-                    if self._paused:
-                        if obj.pause_process:
-                            obj._update(delta)
-                    else:
-                        obj._update(delta)
+            for call in calls:
+                call(delta)
+            if obj.do_kill:
+                kill_items.add(obj)
+
+        # Resolve every contact reported while the objects moved
+        self._physics_world.solver.solve()
 
         # call scene process hook
         self.update(delta)
 
         # late update
-        for obj in objects:
-            if getattr(obj, "do_kill", False):
+        for obj, calls in late_updates:
+            if obj.do_kill:
                 kill_items.add(obj)
                 continue
-            if hasattr(obj, "_late_update"):
-                if obj.game_process:
-                    if self._paused:
-                        if obj.pause_process:
-                            obj._late_update(delta)
-                    else:
-                        obj._late_update(delta)
+            for call in calls:
+                call(delta)
 
         self.late_update(delta)
 
@@ -372,13 +826,20 @@ class Scene:
             self.camera.update(delta)
 
         # delete objects queued for deletion
+        kill_items.update(dispatch.take_kills())
         for obj in kill_items:
-            obj.kill()
-
-        # Clear moved flags at the end of the frame directly from moved objects set
+            pool = getattr(obj, "_pool", None)
+            if pool is not None:
+                pool.release(obj)
+            else:
+                obj.kill()
+
+        # Clear moved flags at the end of the frame directly from moved objects set,
+        # keeping the objects around so the next grid build can re-hash them
         for obj in self._moved_objects:
             if hasattr(obj, "_moved_this_frame"):
                 obj._moved_this_frame = False
+        self._physics_moved.update(self._moved_objects)
         self._moved_objects.clear()
 
     # Properties and builtins
@@ -393,8 +854,8 @@ class Scene:
         """
         obj = self._objects.get(key, None)
         if obj is None:
-            for item in self._objects.values():
-                if item.name == key:
+            for item in self._index.named(key):
+                if item.id in self._objects:
                     return item
         return obj
 
@@ -414,6 +875,26 @@ class Scene:
         """Returns items obect of _objects attribute."""
         return self._objects.values()
 
+    @property
+    def areas(self) -> "AreaTracker":
+        """AreaTracker: Gets the tracker that notifies areas when objects enter or exit them."""
+        return self._physics_world.areas
+
+    @property
+    def islands(self) -> "IslandGraph":
+        """IslandGraph: Gets the contact graph used to sleep and wake groups of bodies."""
+        return self._physics_world.islands
+
+    @property
+    def pair_cache(self) -> "PairCache":
+        """PairCache: Gets the cache that carries narrowphase results between frames."""
+        return self._physics_world.pair_cache
+
+    @property
+    def contact_solver(self) -> "ContactSolver":
+        """ContactSolver: Gets the solver that resolves the contacts bodies report each frame."""
+        return self._physics_world.solver
+
     @property
     def camera_offset(self) -> Vec2:
         """Vec2: Gets the active Camera's viewport drawing offset."""
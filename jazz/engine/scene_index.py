@@ -0,0 +1,162 @@
+from typing import Any, Type, TypeVar
+
+from .group import Group
+
+T = TypeVar("T")
+
+
+class SceneIndex:
+    """Maps names, classes and tags to the objects of a scene, children included.
+
+    The index is updated when objects enter or leave the scene, are renamed or are
+    tagged, so lookups cost the same however many objects the scene holds. Every tag
+    has a live Group of the objects carrying it, which stays valid while objects
+    come and go and can be used as an Area's target_group.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty SceneIndex."""
+        # Object -> the name it is indexed under, also used as the membership test
+        self._names: dict[Any, Any] = {}
+        self._by_name: dict[Any, dict[Any, None]] = {}
+        self._by_class: dict[type, dict[Any, None]] = {}
+        self._by_tag: dict[str, Group] = {}
+
+    def __repr__(self) -> str:
+        return f"\nSceneIndex: {len(self._names)} objects, {len(self._by_tag)} tags"
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._names
+
+    def add(self, obj: Any) -> None:
+        """Indexes an object and all of its children.
+
+        Args:
+            obj (Any): The object that entered the scene.
+        """
+        if obj in self._names:
+            return
+        name = getattr(obj, "name", None)
+        self._names[obj] = name
+        self._by_name.setdefault(name, {})[obj] = None
+        self._by_class.setdefault(type(obj), {})[obj] = None
+        for tag in getattr(obj, "_tags", ()):
+            self.tag(obj, tag)
+        for child in getattr(obj, "_children", {}).values():
+            self.add(child)
+
+    def remove(self, obj: Any) -> None:
+        """Drops an object and all of its children from the index.
+
+        Args:
+            obj (Any): The object that left the scene.
+        """
+        if obj not in self._names:
+            return
+        name = self._names.pop(obj)
+        self._discard(self._by_name, name, obj)
+        self._discard(self._by_class, type(obj), obj)
+        for tag in getattr(obj, "_tags", ()):
+            group = self._by_tag.get(tag)
+            if group is not None:
+                group.discard(obj)
+        for child in getattr(obj, "_children", {}).values():
+            self.remove(child)
+
+    def rename(self, obj: Any) -> None:
+        """Moves an object to the bucket of its current name.
+
+        Args:
+            obj (Any): The renamed object.
+        """
+        if obj not in self._names:
+            return
+        self._discard(self._by_name, self._names[obj], obj)
+        name = obj.name
+        self._names[obj] = name
+        self._by_name.setdefault(name, {})[obj] = None
+
+    def tag(self, obj: Any, tag: str) -> None:
+        """Adds an indexed object to the group of a tag.
+
+        Args:
+            obj (Any): The tagged object.
+            tag (str): The tag.
+        """
+        if obj in self._names:
+            group = self.tagged(tag)
+            if obj not in group:
+                group.add(obj)
+
+    def untag(self, obj: Any, tag: str) -> None:
+        """Removes an object from the group of a tag.
+
+        Args:
+            obj (Any): The object that lost the tag.
+            tag (str): The tag.
+        """
+        group = self._by_tag.get(tag)
+        if group is not None:
+            group.discard(obj)
+
+    def named(self, name: str) -> list[Any]:
+        """Gets every indexed object with a name.
+
+        Args:
+            name (str): The name to look up.
+
+        Returns:
+            list[Any]: The objects, in the order they were indexed.
+        """
+        return list(self._by_name.get(name, ()))
+
+    def find_by_name(self, name: str) -> Any:
+        """Gets the first indexed object with a name.
+
+        Args:
+            name (str): The name to look up.
+
+        Returns:
+            Any: The object, or None if no object has the name.
+        """
+        return next(iter(self._by_name.get(name, ())), None)
+
+    def find_all(self, cls: Type[T]) -> list[T]:
+        """Gets every indexed instance of a class, subclasses included.
+
+        Args:
+            cls (Type[T]): The class to look up.
+
+        Returns:
+            list[T]: The instances, grouped by their exact class.
+        """
+        found = []
+        for obj_cls, objects in self._by_class.items():
+            if issubclass(obj_cls, cls):
+                found += objects
+        return found
+
+    def tagged(self, tag: str) -> Group:
+        """Gets the live group of objects carrying a tag.
+
+        Args:
+            tag (str): The tag to look up.
+
+        Returns:
+            Group: The group, created empty if no object carries the tag yet.
+        """
+        group = self._by_tag.get(tag)
+        if group is None:
+            group = self._by_tag[tag] = Group(name=tag)
+        return group
+
+    @staticmethod
+    def _discard(buckets: dict[Any, dict[Any, None]], key: Any, obj: Any) -> None:
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.pop(obj, None)
+            if not bucket:
+                del buckets[key]
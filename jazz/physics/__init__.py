@@ -1,6 +1,13 @@
 from ._physics_object import PhysicsObject
 from .area import Area
+from .batch_raycast import RaycastHits
 from .body import Body
-from .colliders import CircleCollider, Collider, PolyCollider, RayCollider, RectCollider
+from .colliders import CapsuleCollider, CircleCollider, Collider, PolyCollider, RayCollider, RectCollider
 from .physics import PhysicsGrid
+from .array_grid import ArrayPhysicsGrid
+from .aabb_tree import DynamicAABBTree
+from .hierarchical_grid import HierarchicalGrid
 from .ray import Ray
+from .sweep_and_prune import SweepAndPrune
+from .tilemap import TileCollider, merge_tiles, tile_bodies, tile_map_body
+from .world import PhysicsWorld
@@ -1,9 +1,9 @@
 from typing import Any
 
-from .colliders import CircleCollider, PolyCollider, RayCollider, RectCollider, Collider
+from .colliders import CapsuleCollider, CircleCollider, PolyCollider, RayCollider, RectCollider, Collider
 from ..engine.base_object import GameObject
 from ..global_dict import Globals
-from ..utils import COLLIDER_RECT, COLLIDER_POLY, COLLIDER_CIRCLE, COLLIDER_RAY, JazzException
+from ..utils import COLLIDER_RECT, COLLIDER_POLY, COLLIDER_CIRCLE, COLLIDER_RAY, COLLIDER_CAPSULE, COLLIDER_TILE, JazzException
 
 
 class PhysicsObject(GameObject):
@@ -65,7 +65,7 @@ class PhysicsObject(GameObject):
         """Adds a collider to the object.
 
         Args:
-            type (int | str): Collider type name ("Rect", "Circle", "Polygon", "Poly", "Ray") or integer constant.
+            type (int | str): Collider type name ("Rect", "Circle", "Polygon", "Poly", "Ray", "Capsule", "Tile") or integer constant.
             **kwargs: Custom arguments to initialize the specific collider (e.g. w, h, radius, vertices, length).
 
         Raises:
@@ -79,6 +79,12 @@ class PhysicsObject(GameObject):
             self.collider = PolyCollider(**kwargs)
         elif type == COLLIDER_RAY or type == "Ray":
             self.collider = RayCollider(**kwargs)
+        elif type == COLLIDER_CAPSULE or type == "Capsule":
+            self.collider = CapsuleCollider(**kwargs)
+        elif type == COLLIDER_TILE or type == "Tile":
+            from .tilemap import TileCollider
+
+            self.collider = TileCollider(**kwargs)
         else:
             raise JazzException("Invalid collider type")
         self.add_child(self.collider)
@@ -0,0 +1,417 @@
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+    from .colliders import Collider
+
+
+class _TreeNode:
+    """A node of the DynamicAABBTree. Leaves hold a physics object, branches hold two children."""
+
+    __slots__ = ("left", "top", "right", "bottom", "parent", "child1", "child2", "height", "obj")
+
+    def __init__(self, left: float, top: float, right: float, bottom: float, obj: "PhysicsObject | None" = None) -> None:
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.parent: "_TreeNode | None" = None
+        self.child1: "_TreeNode | None" = None
+        self.child2: "_TreeNode | None" = None
+        self.height = 0
+        self.obj = obj
+
+    @property
+    def is_leaf(self) -> bool:
+        """bool: True if the node holds an object rather than children."""
+        return self.child1 is None
+
+    def perimeter(self) -> float:
+        """Returns the perimeter of the node's box, used as the tree's insertion cost."""
+        return 2 * (self.right - self.left + self.bottom - self.top)
+
+    def union_perimeter(self, other: "_TreeNode") -> float:
+        """Returns the perimeter of the box enclosing this node and another."""
+        return 2 * (
+            max(self.right, other.right) - min(self.left, other.left)
+            + max(self.bottom, other.bottom) - min(self.top, other.top)
+        )
+
+    def refit(self) -> None:
+        """Recomputes a branch's box and height from its children."""
+        child1 = self.child1
+        child2 = self.child2
+        self.left = min(child1.left, child2.left)
+        self.top = min(child1.top, child2.top)
+        self.right = max(child1.right, child2.right)
+        self.bottom = max(child1.bottom, child2.bottom)
+        self.height = 1 + max(child1.height, child2.height)
+
+    def overlaps(self, other: "_TreeNode") -> bool:
+        """Returns True if the boxes of the two nodes overlap."""
+        return (
+            self.left <= other.right
+            and self.right >= other.left
+            and self.top <= other.bottom
+            and self.bottom >= other.top
+        )
+
+
+class DynamicAABBTree:
+    """A dynamic bounding volume hierarchy of axis aligned boxes.
+
+    Handles scenes with colliders of very different sizes better than a fixed size grid,
+    since every object is stored exactly once. Leaves are fattened by a margin so small
+    movements do not touch the tree. When an object leaves its fattened box it is
+    reinserted and only its ancestors are refit. Tree rotations keep the tree balanced.
+    """
+
+    def __init__(self, margin: float = 10.0) -> None:
+        """Initializes the DynamicAABBTree.
+
+        Args:
+            margin (float, optional): Distance leaf boxes are fattened by. Defaults to 10.0.
+        """
+        self._objects: list["PhysicsObject"] = []
+        self._leaves: dict["PhysicsObject", _TreeNode] = {}
+        self._dirty: set["PhysicsObject"] = set()
+        self._masks: dict["PhysicsObject", int] = {}
+        self._margin = margin
+        self._root: _TreeNode | None = None
+
+    def __repr__(self) -> str:
+        return f"\nAABBTree: {self._objects}"
+
+    @property
+    def height(self) -> int:
+        """int: The height of the tree, 0 when it holds a single leaf."""
+        return self._root.height if self._root is not None else 0
+
+    def add_object(self, physics_object: "PhysicsObject", mask: int = -1) -> None:
+        """Adds a physical object to the tree. It is inserted on the next build.
+
+        Args:
+            physics_object (PhysicsObject): The object to add.
+            mask (int, optional): Layer bitmask stored with the entry and matched against query masks. Defaults to all layers.
+        """
+        self._masks[physics_object] = mask
+        if physics_object not in self._dirty and physics_object not in self._leaves:
+            self._objects.append(physics_object)
+        self._dirty.add(physics_object)
+
+    def remove_object(self, physics_object: "PhysicsObject") -> None:
+        """Removes a physical object from the tree.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+        """
+        self._masks.pop(physics_object, None)
+        leaf = self._leaves.pop(physics_object, None)
+        if leaf is not None:
+            self._remove_leaf(leaf)
+        if leaf is not None or physics_object in self._dirty:
+            self._objects.remove(physics_object)
+        self._dirty.discard(physics_object)
+
+    def build_grid(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Inserts new objects and reinserts moved objects that left their fattened boxes.
+
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every tracked object is checked. Defaults to None.
+        """
+        dirty = self._dirty
+        if moved is None:
+            for physics_object in self._objects:
+                self._update_leaf(physics_object)
+        else:
+            leaves = self._leaves
+            for physics_object in dirty:
+                self._update_leaf(physics_object)
+            for physics_object in moved:
+                if physics_object in leaves and physics_object not in dirty:
+                    self._update_leaf(physics_object)
+        dirty.clear()
+
+    def _update_leaf(self, physics_object: "PhysicsObject") -> None:
+        """Inserts or reinserts an object's leaf if its box escaped the fattened bounds.
+
+        Args:
+            physics_object (PhysicsObject): The object to update.
+        """
+        rect = physics_object.collider.get_rect()
+        leaf = self._leaves.get(physics_object)
+        if leaf is not None:
+            if (
+                leaf.left <= rect.left
+                and leaf.top <= rect.top
+                and leaf.right >= rect.right
+                and leaf.bottom >= rect.bottom
+            ):
+                return
+            self._remove_leaf(leaf)
+        margin = self._margin
+        leaf = _TreeNode(
+            rect.left - margin, rect.top - margin, rect.right + margin, rect.bottom + margin, physics_object
+        )
+        self._leaves[physics_object] = leaf
+        self._insert_leaf(leaf)
+
+    def _insert_leaf(self, leaf: _TreeNode) -> None:
+        """Inserts a leaf next to the sibling that grows the tree's total perimeter least.
+
+        Args:
+            leaf (_TreeNode): The leaf to insert.
+        """
+        if self._root is None:
+            self._root = leaf
+            leaf.parent = None
+            return
+
+        # Descend towards the cheapest sibling
+        sibling = self._root
+        while not sibling.is_leaf:
+            combined = sibling.union_perimeter(leaf)
+            cost = 2 * combined
+            inheritance = 2 * (combined - sibling.perimeter())
+            costs = []
+            for child in (sibling.child1, sibling.child2):
+                child_cost = child.union_perimeter(leaf) + inheritance
+                if not child.is_leaf:
+                    child_cost -= child.perimeter()
+                costs.append(child_cost)
+            if cost < costs[0] and cost < costs[1]:
+                break
+            sibling = sibling.child1 if costs[0] < costs[1] else sibling.child2
+
+        old_parent = sibling.parent
+        new_parent = _TreeNode(0, 0, 0, 0)
+        new_parent.parent = old_parent
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+        new_parent.refit()
+        if old_parent is None:
+            self._root = new_parent
+        elif old_parent.child1 is sibling:
+            old_parent.child1 = new_parent
+        else:
+            old_parent.child2 = new_parent
+
+        self._refit_ancestors(leaf.parent)
+
+    def _remove_leaf(self, leaf: _TreeNode) -> None:
+        """Removes a leaf, replacing its parent with the leaf's sibling.
+
+        Args:
+            leaf (_TreeNode): The leaf to remove.
+        """
+        if leaf is self._root:
+            self._root = None
+            return
+        parent = leaf.parent
+        grand_parent = parent.parent
+        sibling = parent.child1 if parent.child2 is leaf else parent.child2
+        leaf.parent = None
+        sibling.parent = grand_parent
+        if grand_parent is None:
+            self._root = sibling
+            return
+        if grand_parent.child1 is parent:
+            grand_parent.child1 = sibling
+        else:
+            grand_parent.child2 = sibling
+        self._refit_ancestors(grand_parent)
+
+    def _refit_ancestors(self, node: _TreeNode | None) -> None:
+        """Walks from a node to the root, balancing and refitting each ancestor.
+
+        Args:
+            node (_TreeNode | None): The first node to refit.
+        """
+        while node is not None:
+            node = self._balance(node)
+            node.refit()
+            node = node.parent
+
+    def _balance(self, a: _TreeNode) -> _TreeNode:
+        """Performs a tree rotation at a node if its subtrees' heights differ by more than one.
+
+        Args:
+            a (_TreeNode): The node to balance.
+
+        Returns:
+            _TreeNode: The node now at a's position in the tree.
+        """
+        if a.is_leaf or a.height < 2:
+            return a
+        b = a.child1
+        c = a.child2
+        balance = c.height - b.height
+        if balance > 1:
+            return self._rotate(a, c, b)
+        if balance < -1:
+            return self._rotate(a, b, c)
+        return a
+
+    def _rotate(self, a: _TreeNode, up: _TreeNode, stay: _TreeNode) -> _TreeNode:
+        """Promotes the taller child of a node, moving one of its grandchildren down.
+
+        Args:
+            a (_TreeNode): The unbalanced node.
+            up (_TreeNode): The taller child that replaces a.
+            stay (_TreeNode): The shorter child that stays under a.
+
+        Returns:
+            _TreeNode: The promoted node.
+        """
+        f = up.child1
+        g = up.child2
+
+        # Swap a and up
+        up.parent = a.parent
+        a.parent = up
+        if up.parent is None:
+            self._root = up
+        elif up.parent.child1 is a:
+            up.parent.child1 = up
+        else:
+            up.parent.child2 = up
+
+        # Keep the taller grandchild under up and move the other under a
+        if f.height > g.height:
+            keep, move = f, g
+        else:
+            keep, move = g, f
+        up.child1 = a
+        up.child2 = keep
+        a.child1 = stay
+        a.child2 = move
+        move.parent = a
+        a.refit()
+        up.refit()
+        return up
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> list["PhysicsObject"]:
+        """Finds objects whose fattened boxes overlap a query box.
+
+        Args:
+            left (float): Left boundary of the query box.
+            top (float): Top boundary of the query box.
+            right (float): Right boundary of the query box.
+            bottom (float): Bottom boundary of the query box.
+
+        Returns:
+            list[PhysicsObject]: Objects overlapping the query box.
+        """
+        found = []
+        if self._root is None:
+            return found
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.left > right or node.right < left or node.top > bottom or node.bottom < top:
+                continue
+            if node.is_leaf:
+                found.append(node.obj)
+            else:
+                stack.append(node.child1)
+                stack.append(node.child2)
+        return found
+
+    def get_pairs(self) -> list[tuple["PhysicsObject", "PhysicsObject"]]:
+        """Returns every pair of objects in the tree whose fattened boxes overlap, each pair once.
+
+        Returns:
+            list[tuple[PhysicsObject, PhysicsObject]]: The candidate pairs.
+        """
+        pairs = []
+        if self._root is None:
+            return pairs
+        branches = [self._root]
+        while branches:
+            node = branches.pop()
+            if node.is_leaf:
+                continue
+            branches.append(node.child1)
+            branches.append(node.child2)
+            self._cross_pairs(node.child1, node.child2, pairs)
+        return pairs
+
+    def query_pairs(self, other: "DynamicAABBTree") -> list[tuple["PhysicsObject", "PhysicsObject"]]:
+        """Returns every pair of objects, one from each tree, whose fattened boxes overlap.
+
+        Both trees are descended simultaneously, so whole subtrees that do not overlap
+        are skipped at once.
+
+        Args:
+            other (DynamicAABBTree): The tree to test against.
+
+        Returns:
+            list[tuple[PhysicsObject, PhysicsObject]]: Pairs of (object in this tree, object in other).
+        """
+        pairs = []
+        if self._root is not None and other._root is not None:
+            self._cross_pairs(self._root, other._root, pairs)
+        return pairs
+
+    @staticmethod
+    def _cross_pairs(first: _TreeNode, second: _TreeNode, pairs: list) -> None:
+        """Collects overlapping leaf pairs between two subtrees.
+
+        Args:
+            first (_TreeNode): Root of the first subtree.
+            second (_TreeNode): Root of the second subtree.
+            pairs (list): List the pairs are appended to.
+        """
+        stack = [(first, second)]
+        while stack:
+            a, b = stack.pop()
+            if not a.overlaps(b):
+                continue
+            if a.is_leaf and b.is_leaf:
+                pairs.append((a.obj, b.obj))
+            elif b.is_leaf or (not a.is_leaf and a.perimeter() > b.perimeter()):
+                stack.append((a.child1, b))
+                stack.append((a.child2, b))
+            else:
+                stack.append((a, b.child1))
+                stack.append((a, b.child2))
+
+    def get_AABB_collisions(self, collider: "PhysicsObject", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping the bounds of a query collider.
+
+        Args:
+            collider (PhysicsObject): The object querying collisions.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate objects whose bounding boxes overlap.
+        """
+        rect = collider.collider.get_rect()
+        return [
+            physics_object
+            for physics_object in self.query(rect.left, rect.top, rect.right, rect.bottom)
+            if physics_object is not collider
+            and (mask is None or self._masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider.collider)
+        ]
+
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping a basic Collider object bounds.
+
+        Args:
+            collider (Collider): The shape collider to check.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate overlapping objects.
+        """
+        return [
+            physics_object
+            for physics_object in self.query(collider.left, collider.top, collider.right, collider.bottom)
+            if physics_object.collider is not collider
+            and (mask is None or self._masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider)
+        ]
@@ -1,16 +1,27 @@
+from typing import TYPE_CHECKING, Iterable
+
+from ..engine.group import Group
 from ..global_dict import Globals
-from ..utils import Vec2, dist_to
 from ._physics_object import PhysicsObject
 
+if TYPE_CHECKING:
+    from ..engine.base_object import GameObject
+
 
 class Area(PhysicsObject):
-    """Sensor zone component that detects overlapping physical objects without resolution checks."""
+    """Sensor zone component that detects overlapping physical objects without resolution checks.
+
+    Overlaps are tracked by the scene's AreaTracker, which only re-tests an area when
+    it or something near it moves. When an object enters or exits, on_body_entered
+    or on_body_exited is called once, and entered holds the objects currently inside.
+    """
 
     def __init__(self, **kwargs) -> None:
         """Initializes the Area component.
 
         Args:
-            target_group (Group, optional): Filter overlaps against a specific Entity Group. Defaults to None.
+            target_group (Group | Iterable[GameObject], optional): Only sense objects in this group,
+                e.g. Scene.tagged("player"). Other iterables are copied into a Group. Defaults to None.
             active (bool, optional): Active status check flag. Defaults to True.
         """
         kwargs.setdefault("name", "Area")
@@ -18,22 +29,59 @@ class Area(PhysicsObject):
         super().__init__(**kwargs)
 
         self.target_group = kwargs.get("target_group", None)
-        self.entered = []
         self._active = kwargs.get("active", True)
-        self._entered_cache = {}
 
-    def _engine_update(self, delta: float) -> None:
-        """Engine updates and queries overlapping candidates each frame if sensor is active.
+    @property
+    def target_group(self) -> "Group | None":
+        """Group | None: The only objects the area senses, or None to sense every object."""
+        return self._target_group
+
+    @target_group.setter
+    def target_group(self, target_group: "Group | Iterable[GameObject] | None") -> None:
+        if target_group is not None and not isinstance(target_group, Group):
+            # Membership is tested for every candidate, keep it constant time
+            target_group = Group(target_group)
+        self._target_group = target_group
+        if self._loaded:
+            Globals.scene.areas.mark_dirty(self)
+
+    @property
+    def active(self) -> bool:
+        """bool: Whether the area senses objects. Switching it off reports every object inside as exited."""
+        return self._active
+
+    @active.setter
+    def active(self, active: bool) -> None:
+        if active != self._active:
+            self._active = active
+            if self._loaded:
+                Globals.scene.areas.mark_dirty(self)
+
+    @property
+    def entered(self) -> list[PhysicsObject]:
+        """list[PhysicsObject]: The objects inside the area as of the last physics build, in the order they entered."""
+        return Globals.scene.areas.entered(self)
+
+    def on_body_entered(self, body: PhysicsObject) -> None:
+        """Base method that can be overwritten. Called once when an object starts overlapping the area.
 
         Args:
-            delta (float): Time in seconds since the last frame.
+            body (PhysicsObject): The object that entered.
+        """
+
+    def on_body_exited(self, body: PhysicsObject) -> None:
+        """Base method that can be overwritten. Called once when an object stops overlapping
+        the area or is removed from the scene while inside it.
+
+        Args:
+            body (PhysicsObject): The object that exited.
         """
-        if self._active:
-            self.entered = self.get_entered()
 
     def get_entered(self) -> list[PhysicsObject]:
         """Queries and returns a sorted list of physics objects currently overlapping this area.
 
+        Unlike entered, this runs a fresh query against the current positions.
+
         Returns:
             list[PhysicsObject]: Sensed physics objects, sorted by proximity to the area center.
         """
@@ -41,6 +89,7 @@ class Area(PhysicsObject):
         collisions = Globals.scene.get_AABB_collisions(self)
         if collisions:
             collisions.sort(key=lambda obj: (obj.pos - self.pos).magnitude_squared())
+            candidates = []
             for obj in collisions:
                 test = True
                 if self.target_group is not None:
@@ -48,18 +97,13 @@ class Area(PhysicsObject):
 
                 test = test and obj.root != self.root
                 if test:
-                    if not self._moved_this_frame and not getattr(obj, "_moved_this_frame", True) and obj in self._entered_cache:
-                        is_colliding = self._entered_cache[obj]
-                    else:
-                        depth, _ = self.collider.collide_sat(obj.collider)
-                        is_colliding = (depth != 0)
-                        self._entered_cache[obj] = is_colliding
-
-                    if is_colliding:
-                        entered.append(obj)
-            self._entered_cache = {obj: val for obj, val in self._entered_cache.items() if obj in collisions}
-        else:
-            self._entered_cache.clear()
+                    candidates.append(obj)
+
+            # The pair cache reuses results for candidates that did not move
+            results = Globals.scene.pair_cache.collide_batch([(self.collider, obj.collider) for obj in candidates])
+            for obj, (depth, _) in zip(candidates, results):
+                if depth != 0:
+                    entered.append(obj)
         return entered
 
 
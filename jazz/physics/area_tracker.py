@@ -0,0 +1,198 @@
+from collections import deque
+from typing import TYPE_CHECKING, Iterable
+
+from .narrowphase import collide_batch
+from .physics import PhysicsGrid
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+    from .area import Area
+    from .world import PhysicsWorld
+
+
+class AreaTracker:
+    """Keeps the set of objects inside every Area up to date from what moved.
+
+    Areas are hashed into their own grid under their collision_layers, so a moved
+    object finds the areas it may touch with a single lookup under its own layers.
+    Only moved areas and the areas touched by moved objects are re-tested. The
+    overlaps found are compared with the last ones and an area is only notified
+    through on_body_entered and on_body_exited when they differ, so areas with
+    nothing moving near them cost nothing per frame.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty AreaTracker."""
+        self._index = PhysicsGrid()
+        self._inside: dict["Area", dict["PhysicsObject", None]] = {}
+        self._containers: dict["PhysicsObject", set["Area"]] = {}
+        self._dirty: set["Area"] = set()
+        self._events: deque[tuple["Area", "PhysicsObject", bool]] = deque()
+        self._dispatching = False
+
+    def __repr__(self) -> str:
+        return f"\nAreaTracker: {len(self._inside)} areas"
+
+    def __len__(self) -> int:
+        return len(self._inside)
+
+    def add(self, area: "Area") -> None:
+        """Starts tracking an area. Its overlaps are found at the next update.
+
+        Args:
+            area (Area): The area to track.
+        """
+        self._inside.setdefault(area, {})
+        self._index.add_object(area, area.collision_layers)
+        self._dirty.add(area)
+
+    def mark_dirty(self, area: "Area") -> None:
+        """Queues a full re-test of an area, e.g. after it was switched on or off.
+
+        Args:
+            area (Area): The area to re-test.
+        """
+        if area in self._inside:
+            self._dirty.add(area)
+
+    def remove(self, physics_object: "PhysicsObject") -> None:
+        """Stops tracking an object, reporting it as exited from every area it was in.
+
+        Removed areas are dropped without notifications.
+
+        Args:
+            physics_object (PhysicsObject): The area or object that left the scene.
+        """
+        inside = self._inside.pop(physics_object, None)
+        if inside is not None:
+            self._index.remove_object(physics_object)
+            self._dirty.discard(physics_object)
+            for other in inside:
+                self._leave(physics_object, other)
+        for area in self._containers.pop(physics_object, ()):
+            del self._inside[area][physics_object]
+            self._events.append((area, physics_object, False))
+        self._dispatch()
+
+    def entered(self, area: "Area") -> list["PhysicsObject"]:
+        """Gets the objects inside an area as of the last update.
+
+        Args:
+            area (Area): The area to look up.
+
+        Returns:
+            list[PhysicsObject]: The objects inside, in the order they entered.
+        """
+        return list(self._inside.get(area, ()))
+
+    def update(self, moved: "Iterable[PhysicsObject] | None", world: "PhysicsWorld") -> None:
+        """Re-tests what moved and notifies areas of every change in their overlaps.
+
+        Args:
+            moved (Iterable[PhysicsObject] | None): Objects whose transforms changed
+                since the last update. If None, every area is re-tested.
+            world (PhysicsWorld): The world whose indexes hold the objects areas can sense.
+        """
+        if not self._inside:
+            return
+        if moved is None:
+            self._dirty.update(self._inside)
+            moved = ()
+        self._index.build_grid(moved)
+
+        tests: dict["Area", set["PhysicsObject"] | None] = dict.fromkeys(self._dirty)
+        self._dirty.clear()
+        index = self._index
+        containers = self._containers
+        layers = world._layers
+        for physics_object in moved:
+            mask = layers.get(physics_object)
+            if mask is None:
+                continue
+            if physics_object in self._inside:
+                tests[physics_object] = None
+            areas = set(index.get_AABB_collisions(physics_object, mask))
+            areas.update(containers.get(physics_object, ()))
+            for area in areas:
+                if area in tests:
+                    candidates = tests[area]
+                    if candidates is not None:
+                        candidates.add(physics_object)
+                else:
+                    tests[area] = {physics_object}
+
+        for area, candidates in tests.items():
+            inside = self._inside[area]
+            if candidates is None:
+                # Full re-test of a moved or new area against everything around it
+                previous = set(inside)
+                candidates = world.get_AABB_collisions(area) if area._active else []
+                found = self._test(area, candidates, world)
+                for other in previous - found:
+                    self._leave(area, other)
+                for other in found:
+                    if other not in inside:
+                        self._enter(area, other)
+            else:
+                found = self._test(area, candidates, world) if area._active else set()
+                for other in candidates:
+                    if other in found:
+                        if other not in inside:
+                            self._enter(area, other)
+                    elif other in inside:
+                        self._leave(area, other)
+        self._dispatch()
+
+    def _test(
+        self, area: "Area", candidates: Iterable["PhysicsObject"], world: "PhysicsWorld"
+    ) -> set["PhysicsObject"]:
+        """Finds which candidates overlap an area, honouring its target_group.
+
+        Args:
+            area (Area): The area to test.
+            candidates (Iterable[PhysicsObject]): Objects whose bounds may overlap it.
+            world (PhysicsWorld): The world whose narrowphase executor runs the tests.
+
+        Returns:
+            set[PhysicsObject]: The candidates inside the area.
+        """
+        root = area.root
+        group = area.target_group
+        candidates = [
+            obj
+            for obj in candidates
+            if obj is not area and obj.root is not root and (group is None or obj in group)
+        ]
+        results = collide_batch([(area.collider, obj.collider) for obj in candidates], world.narrowphase)
+        return {obj for obj, (depth, _) in zip(candidates, results) if depth != 0}
+
+    def _enter(self, area: "Area", physics_object: "PhysicsObject") -> None:
+        self._inside[area][physics_object] = None
+        self._containers.setdefault(physics_object, set()).add(area)
+        self._events.append((area, physics_object, True))
+
+    def _leave(self, area: "Area", physics_object: "PhysicsObject") -> None:
+        self._inside.get(area, {}).pop(physics_object, None)
+        areas = self._containers.get(physics_object)
+        if areas is not None:
+            areas.discard(area)
+            if not areas:
+                del self._containers[physics_object]
+        if area in self._inside:
+            self._events.append((area, physics_object, False))
+
+    def _dispatch(self) -> None:
+        """Delivers queued notifications, including ones queued by the callbacks themselves."""
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            events = self._events
+            while events:
+                area, physics_object, entered = events.popleft()
+                if entered:
+                    area.on_body_entered(physics_object)
+                else:
+                    area.on_body_exited(physics_object)
+        finally:
+            self._dispatching = False
@@ -0,0 +1,288 @@
+from typing import TYPE_CHECKING, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..utils import JazzException
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+    from .colliders import Collider
+
+
+class ArrayPhysicsGrid:
+    """A spatial hashing grid backed by NumPy arrays and packed integer cell keys.
+
+    Drop-in replacement for PhysicsGrid aimed at scenes with many colliders. Object
+    bounds live in a float array indexed by slot, and the cell registry is rebuilt
+    in one vectorized pass per frame by sorting packed cell keys and counting runs,
+    instead of maintaining per-object sets of string keys.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Initializes the ArrayPhysicsGrid.
+
+        Args:
+            capacity (int, optional): Initial number of object slots to allocate. Defaults to 64.
+
+        Raises:
+            JazzException: If numpy is not installed.
+        """
+        if np is None:
+            raise JazzException("ArrayPhysicsGrid requires numpy, install it with 'pip install jazz[numpy]'")
+        self._objects: list["PhysicsObject"] = []
+        self._grid_size = 50
+        self._slots: dict["PhysicsObject", int] = {}
+        self._slot_objects: list["PhysicsObject | None"] = [None] * capacity
+        self._free_slots: list[int] = list(range(capacity - 1, -1, -1))
+        self._dirty: set["PhysicsObject"] = set()
+        self._cells_dirty = False
+
+        # Per slot world bounds (left, top, right, bottom) and cell ranges (x0, x1, y0, y1)
+        self._bounds = np.zeros((capacity, 4), dtype=np.float64)
+        self._cell_ranges = np.zeros((capacity, 4), dtype=np.int64)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._masks = np.zeros(capacity, dtype=np.uint64)
+
+        # Compressed cell registry: sorted unique keys, their run starts/lengths and the slots in each run
+        self._cell_keys = np.empty(0, dtype=np.int64)
+        self._cell_starts = np.empty(0, dtype=np.int64)
+        self._cell_counts = np.empty(0, dtype=np.int64)
+        self._cell_slots = np.empty(0, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"\nArrayGrid: {self._objects}"
+
+    @staticmethod
+    def pack_keys(x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        """Packs integer cell coordinates into unique 64 bit cell keys.
+
+        Args:
+            x (np.ndarray): Cell column indices.
+            y (np.ndarray): Cell row indices.
+
+        Returns:
+            np.ndarray: The packed int64 cell keys.
+        """
+        return (np.asarray(x, dtype=np.int64) << 32) | (np.asarray(y, dtype=np.int64) & 0xFFFFFFFF)
+
+    def _grow(self) -> None:
+        """Doubles the slot capacity of the bounds arrays."""
+        old = len(self._slot_objects)
+        new = old * 2
+        self._bounds = np.concatenate((self._bounds, np.zeros((old, 4), dtype=np.float64)))
+        self._cell_ranges = np.concatenate((self._cell_ranges, np.zeros((old, 4), dtype=np.int64)))
+        self._active = np.concatenate((self._active, np.zeros(old, dtype=bool)))
+        self._masks = np.concatenate((self._masks, np.zeros(old, dtype=np.uint64)))
+        self._slot_objects.extend([None] * old)
+        self._free_slots.extend(range(new - 1, old - 1, -1))
+
+    @staticmethod
+    def _to_mask(mask: int) -> "np.uint64":
+        """Converts a Python layer mask, which may be negative for all layers, to an unsigned 64 bit mask."""
+        return np.uint64(mask & 0xFFFFFFFFFFFFFFFF)
+
+    def add_object(self, physics_object: "PhysicsObject", mask: int = -1) -> None:
+        """Adds a physical object to the grid. It is hashed on the next build.
+
+        Args:
+            physics_object (PhysicsObject): The object to add.
+            mask (int, optional): Layer bitmask stored with the entry and matched against query masks. Defaults to all layers.
+        """
+        if physics_object not in self._slots:
+            if not self._free_slots:
+                self._grow()
+            slot = self._free_slots.pop()
+            self._slots[physics_object] = slot
+            self._slot_objects[slot] = physics_object
+            self._objects.append(physics_object)
+        self._masks[self._slots[physics_object]] = self._to_mask(mask)
+        self._dirty.add(physics_object)
+
+    def remove_object(self, physics_object: "PhysicsObject") -> None:
+        """Removes a physical object from the grid.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+        """
+        slot = self._slots.pop(physics_object, None)
+        if slot is None:
+            return
+        self._objects.remove(physics_object)
+        self._dirty.discard(physics_object)
+        self._slot_objects[slot] = None
+        self._active[slot] = False
+        self._free_slots.append(slot)
+        self._cells_dirty = True
+
+    def _store_bounds(self, physics_object: "PhysicsObject") -> None:
+        """Copies an object's current bounding box into the bounds arrays.
+
+        Args:
+            physics_object (PhysicsObject): The object to refresh.
+        """
+        slot = self._slots[physics_object]
+        rect = physics_object.collider.get_rect()
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        size = self._grid_size
+        cell_range = (left // size, right // size, top // size, bottom // size)
+        self._bounds[slot] = (left, top, right, bottom)
+        if not self._active[slot] or tuple(self._cell_ranges[slot]) != cell_range:
+            self._cell_ranges[slot] = cell_range
+            self._active[slot] = True
+            self._cells_dirty = True
+
+    def build_grid(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Refreshes moved object bounds and rebuilds the cell registry if any cell assignment changed.
+
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every tracked object is refreshed. Defaults to None.
+        """
+        if moved is None:
+            for physics_object in self._objects:
+                self._store_bounds(physics_object)
+        else:
+            slots = self._slots
+            dirty = self._dirty
+            for physics_object in dirty:
+                self._store_bounds(physics_object)
+            for physics_object in moved:
+                if physics_object in slots and physics_object not in dirty:
+                    self._store_bounds(physics_object)
+        self._dirty.clear()
+        if self._cells_dirty:
+            self._rebuild_cells()
+
+    def _rebuild_cells(self) -> None:
+        """Rebuilds the object to cell assignments of every active object in one vectorized pass."""
+        self._cells_dirty = False
+        slots = np.flatnonzero(self._active)
+        if len(slots) == 0:
+            self._cell_keys = np.empty(0, dtype=np.int64)
+            self._cell_starts = np.empty(0, dtype=np.int64)
+            self._cell_counts = np.empty(0, dtype=np.int64)
+            self._cell_slots = np.empty(0, dtype=np.int64)
+            return
+
+        ranges = self._cell_ranges[slots]
+        x0, y0 = ranges[:, 0], ranges[:, 2]
+        widths = ranges[:, 1] - x0 + 1
+        counts = widths * (ranges[:, 3] - y0 + 1)
+
+        # Expand each object into one entry per covered cell
+        owners = np.repeat(np.arange(len(slots)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        owner_widths = widths[owners]
+        keys = self.pack_keys(x0[owners] + local % owner_widths, y0[owners] + local // owner_widths)
+
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        self._cell_slots = slots[owners[order]]
+        self._cell_keys, self._cell_starts, self._cell_counts = np.unique(
+            keys, return_index=True, return_counts=True
+        )
+
+    def _query_slots(self, left: float, top: float, right: float, bottom: float, mask: int | None = None) -> "np.ndarray":
+        """Finds active slots registered near a bounding box.
+
+        Scans the same one cell neighbourhood as PhysicsGrid and discards slots whose
+        stored bounds are further than one cell away from the query box, or whose
+        layer mask does not share a bit with the query mask.
+
+        Args:
+            left (float): Left boundary of the query box.
+            top (float): Top boundary of the query box.
+            right (float): Right boundary of the query box.
+            bottom (float): Bottom boundary of the query box.
+            mask (int, optional): Layer bitmask to filter by. Defaults to None (no filtering).
+
+        Returns:
+            np.ndarray: Unique candidate slot indices.
+        """
+        if len(self._cell_keys) == 0:
+            return np.empty(0, dtype=np.int64)
+        size = self._grid_size
+        xs = np.arange(int(left // size) - 1, int(right // size) + 2)
+        ys = np.arange(int(top // size) - 1, int(bottom // size) + 2)
+        query_keys = self.pack_keys(np.repeat(xs, len(ys)), np.tile(ys, len(xs)))
+
+        index = np.searchsorted(self._cell_keys, query_keys)
+        index[index == len(self._cell_keys)] = 0
+        index = index[self._cell_keys[index] == query_keys]
+        if len(index) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        starts = self._cell_starts[index]
+        counts = self._cell_counts[index]
+        positions = np.arange(counts.sum()) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        slots = np.unique(self._cell_slots[positions])
+
+        bounds = self._bounds[slots]
+        near = (
+            self._active[slots]
+            & (bounds[:, 0] < right + size)
+            & (bounds[:, 2] > left - size)
+            & (bounds[:, 1] < bottom + size)
+            & (bounds[:, 3] > top - size)
+        )
+        if mask is not None:
+            near &= (self._masks[slots] & self._to_mask(mask)) != 0
+        return slots[near]
+
+    def get_grid_cell(self, x: float | int, y: float | int) -> list["PhysicsObject"]:
+        """Retrieves list of physics objects indexed inside a specific cell coordinate.
+
+        Args:
+            x (float | int): X coordinate cell block index.
+            y (float | int): Y coordinate cell block index.
+
+        Returns:
+            list[PhysicsObject]: List of registered objects in the cell.
+        """
+        key = int(self.pack_keys(int(x), int(y)))
+        index = int(np.searchsorted(self._cell_keys, key))
+        if index == len(self._cell_keys) or self._cell_keys[index] != key:
+            return []
+        start = self._cell_starts[index]
+        slots = self._cell_slots[start:start + self._cell_counts[index]]
+        return [self._slot_objects[slot] for slot in slots if self._active[slot]]
+
+    def get_AABB_collisions(self, collider: "PhysicsObject", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping the bounds of a query collider.
+
+        Args:
+            collider (PhysicsObject): The object querying collisions.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate objects whose bounding boxes overlap.
+        """
+        rect = collider.collider.get_rect()
+        collisions = []
+        for slot in self._query_slots(rect.left, rect.top, rect.right, rect.bottom, mask):
+            physics_object = self._slot_objects[slot]
+            if physics_object is not collider:
+                if physics_object.collider.collide_rect(collider.collider):
+                    collisions.append(physics_object)
+        return collisions
+
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping a basic Collider object bounds.
+
+        Args:
+            collider (Collider): The shape collider to check.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate overlapping objects.
+        """
+        collisions = []
+        for slot in self._query_slots(collider.left, collider.top, collider.right, collider.bottom, mask):
+            physics_object = self._slot_objects[slot]
+            if physics_object.collider is not collider:
+                if physics_object.collider.collide_rect(collider):
+                    collisions.append(physics_object)
+        return collisions
@@ -0,0 +1,339 @@
+from typing import TYPE_CHECKING, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..utils import JazzException, Vec2
+from .colliders import CapsuleCollider, CircleCollider
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+
+# Rays tested against every candidate at once, bounding the size of the (rays, shapes) arrays
+RAY_CHUNK = 64
+
+
+class RaycastHits:
+    """Results of a batch of raycasts, one row per ray.
+
+    Attributes:
+        distances (np.ndarray): (N,) distance to the hit, inf where the ray hit nothing.
+        points (np.ndarray): (N, 2) hit points, nan where the ray hit nothing.
+        normals (np.ndarray): (N, 2) unit surface normals at the hits, facing the ray.
+        indices (np.ndarray): (N,) index into objects of the object hit, -1 where the ray hit nothing.
+        objects (list[PhysicsObject]): The candidate objects the indices refer to.
+    """
+
+    __slots__ = ("distances", "points", "normals", "indices", "objects")
+
+    def __init__(
+        self,
+        distances: "np.ndarray",
+        points: "np.ndarray",
+        normals: "np.ndarray",
+        indices: "np.ndarray",
+        objects: list["PhysicsObject"],
+    ) -> None:
+        self.distances = distances
+        self.points = points
+        self.normals = normals
+        self.indices = indices
+        self.objects = objects
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def __repr__(self) -> str:
+        return f"RaycastHits({int((self.indices >= 0).sum())}/{len(self)} hit)"
+
+    def hit(self, ray: int) -> "tuple[PhysicsObject | None, tuple[float, float] | None]":
+        """Gets the object and point hit by one ray.
+
+        Args:
+            ray (int): The ray's row.
+
+        Returns:
+            tuple[PhysicsObject | None, tuple[float, float] | None]: The object and point, or (None, None).
+        """
+        index = self.indices[ray]
+        if index < 0:
+            return None, None
+        return self.objects[index], (float(self.points[ray, 0]), float(self.points[ray, 1]))
+
+
+def _pack_shapes(objects: Sequence["PhysicsObject"]) -> tuple:
+    """Packs the candidates' colliders into circle and edge arrays.
+
+    Capsules become their two end circles plus the rectangle between them. Tile
+    colliders become their merged rectangles. Polygons
+    with at least three vertices are closed and also tested for rays starting inside.
+    Their edges come first, grouped per polygon, followed by the lone ray edges.
+
+    Args:
+        objects (Sequence[PhysicsObject]): The candidate objects.
+
+    Returns:
+        tuple: Circle centers (C, 2), radii (C,) and owners (C,). Edge starts (E, 2),
+            vectors (E, 2), owners (E,) and bounds (E, 2) twice. Outward normals of the
+            polygon edges (E', 2). The first edge (P,), edge count (P,), bounds (P, 2)
+            twice and owner (P,) of each polygon.
+    """
+    centers, radii, circle_owners = [], [], []
+    starts, ends, edge_owners, outward = [], [], [], []
+    polygon_starts, polygon_owners = [], []
+    lone_starts, lone_ends, lone_owners = [], [], []
+
+    def add_polygon(vertices, owner):
+        polygon_starts.append(len(starts))
+        polygon_owners.append(owner)
+        count = len(vertices)
+        center = sum(vertices, Vec2()) / count
+        for i in range(count):
+            start = vertices[i]
+            edge = vertices[(i + 1) % count] - start
+            normal = edge.rotate(90)
+            if normal.dot(center - start) > 0:
+                normal = -normal
+            starts.append(start)
+            ends.append(start + edge)
+            edge_owners.append(owner)
+            outward.append(normal)
+
+    for owner, physics_object in enumerate(objects):
+        collider = physics_object.collider
+        vertices = collider.vertices
+        if isinstance(collider, CircleCollider):
+            centers.append(collider.pos)
+            radii.append(collider._radius)
+            circle_owners.append(owner)
+        elif isinstance(collider, CapsuleCollider):
+            first, second = vertices
+            radius = collider._capsule_radius
+            centers += [first, second]
+            radii += [radius, radius]
+            circle_owners += [owner, owner]
+            if first != second and radius:
+                side = (second - first).normalize().rotate(90) * radius
+                add_polygon([first + side, second + side, second - side, first - side], owner)
+        elif collider.collider_type == "Tile":
+            for part in collider.parts:
+                add_polygon(part.vertices, owner)
+        elif len(vertices) >= 3:
+            add_polygon(vertices, owner)
+        elif len(vertices) == 2:
+            lone_starts.append(vertices[0])
+            lone_ends.append(vertices[1])
+            lone_owners.append(owner)
+
+    def points(vectors):
+        return np.array([(v.x, v.y) for v in vectors], dtype=np.float64).reshape(-1, 2)
+
+    starts = points(starts + lone_starts)
+    ends = points(ends + lone_ends)
+    polygon_starts = np.array(polygon_starts, dtype=np.intp)
+    polygon_counts = np.diff(np.append(polygon_starts, len(outward)))
+    edge_lo = np.minimum(starts, ends)
+    edge_hi = np.maximum(starts, ends)
+    return (
+        points(centers),
+        np.array(radii, dtype=np.float64),
+        np.array(circle_owners, dtype=np.intp),
+        starts,
+        ends - starts,
+        np.array(edge_owners + lone_owners, dtype=np.intp),
+        edge_lo,
+        edge_hi,
+        points(outward),
+        polygon_starts,
+        polygon_counts,
+        np.minimum.reduceat(edge_lo, polygon_starts) if len(polygon_starts) else edge_lo[:0],
+        np.maximum.reduceat(edge_hi, polygon_starts) if len(polygon_starts) else edge_hi[:0],
+        np.array(polygon_owners, dtype=np.intp),
+    )
+
+
+def raycast_shapes(
+    objects: Sequence["PhysicsObject"],
+    origins: "np.ndarray",
+    directions: "np.ndarray",
+    lengths: "np.ndarray",
+) -> RaycastHits:
+    """Casts many rays against a set of objects with array operations.
+
+    Each ray is tested against every edge and circle of the candidates at once. Rays
+    that start inside a circle or closed polygon hit it at distance 0 with the normal
+    facing back along the ray.
+
+    Args:
+        objects (Sequence[PhysicsObject]): The candidate objects.
+        origins (np.ndarray): (N, 2) ray origins.
+        directions (np.ndarray): (N, 2) ray directions, they do not need to be normalized.
+        lengths (np.ndarray): (N,) ray lengths.
+
+    Returns:
+        RaycastHits: The closest hit of every ray.
+
+    Raises:
+        JazzException: If numpy is not installed.
+    """
+    if np is None:
+        raise JazzException("raycast_batch requires numpy, install it with 'pip install jazz[numpy]'")
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    count = len(origins)
+    directions = np.broadcast_to(np.asarray(directions, dtype=np.float64), (count, 2))
+    lengths = np.broadcast_to(np.asarray(lengths, dtype=np.float64), (count,))
+    norms = np.hypot(directions[:, 0], directions[:, 1])
+    directions = np.divide(directions, norms[:, None], out=np.zeros((count, 2)), where=norms[:, None] > 0)
+    # Rays without a direction or length cannot hit anything
+    lengths = np.where(norms > 0, lengths, -1.0)
+
+    distances = np.full(count, np.inf)
+    normals = np.zeros((count, 2))
+    indices = np.full(count, -1, dtype=np.intp)
+    objects = list(objects)
+    if objects and count:
+        shapes = _pack_shapes(objects)
+        for chunk in range(0, count, RAY_CHUNK):
+            rows = slice(chunk, chunk + RAY_CHUNK)
+            _cast_chunk(
+                shapes, origins[rows], directions[rows], lengths[rows],
+                distances[rows], normals[rows], indices[rows],
+            )
+
+    hit = indices >= 0
+    points = np.full((count, 2), np.nan)
+    points[hit] = origins[hit] + directions[hit] * distances[hit, None]
+    return RaycastHits(distances, points, normals, indices, objects)
+
+
+def _cast_chunk(
+    shapes: tuple,
+    origins: "np.ndarray",
+    directions: "np.ndarray",
+    lengths: "np.ndarray",
+    distances: "np.ndarray",
+    normals: "np.ndarray",
+    indices: "np.ndarray",
+) -> None:
+    """Casts a chunk of rays, writing the closest hits into the output views.
+
+    Only shapes whose bounds overlap the bounds of the chunk's rays are tested.
+
+    Args:
+        shapes (tuple): The arrays packed by _pack_shapes.
+        origins (np.ndarray): (n, 2) ray origins.
+        directions (np.ndarray): (n, 2) unit ray directions.
+        lengths (np.ndarray): (n,) ray lengths, negative for rays that cannot hit.
+        distances (np.ndarray): (n,) output distances.
+        normals (np.ndarray): (n, 2) output normals.
+        indices (np.ndarray): (n,) output object indices.
+    """
+    (
+        centers, radii, circle_owners,
+        starts, edges, edge_owners, edge_lo, edge_hi,
+        outward, polygon_starts, polygon_counts, polygon_lo, polygon_hi, polygon_owners,
+    ) = shapes
+    ends = origins + directions * np.maximum(lengths, 0)[:, None]
+    lo = np.minimum(origins, ends).min(axis=0)
+    hi = np.maximum(origins, ends).max(axis=0)
+    rows = np.arange(len(origins))
+    ox, oy = origins[:, 0:1], origins[:, 1:2]
+    dx, dy = directions[:, 0:1], directions[:, 1:2]
+    limit = lengths[:, None]
+
+    near = np.nonzero(((edge_hi >= lo) & (edge_lo <= hi)).all(axis=1))[0]
+    if len(near):
+        # Ray p + t d against edge a + u e, from the cross products of the offsets
+        ax = starts[near, 0][None, :] - ox
+        ay = starts[near, 1][None, :] - oy
+        ex, ey = edges[near, 0][None, :], edges[near, 1][None, :]
+        denom = dx * ey - dy * ex
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = (ax * ey - ay * ex) / denom
+            u = (ax * dy - ay * dx) / denom
+        valid = (denom != 0) & (u >= 0) & (u <= 1) & (t >= 0) & (t <= limit)
+        t = np.where(valid, t, np.inf)
+        edge = np.argmin(t, axis=1)
+        edge_t = t[rows, edge]
+        hit = np.isfinite(edge_t)
+        if hit.any():
+            ray = rows[hit]
+            edge = near[edge[hit]]
+            normal = np.stack((edges[edge, 1], -edges[edge, 0]), axis=1)
+            normal /= np.hypot(normal[:, 0], normal[:, 1])[:, None]
+            facing = np.sign((normal * directions[ray]).sum(axis=1))
+            normal *= -np.where(facing == 0, 1.0, facing)[:, None]
+            _take_hits(ray, edge_t[hit], normal, edge_owners[edge], distances, normals, indices)
+
+    origin_lo = origins.min(axis=0)
+    origin_hi = origins.max(axis=0)
+    near = np.nonzero(((polygon_hi >= origin_lo) & (polygon_lo <= origin_hi)).all(axis=1))[0]
+    if len(near):
+        # A ray starting inside a closed polygon is behind every one of its edges
+        counts = polygon_counts[near]
+        first_edges = np.cumsum(counts) - counts
+        edge = np.repeat(polygon_starts[near] - first_edges, counts) + np.arange(counts.sum())
+        behind = (starts[edge, 0][None, :] - ox) * outward[edge, 0] + (starts[edge, 1][None, :] - oy) * outward[edge, 1]
+        inside = (np.minimum.reduceat(behind, first_edges, axis=1) >= 0) & (limit >= 0)
+        if inside.any():
+            ray, polygon = np.nonzero(inside)
+            ray, first = np.unique(ray, return_index=True)
+            owners = polygon_owners[near[polygon[first]]]
+            _take_hits(ray, np.zeros(len(ray)), -directions[ray], owners, distances, normals, indices)
+
+    near = np.nonzero(
+        (centers[:, 0] + radii >= lo[0]) & (centers[:, 0] - radii <= hi[0])
+        & (centers[:, 1] + radii >= lo[1]) & (centers[:, 1] - radii <= hi[1])
+    )[0]
+    if len(near):
+        mx = ox - centers[near, 0][None, :]
+        my = oy - centers[near, 1][None, :]
+        b = mx * dx + my * dy
+        c = mx * mx + my * my - radii[near][None, :] ** 2
+        discriminant = b * b - c
+        with np.errstate(invalid="ignore"):
+            t = np.where(c <= 0, 0.0, -b - np.sqrt(discriminant))
+        valid = ((c <= 0) | ((discriminant >= 0) & (b < 0))) & (t <= limit) & (limit >= 0)
+        t = np.where(valid, t, np.inf)
+        circle = np.argmin(t, axis=1)
+        circle_t = t[rows, circle]
+        hit = np.isfinite(circle_t)
+        if hit.any():
+            ray = rows[hit]
+            circle = near[circle[hit]]
+            circle_t = circle_t[hit]
+            offset = origins[ray] + directions[ray] * circle_t[:, None] - centers[circle]
+            length = np.hypot(offset[:, 0], offset[:, 1])
+            inside = (circle_t == 0) | (length == 0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                normal = np.where(inside[:, None], -directions[ray], offset / length[:, None])
+            _take_hits(ray, circle_t, normal, circle_owners[circle], distances, normals, indices)
+
+
+def _take_hits(
+    rays: "np.ndarray",
+    hit_distances: "np.ndarray",
+    hit_normals: "np.ndarray",
+    owners: "np.ndarray",
+    distances: "np.ndarray",
+    normals: "np.ndarray",
+    indices: "np.ndarray",
+) -> None:
+    """Keeps the hits that are closer than the best hit found so far for their ray.
+
+    Args:
+        rays (np.ndarray): Row of each hit, each ray at most once.
+        hit_distances (np.ndarray): Distance of each hit.
+        hit_normals (np.ndarray): Normal of each hit.
+        owners (np.ndarray): Object index of each hit.
+        distances (np.ndarray): Best distance per ray, updated in place.
+        normals (np.ndarray): Best normal per ray, updated in place.
+        indices (np.ndarray): Best object index per ray, updated in place.
+    """
+    closer = hit_distances < distances[rays]
+    rays = rays[closer]
+    distances[rays] = hit_distances[closer]
+    normals[rays] = hit_normals[closer]
+    indices[rays] = owners[closer]
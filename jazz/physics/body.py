@@ -1,6 +1,7 @@
 from ..global_dict import Globals
 from ..utils import Vec2, dist_to
 from ._physics_object import PhysicsObject
+from .ccd import CCD_SKIN, time_of_impact
 
 
 
@@ -12,60 +13,147 @@ class Body(PhysicsObject):
 
         Args:
             static (bool, optional): If True, the object is static (immovable) and acts as an obstacle. Defaults to False.
+            can_sleep (bool, optional): If True, the body may be put to sleep once it comes to rest. Defaults to True.
+            mass (float, optional): Mass used to share contact corrections between bodies. Defaults to 1.
+            restitution (float, optional): Bounciness of contacts, from 0 to 1. Defaults to 0.
+            friction (float, optional): Friction coefficient of contacts. Defaults to 0.2.
+            ccd (bool, optional): If True, moves are swept so the body stops at the first body
+                in its path instead of passing through thin obstacles. Defaults to False.
         """
         kwargs.setdefault("name", "Body")
         super().__init__(**kwargs)
+        self._static = False
         self.static = kwargs.get("static", False)
+        self.can_sleep: bool = kwargs.get("can_sleep", True)
+        self._sleeping = False
+        self._still_frames = 0
+        self.mass: float = kwargs.get("mass", 1.0)
+        self.restitution: float = kwargs.get("restitution", 0.0)
+        self.friction: float = kwargs.get("friction", 0.2)
+        self.ccd: bool = kwargs.get("ccd", False)
+
+    @property
+    def static(self) -> bool:
+        """bool: Whether the body is immovable. Static bodies live in the scene's static index."""
+        return self._static
+
+    @static.setter
+    def static(self, static: bool) -> None:
+        static = bool(static)
+        if static == self._static:
+            return
+        self._static = static
+        if self._loaded and Globals.scene is not None:
+            Globals.scene.remove_physics_object(self)
+            Globals.scene.add_physics_object(self, self._layers)
+
+    def reset(self, **overrides) -> None:
+        """Restores the body for reuse, awake.
 
-    def move_and_collide(self, direction: Vec2, _visited: set[str] | None = None) -> list[tuple[PhysicsObject, tuple[float, Vec2]]]:
-        """Moves the physical body along a direction vector, detects overlaps, resolves penetrations, and handles propagation.
+        Args:
+            **overrides: Values to use instead of the ones the body was created with.
+        """
+        super().reset(**overrides)
+        self._sleeping = False
+        self._still_frames = 0
+
+    @property
+    def inverse_mass(self) -> float:
+        """float: The inverse of the body's mass, 0 for static bodies and bodies without mass."""
+        if self._static or self.mass <= 0:
+            return 0.0
+        return 1.0 / self.mass
+
+    @property
+    def sleeping(self) -> bool:
+        """bool: Whether the body is asleep. Sleeping bodies skip their update and are not re-hashed."""
+        return self._sleeping
+
+    def sleep(self) -> bool:
+        """Puts the body to sleep together with its island. The island stays awake
+        if any of its bodies has can_sleep disabled.
+
+        Returns:
+            bool: True if the island went to sleep.
+        """
+        if not self._loaded:
+            return False
+        return Globals.scene.islands.try_sleep(self, 0)
+
+    def wake(self) -> None:
+        """Wakes the body together with every body in its island."""
+        if self._loaded:
+            Globals.scene.islands.wake(self)
+        else:
+            self._sleeping = False
+            self._still_frames = 0
+
+    def on_transform_change(self) -> None:
+        """Invalidates the static index entry when a static body is explicitly moved,
+        and wakes a sleeping body that was moved or pushed."""
+        super().on_transform_change()
+        if getattr(self, "_static", False) and self._loaded:
+            Globals.scene.mark_static_moved(self)
+        elif getattr(self, "_sleeping", False):
+            self.wake()
+
+    def move_and_collide(self, direction: Vec2) -> list[tuple[PhysicsObject, tuple[float, Vec2]]]:
+        """Moves the physical body along a direction vector and reports the overlaps it ends up in.
+
+        Overlaps are not resolved here. Each one with another Body is handed to the scene's
+        contact solver, which resolves all of the frame's contacts together after the objects update.
+
+        With ccd enabled the move is swept first and cut short at the first body in its
+        path, leaving the body just touching it so the contact is reported.
 
         Args:
             direction (Vec2): The displacement vector for this frame.
-            _visited (set[str], optional): Set of object IDs already processed in the current recursive chain to prevent infinite loops. Defaults to None.
 
         Returns:
             list[tuple[PhysicsObject, tuple[float, Vec2]]]: List of collision tuples containing the hit object and (depth, normal).
         """
-        if _visited is None:
-            _visited = set()
-        if self.id in _visited:
-            return []
-        _visited.add(self.id)
-
+        hit = None
+        if self.ccd and (direction.x or direction.y):
+            direction, hit = self._sweep(direction)
         self.pos = self.pos + direction
         collisions = Globals.scene.get_AABB_collisions(self)
+        # Bounds are whole pixels, so a shallow swept contact can be missed by the broadphase
+        if hit is not None and hit not in collisions:
+            collisions.append(hit)
         precise_collisions = []
 
         if collisions:
-            collisions.sort(key=lambda obj: (obj.pos - self.pos).magnitude_squared())
-            penetrations = []
-            for obj in collisions:
-                depth, normal = self.collider.collide_sat(obj.collider)
+            solver = Globals.scene.contact_solver
+            results = Globals.scene.pair_cache.collide_batch([(self.collider, obj.collider) for obj in collisions])
+            for obj, (depth, normal) in zip(collisions, results):
                 if depth != 0:
-                    penetrations.append((obj, depth, normal))
                     precise_collisions.append((obj, (depth, normal)))
-
-            if penetrations:
-                self_correction = Vec2(0, 0)
-                for obj, depth, normal in penetrations:
-                    if not self.static:
-                        if not obj.static:
-                            self_correction += -normal * (depth + 1) / 2
-                        else:
-                            self_correction += -normal * (depth + 1)
-
-                if not self.static and self_correction != Vec2(0, 0):
-                    self.move(self_correction)
-
-                for obj, depth, normal in penetrations:
-                    if not obj.static:
-                        if not self.static:
-                            obj.move_and_collide(normal * (depth + 1) / 2, _visited)
-                        else:
-                            obj.move_and_collide(normal * (depth + 1), _visited)
+                    # Areas and rays are reported but never pushed against
+                    if isinstance(obj, Body):
+                        solver.add_contact(self, obj, depth, normal)
         return precise_collisions
 
+    def _sweep(self, direction: Vec2) -> tuple[Vec2, PhysicsObject | None]:
+        """Shortens a move to end at the first body the collider would hit.
+
+        Args:
+            direction (Vec2): The displacement of the move.
+
+        Returns:
+            tuple[Vec2, PhysicsObject | None]: The displacement up to the first impact and
+                the body hit, or the full displacement and None if nothing is in the way.
+        """
+        first_impact = 1.0
+        hit = None
+        for obj in Globals.scene.get_swept_collisions(self, direction):
+            if not isinstance(obj, Body):
+                continue
+            # The skin leaves the body slightly inside what it hits, so the contact is reported
+            impact = time_of_impact(self.collider, obj.collider, direction, CCD_SKIN)
+            if impact is not None and impact[0] < first_impact:
+                first_impact = impact[0]
+                hit = obj
+        return direction * first_impact, hit
 
 from ..engine.serializer import Serializer
 
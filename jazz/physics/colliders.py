@@ -14,6 +14,75 @@ from ..utils import (
 from ..primatives import Draw
 
 
+def _segment_circle(start: Vec2, end: Vec2, center: Vec2, radius: float) -> float | None:
+    """Finds where a segment first enters a circle.
+
+    Args:
+        start (Vec2): Start of the segment.
+        end (Vec2): End of the segment.
+        center (Vec2): Center of the circle.
+        radius (float): Radius of the circle.
+
+    Returns:
+        float | None: The fraction of the segment before the circle, 0 if it starts
+            inside, or None if it misses.
+    """
+    offset = start - center
+    c = offset.dot(offset) - radius * radius
+    if c <= 0:
+        return 0.0
+    direction = end - start
+    a = direction.dot(direction)
+    b = offset.dot(direction)
+    if b >= 0 or not a:
+        return None
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    fraction = (-b - discriminant ** 0.5) / a
+    return fraction if fraction <= 1 else None
+
+
+def _segment_polygon(start: Vec2, end: Vec2, vertices: list[Vec2]) -> float | None:
+    """Finds where a segment first enters a convex polygon by clipping it against every edge.
+
+    Args:
+        start (Vec2): Start of the segment.
+        end (Vec2): End of the segment.
+        vertices (list[Vec2]): The polygon's vertices in order.
+
+    Returns:
+        float | None: The fraction of the segment before the polygon, 0 if it starts
+            inside, or None if it misses.
+    """
+    count = len(vertices)
+    center = sum(vertices, Vec2()) / count
+    direction = end - start
+    enter = 0.0
+    leave = 1.0
+    for i in range(count):
+        first = vertices[i]
+        edge = vertices[(i + 1) % count] - first
+        normal = Vec2(edge.y, -edge.x)
+        if normal.dot(center - first) > 0:
+            normal = -normal
+        # Negative when the start lies outside of this edge
+        distance = normal.dot(first - start)
+        speed = normal.dot(direction)
+        if not speed:
+            if distance < 0:
+                return None
+            continue
+        fraction = distance / speed
+        if speed < 0:
+            enter = max(enter, fraction)
+        else:
+            leave = min(leave, fraction)
+        if enter > leave:
+            return None
+    return enter
+
+
 class Collider(GameObject):
     """Base class for collision shapes in the Jazz Engine scene graph."""
 
@@ -45,15 +114,21 @@ class Collider(GameObject):
         self._cached_vertices = []
         self._cached_edges = []
         self._cached_normals = []
+        # Local vertex array packed by the batched narrowphase, reset when the shape changes
+        self._local_arrays = None
+        # Bumped whenever the world space shape changes, used to validate cached contacts
+        self._version = 0
 
     def on_transform_change(self) -> None:
         """Updates internal dirty flags, recalculates world bounding box, and computes local shape properties if not already cached."""
         self._vertices_dirty = True
+        self._version += 1
         if self._parent is not None:
             if hasattr(self._parent, "_moved_this_frame"):
                 self._parent._moved_this_frame = True
 
         if not self._edges:
+            self._local_arrays = None
             self._size = len(self._vertices)
             if self._size > 1:
                 self._center = Vec2()
@@ -254,6 +329,36 @@ class Collider(GameObject):
         else:
             return depth, -normal
 
+    def intersect_segment(self, start: Vec2, end: Vec2) -> float | None:
+        """Finds where a line segment first touches the collider.
+
+        Args:
+            start (Vec2): Start of the segment in world space.
+            end (Vec2): End of the segment in world space.
+
+        Returns:
+            float | None: The fraction of the segment before the shape, 0 if it starts
+                inside, or None if it misses.
+        """
+        vertices = self.vertices
+        if len(vertices) < 3:
+            return None
+        return _segment_polygon(start, end, vertices)
+
+    def collide(self, collider: "Collider") -> tuple[float, Vec2]:
+        """Tests against another collider, using a closed-form test for the shape pair
+        when one exists and falling back to collide_sat otherwise.
+
+        Args:
+            collider (Collider): The other collider to check.
+
+        Returns:
+            tuple[float, Vec2]: Minimum penetration depth and the normalized collision normal pointing towards the other collider. Returns (0, Vec2()) if not colliding.
+        """
+        from .narrowphase import collide
+
+        return collide(self, collider)
+
     @property
     def vertices(self):
         """list[Vec2]: Gets the list of vertices rotated and translated in world space."""
@@ -399,6 +504,18 @@ class CircleCollider(Collider):
             min_v, max_v = max_v, min_v
         return min_v, max_v
 
+    def intersect_segment(self, start: Vec2, end: Vec2) -> float | None:
+        """Finds where a line segment first touches the circle.
+
+        Args:
+            start (Vec2): Start of the segment in world space.
+            end (Vec2): End of the segment in world space.
+
+        Returns:
+            float | None: The fraction of the segment before the circle, or None if it misses.
+        """
+        return _segment_circle(start, end, self.pos, self._radius)
+
     def render_debug(self, offset: Vec2) -> None:
         """Renders circle bounds in debug mode.
 
@@ -449,6 +566,123 @@ class PolyCollider(Collider):
                 self._vertices[i] = vert
             self._center = Vec2()
             self._vertices_dirty = True
+            self._local_arrays = None
+            self._version += 1
+
+
+class CapsuleCollider(Collider):
+    """Collider shape representing a capsule, a line segment swept by a circle."""
+
+    def __init__(self, radius: float | int = 0, length: float | int = 0, **kwargs) -> None:
+        """Initializes the CapsuleCollider.
+
+        The core segment runs along the local x axis, centered on the collider.
+
+        Args:
+            radius (float | int, optional): Radius of the rounded ends. Defaults to 0.
+            length (float | int, optional): Length of the core segment, not counting the ends. Defaults to 0.
+        """
+        self._capsule_radius = radius
+        self._length = length
+        kwargs["radius"] = radius
+        kwargs["length"] = length
+        self._vertices = [Vec2(-length / 2, 0), Vec2(length / 2, 0)]
+        super().__init__(**kwargs)
+        self.collider_type = "Capsule"
+
+    def on_transform_change(self) -> None:
+        """Updates the collider and keeps the bounding radius covering the rounded ends."""
+        super().on_transform_change()
+        self._radius = self._length / 2 + self._capsule_radius
+
+    @property
+    def radius(self) -> float:
+        """float: Radius of the rounded ends."""
+        return self._capsule_radius
+
+    @property
+    def length(self) -> float:
+        """float: Length of the core segment."""
+        return self._length
+
+    @property
+    def segment(self) -> tuple[Vec2, Vec2]:
+        """tuple[Vec2, Vec2]: The end points of the core segment in world space."""
+        vertices = self.vertices
+        return vertices[0], vertices[1]
+
+    def project(self, axis: Vec2) -> tuple[float, float]:
+        """Projects the capsule onto a target axis.
+
+        Args:
+            axis (Vec2): Projection axis.
+
+        Returns:
+            tuple[float, float]: Projection boundaries.
+        """
+        start, end = self.vertices
+        first = start.dot(axis)
+        second = end.dot(axis)
+        if first > second:
+            first, second = second, first
+        return first - self._capsule_radius, second + self._capsule_radius
+
+    def intersect_segment(self, start: Vec2, end: Vec2) -> float | None:
+        """Finds where a line segment first touches the capsule, tested against its two
+        end circles and the rectangle between them.
+
+        Args:
+            start (Vec2): Start of the segment in world space.
+            end (Vec2): End of the segment in world space.
+
+        Returns:
+            float | None: The fraction of the segment before the capsule, or None if it misses.
+        """
+        first, second = self.vertices
+        radius = self._capsule_radius
+        hits = [_segment_circle(start, end, first, radius), _segment_circle(start, end, second, radius)]
+        if first != second and radius:
+            side = (second - first).normalize().rotate(90) * radius
+            hits.append(_segment_polygon(start, end, [first + side, second + side, second - side, first - side]))
+        hits = [hit for hit in hits if hit is not None]
+        return min(hits) if hits else None
+
+    def render_debug(self, offset: Vec2) -> None:
+        """Renders the capsule outline in debug mode.
+
+        Args:
+            offset (Vec2): Viewport offset.
+        """
+        super().render_debug(offset)
+        start, end = self.vertices
+        Draw.circle(start + offset, self._capsule_radius, Color("white"), 2)
+        Draw.circle(end + offset, self._capsule_radius, Color("white"), 2)
+        if start != end:
+            side = (end - start).normalize().rotate(90) * self._capsule_radius
+            Draw.line(start + side + offset, end + side + offset, Color("white"), 2)
+            Draw.line(start - side + offset, end - side + offset, Color("white"), 2)
+
+    def get_rect(self) -> pygame.Rect:
+        """Calculates bounding box of the capsule.
+
+        Uses cached bounds if rotation hasn't changed.
+
+        Returns:
+            Rect: The bounding rectangle in world space.
+        """
+        if self._rot_cache != self.rotation:
+            offset = Vec2(self._length / 2, 0).rotate(self.rotation)
+            self._right = abs(offset.x) + self._capsule_radius
+            self._bottom = abs(offset.y) + self._capsule_radius
+            self._left = -self._right
+            self._top = -self._bottom
+            self._rot_cache = self.rotation
+        return pygame.Rect(
+            self.left,
+            self.top,
+            self.right - self.left,
+            self.bottom - self.top,
+        )
 
 
 class RayCollider(Collider):
@@ -476,6 +710,27 @@ class RayCollider(Collider):
         self._length = length
         self._vertices[1] = Vec2(length, 0)
         self._vertices_dirty = True
+        self._local_arrays = None
+        self._version += 1
+
+    def intersect_segment(self, start: Vec2, end: Vec2) -> float | None:
+        """Finds where a line segment crosses the ray segment.
+
+        Args:
+            start (Vec2): Start of the segment in world space.
+            end (Vec2): End of the segment in world space.
+
+        Returns:
+            float | None: The fraction of the segment before the crossing, or None if they do not cross.
+        """
+        if start == end:
+            return None
+        first, second = self.vertices
+        point = line_intersection(start, end, first, second)
+        if point is None:
+            return None
+        length = (end - start).length()
+        return (point - start).length() / length if length else 0.0
 
     def collide_ray(self, collider: Collider) -> Vec2 | None:
         """Calculates collision intersection points of the ray segment with another collider.
@@ -490,6 +745,10 @@ class RayCollider(Collider):
             return line_circle(
                 self.pos, self.vertices[1], collider.pos, collider._radius
             )
+        elif collider.collider_type == "Tile":
+            start, end = self.vertices
+            fraction = collider.intersect_segment(start, end)
+            return None if fraction is None else start.lerp(end, fraction)
         else:
             collisions = []
             ray = self.vertices
@@ -557,4 +816,5 @@ Serializer.register_class(Collider)
 Serializer.register_class(RectCollider)
 Serializer.register_class(CircleCollider)
 Serializer.register_class(PolyCollider)
+Serializer.register_class(CapsuleCollider)
 Serializer.register_class(RayCollider)
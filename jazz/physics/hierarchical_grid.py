@@ -0,0 +1,320 @@
+from math import ceil, log2
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+    from .colliders import Collider
+
+
+class HierarchicalGrid:
+    """A multi-level spatial hash with power-of-two cell sizes.
+
+    Level n has cells of base_size * 2**n. Each object is inserted at the smallest
+    level whose cells are at least as large as its bounds, so every object occupies
+    at most four cells no matter how big it is. Queries visit only the levels that
+    hold objects and probe the cells overlapping the query box, plus a small margin,
+    instead of a fixed ring of neighbouring cells.
+
+    With auto_tune enabled the base cell size follows the median collider size, and
+    occupancy and probe counts are collected for inspection through stats().
+    """
+
+    def __init__(self, base_size: float = 16.0, margin: float = 8.0, auto_tune: bool = False) -> None:
+        """Initializes the HierarchicalGrid.
+
+        Args:
+            base_size (float, optional): Cell size of the finest level. Defaults to 16.0.
+            margin (float, optional): Distance query boxes are grown by, so objects that
+                moved since the last build are still found. Defaults to 8.0.
+            auto_tune (bool, optional): Whether to pick the base cell size from the
+                collider size distribution during builds. Defaults to False.
+        """
+        self._objects: list["PhysicsObject"] = []
+        self._object_set: set["PhysicsObject"] = set()
+        self._dirty: set["PhysicsObject"] = set()
+        self._masks: dict["PhysicsObject", int] = {}
+        self._base_size = float(base_size)
+        self._margin = margin
+        self._auto_tune = auto_tune
+        self._tuned_count = 0
+
+        # level -> cell (x, y) -> objects, and each object's (level, x0, x1, y0, y1) placement
+        self.levels: dict[int, dict[tuple[int, int], list["PhysicsObject"]]] = {}
+        self._level_counts: dict[int, int] = {}
+        self._placements: dict["PhysicsObject", tuple[int, int, int, int, int]] = {}
+
+        self._queries = 0
+        self._probed_cells = 0
+
+    def __repr__(self) -> str:
+        return f"\nHierarchicalGrid: {self._objects}"
+
+    @property
+    def base_size(self) -> float:
+        """float: Cell size of the finest level."""
+        return self._base_size
+
+    def cell_size(self, level: int) -> float:
+        """Gets the cell size of a level.
+
+        Args:
+            level (int): The level number.
+
+        Returns:
+            float: The cell size.
+        """
+        return self._base_size * (1 << level)
+
+    def level_for(self, extent: float) -> int:
+        """Finds the smallest level whose cells are at least as large as an extent.
+
+        Args:
+            extent (float): The largest side of an object's bounds.
+
+        Returns:
+            int: The level number.
+        """
+        if extent <= self._base_size:
+            return 0
+        return int(ceil(log2(extent / self._base_size)))
+
+    def add_object(self, physics_object: "PhysicsObject", mask: int = -1) -> None:
+        """Adds a physical object to the grid. It is hashed on the next build.
+
+        Args:
+            physics_object (PhysicsObject): The object to add.
+            mask (int, optional): Layer bitmask stored with the entry and matched against query masks. Defaults to all layers.
+        """
+        self._masks[physics_object] = mask
+        if physics_object not in self._object_set:
+            self._object_set.add(physics_object)
+            self._objects.append(physics_object)
+        self._dirty.add(physics_object)
+
+    def remove_object(self, physics_object: "PhysicsObject") -> None:
+        """Removes a physical object from the grid.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+        """
+        if physics_object in self._object_set:
+            self._object_set.remove(physics_object)
+            self._objects.remove(physics_object)
+        self._dirty.discard(physics_object)
+        self._masks.pop(physics_object, None)
+        placement = self._placements.pop(physics_object, None)
+        if placement is not None:
+            self._unlink(physics_object, placement)
+
+    def _unlink(self, physics_object: "PhysicsObject", placement: tuple[int, int, int, int, int]) -> None:
+        """Removes an object from the cells of a placement.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+            placement (tuple[int, int, int, int, int]): The level and cell range it occupies.
+        """
+        level, x0, x1, y0, y1 = placement
+        cells = self.levels[level]
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells[(x, y)]
+                cell.remove(physics_object)
+                if not cell:
+                    del cells[(x, y)]
+        self._level_counts[level] -= 1
+        if not self._level_counts[level]:
+            del self._level_counts[level]
+            del self.levels[level]
+
+    def _update_cells(self, physics_object: "PhysicsObject") -> None:
+        """Re-hashes a single object if its level or cell range changed.
+
+        Args:
+            physics_object (PhysicsObject): The object to re-hash.
+        """
+        rect = physics_object.collider.get_rect()
+        level = self.level_for(max(rect.width, rect.height))
+        size = self.cell_size(level)
+        placement = (
+            level,
+            int(rect.left // size),
+            int(rect.right // size),
+            int(rect.top // size),
+            int(rect.bottom // size),
+        )
+        old_placement = self._placements.get(physics_object)
+        if old_placement == placement:
+            return
+        if old_placement is not None:
+            self._unlink(physics_object, old_placement)
+        self._placements[physics_object] = placement
+
+        cells = self.levels.setdefault(level, {})
+        self._level_counts[level] = self._level_counts.get(level, 0) + 1
+        _, x0, x1, y0, y1 = placement
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                if cell is None:
+                    cells[(x, y)] = [physics_object]
+                else:
+                    cell.append(physics_object)
+
+    def build_grid(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Re-hashes newly added and moved objects, re-tuning the base size first if enabled.
+
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every tracked object is checked. Defaults to None.
+        """
+        if self._auto_tune and self._needs_tuning():
+            self.tune()
+        if moved is None:
+            for physics_object in self._objects:
+                self._update_cells(physics_object)
+        else:
+            tracked = self._object_set
+            dirty = self._dirty
+            for physics_object in dirty:
+                self._update_cells(physics_object)
+            for physics_object in moved:
+                if physics_object in tracked and physics_object not in dirty:
+                    self._update_cells(physics_object)
+        self._dirty.clear()
+
+    def _needs_tuning(self) -> bool:
+        """Checks whether the object count has halved or doubled since the last tune.
+
+        Returns:
+            bool: True if the base size should be re-tuned.
+        """
+        count = len(self._objects)
+        if not count:
+            return False
+        return not self._tuned_count or count >= self._tuned_count * 2 or count * 2 <= self._tuned_count
+
+    def tune(self) -> float:
+        """Sets the base cell size to the median collider size rounded up to a power of two.
+
+        Every object is re-hashed if the base size changes.
+
+        Returns:
+            float: The chosen base cell size.
+        """
+        self._tuned_count = len(self._objects)
+        if not self._objects:
+            return self._base_size
+        extents = sorted(
+            max(rect.width, rect.height, 1)
+            for rect in (physics_object.collider.get_rect() for physics_object in self._objects)
+        )
+        median = extents[len(extents) // 2]
+        base_size = float(1 << int(ceil(log2(median))))
+        if base_size != self._base_size:
+            self._base_size = base_size
+            self.levels.clear()
+            self._level_counts.clear()
+            self._placements.clear()
+            self._dirty.update(self._objects)
+        return self._base_size
+
+    def stats(self) -> dict[str, Any]:
+        """Reports the grid occupancy and how many cells queries probed since the last reset.
+
+        Returns:
+            dict[str, Any]: The base size, per level object counts, occupied cell count,
+                query count, probed cell count and average probes per query.
+        """
+        return {
+            "base_size": self._base_size,
+            "levels": dict(sorted(self._level_counts.items())),
+            "occupied_cells": sum(len(cells) for cells in self.levels.values()),
+            "queries": self._queries,
+            "probed_cells": self._probed_cells,
+            "probes_per_query": self._probed_cells / self._queries if self._queries else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """Resets the query and probe counters."""
+        self._queries = 0
+        self._probed_cells = 0
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> list["PhysicsObject"]:
+        """Finds objects whose cells overlap a box, grown by the grid margin.
+
+        Args:
+            left (float): Left boundary of the query box.
+            top (float): Top boundary of the query box.
+            right (float): Right boundary of the query box.
+            bottom (float): Bottom boundary of the query box.
+
+        Returns:
+            list[PhysicsObject]: Unique candidate objects.
+        """
+        margin = self._margin
+        left -= margin
+        top -= margin
+        right += margin
+        bottom += margin
+        found: dict["PhysicsObject", None] = {}
+        probed = 0
+        for level, cells in self.levels.items():
+            size = self.cell_size(level)
+            x0, x1 = int(left // size), int(right // size)
+            y0, y1 = int(top // size), int(bottom // size)
+            span = (x1 - x0 + 1) * (y1 - y0 + 1)
+            if span > len(cells):
+                # Fewer occupied cells than cells covered, walk the occupied ones instead
+                probed += len(cells)
+                for (x, y), cell in cells.items():
+                    if x0 <= x <= x1 and y0 <= y <= y1:
+                        found.update(dict.fromkeys(cell))
+            else:
+                probed += span
+                for x in range(x0, x1 + 1):
+                    for y in range(y0, y1 + 1):
+                        cell = cells.get((x, y))
+                        if cell is not None:
+                            found.update(dict.fromkeys(cell))
+        self._queries += 1
+        self._probed_cells += probed
+        return list(found)
+
+    def get_AABB_collisions(self, collider: "PhysicsObject", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping the bounds of a query collider.
+
+        Args:
+            collider (PhysicsObject): The object querying collisions.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate objects whose bounding boxes overlap.
+        """
+        rect = collider.collider.get_rect()
+        masks = self._masks
+        return [
+            physics_object
+            for physics_object in self.query(rect.left, rect.top, rect.right, rect.bottom)
+            if physics_object is not collider
+            and (mask is None or masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider.collider)
+        ]
+
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping a basic Collider object bounds.
+
+        Args:
+            collider (Collider): The shape collider to check.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate overlapping objects.
+        """
+        masks = self._masks
+        return [
+            physics_object
+            for physics_object in self.query(collider.left, collider.top, collider.right, collider.bottom)
+            if physics_object.collider is not collider
+            and (mask is None or masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider)
+        ]
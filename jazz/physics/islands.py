@@ -0,0 +1,197 @@
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from .body import Body
+
+
+class IslandGraph:
+    """Tracks which bodies touch each other so resting groups sleep and wake together.
+
+    An island is a group of non-static bodies connected through contacts. Static
+    bodies are kept as neighbours, so moving or removing one wakes whatever rests on
+    it, but islands never extend through them.
+
+    A failed sleep check remembers the member that blocked it. Later checks from the
+    same body return straight away while that member is still not ready and no contact
+    has been removed since, because adding contacts can never unblock an island.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty IslandGraph."""
+        # Body -> touching body -> how many of the two reported the contact (1 or 2)
+        self._contacts: dict["Body", dict["Body", int]] = {}
+        # Body -> the contacts it reported itself last
+        self._reported: dict["Body", set["Body"]] = {}
+        # Body -> the member that blocked its last sleep check and the removal count then
+        self._blocked: dict["Body", tuple["Body", int]] = {}
+        self._removals = 0
+
+    def __repr__(self) -> str:
+        return f"\nIslandGraph: {self._contacts}"
+
+    def set_contacts(self, body: "Body", others: Iterable["Body"]) -> bool:
+        """Replaces the contacts a body reports. Two bodies stay connected while either
+        of them reports the other.
+
+        Args:
+            body (Body): The body reporting its contacts.
+            others (Iterable[Body]): The bodies it is touching this frame.
+
+        Returns:
+            bool: True if the body's report differs from its previous one.
+        """
+        old = self._reported.get(body, set())
+        new = {other for other in others if other is not body and hasattr(other, "_sleeping")}
+        if new == old:
+            return False
+        for other in old - new:
+            self._unlink(body, other)
+        for other in new - old:
+            self._link(body, other)
+        if new:
+            self._reported[body] = new
+        else:
+            self._reported.pop(body, None)
+        return True
+
+    def _link(self, first: "Body", second: "Body") -> None:
+        contacts = self._contacts
+        for a, b in ((first, second), (second, first)):
+            neighbours = contacts.setdefault(a, {})
+            neighbours[b] = neighbours.get(b, 0) + 1
+
+    def _unlink(self, first: "Body", second: "Body") -> None:
+        contacts = self._contacts
+        for a, b in ((first, second), (second, first)):
+            neighbours = contacts.get(a)
+            if neighbours is None or b not in neighbours:
+                continue
+            neighbours[b] -= 1
+            if not neighbours[b]:
+                del neighbours[b]
+                if a is first:
+                    self._removals += 1
+                if not neighbours:
+                    del contacts[a]
+
+    def contacts(self, body: "Body") -> set["Body"]:
+        """Gets the bodies a body is recorded as touching.
+
+        Args:
+            body (Body): The body to look up.
+
+        Returns:
+            set[Body]: The touching bodies.
+        """
+        return set(self._contacts.get(body, ()))
+
+    def remove(self, body: "Body") -> None:
+        """Removes a body from the graph and wakes every body that was touching it.
+
+        Args:
+            body (Body): The body to remove.
+        """
+        neighbours = self._contacts.pop(body, {})
+        self._reported.pop(body, None)
+        self._blocked.pop(body, None)
+        self._removals += 1
+        for other in neighbours:
+            others = self._contacts.get(other)
+            if others is not None:
+                others.pop(body, None)
+                if not others:
+                    del self._contacts[other]
+            reported = self._reported.get(other)
+            if reported is not None:
+                reported.discard(body)
+        for other in neighbours:
+            self.wake(other)
+
+    def island(self, body: "Body") -> set["Body"]:
+        """Collects the island a body belongs to.
+
+        Args:
+            body (Body): The body to start from.
+
+        Returns:
+            set[Body]: Every non-static body connected to it through contacts.
+        """
+        if body.static:
+            return set()
+        island = {body}
+        stack = [body]
+        contacts = self._contacts
+        while stack:
+            for other in contacts.get(stack.pop(), ()):
+                if other not in island and not other.static:
+                    island.add(other)
+                    stack.append(other)
+        return island
+
+    def try_sleep(self, body: "Body", frames: int) -> bool:
+        """Puts a body's island to sleep if every member has been still long enough.
+
+        The island is walked only until the first member that is not ready, and while
+        that member stays unready the check is not repeated, so a large settled pile with
+        one body still moving is cheap to reject every frame.
+
+        Args:
+            body (Body): The body that became ready to sleep.
+            frames (int): Number of still frames each member needs.
+
+        Returns:
+            bool: True if the island went to sleep.
+        """
+        if body.static:
+            return False
+        blocked = self._blocked.get(body)
+        if blocked is not None and blocked[1] == self._removals and not self._ready(blocked[0], frames):
+            return False
+        island = {body}
+        stack = [body]
+        contacts = self._contacts
+        while stack:
+            member = stack.pop()
+            if not self._ready(member, frames):
+                self._blocked[body] = (member, self._removals)
+                return False
+            for other in contacts.get(member, ()):
+                if other not in island and not other.static:
+                    island.add(other)
+                    stack.append(other)
+        for member in island:
+            member._sleeping = True
+            self._blocked.pop(member, None)
+        return True
+
+    @staticmethod
+    def _ready(body: "Body", frames: int) -> bool:
+        """Checks whether a body lets its island sleep.
+
+        Args:
+            body (Body): The body to check.
+            frames (int): Number of still frames it needs.
+
+        Returns:
+            bool: True if the body may sleep and has been still long enough.
+        """
+        return body.can_sleep and body._still_frames >= frames
+
+    def wake(self, body: "Body") -> None:
+        """Wakes a body together with the rest of its island.
+
+        Args:
+            body (Body): The body to wake.
+        """
+        for member in self.island(body):
+            member._sleeping = False
+            member._still_frames = 0
+
+    def wake_neighbours(self, body: "Body") -> None:
+        """Wakes the islands of every body touching a body, used when a static body moves.
+
+        Args:
+            body (Body): The body whose neighbours to wake.
+        """
+        for other in list(self._contacts.get(body, ())):
+            self.wake(other)
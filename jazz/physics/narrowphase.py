@@ -0,0 +1,801 @@
+from math import sqrt
+from typing import TYPE_CHECKING, Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from ..utils import Vec2, direction_to
+from .colliders import CapsuleCollider, CircleCollider, Collider
+
+if TYPE_CHECKING:
+    from .parallel import NarrowphaseExecutor
+
+# Below this many pairs the per-pair Python SAT is faster than packing arrays
+BATCH_THRESHOLD = 8
+# Edges whose direction is within this sine of an axis' perpendicular share its feature id
+FEATURE_TOLERANCE = 1e-9
+
+
+def _local_arrays(collider: Collider) -> tuple["np.ndarray", float, float, float]:
+    """Gets a collider's local vertices as an array, with its local center and radius.
+
+    The result is cached on the collider until its shape changes.
+
+    Args:
+        collider (Collider): The collider to pack.
+
+    Returns:
+        tuple[np.ndarray, float, float, float]: The (V, 2) local vertex array, the local
+            center x and y, and the radius for circles or 0 otherwise.
+    """
+    arrays = collider._local_arrays
+    if arrays is None:
+        arrays = collider._local_arrays = (
+            np.array([(vert.x, vert.y) for vert in collider._vertices], dtype=np.float64),
+            collider._center.x,
+            collider._center.y,
+            _sat_radius(collider),
+        )
+    return arrays
+
+
+def _sat_radius(collider: Collider) -> float:
+    """Gets the radius SAT adds around a collider's vertices.
+
+    Args:
+        collider (Collider): The collider to check.
+
+    Returns:
+        float: The circle or capsule radius, 0 for other shapes.
+    """
+    if isinstance(collider, CircleCollider):
+        return float(collider._radius)
+    if isinstance(collider, CapsuleCollider):
+        return float(collider._capsule_radius)
+    return 0.0
+
+
+def _kind(collider: Collider) -> int:
+    """Classifies a collider by the axes it contributes to SAT.
+
+    Args:
+        collider (Collider): The collider to classify.
+
+    Returns:
+        int: 0 for a single vertex shape, 1 for a segment and 2 for a polygon.
+    """
+    size = collider._size
+    return 0 if size == 1 else 1 if size == 2 else 2
+
+
+def collide_sat_batch(pairs: Iterable[tuple[Collider, Collider]]) -> list[tuple[float, Vec2]]:
+    """Runs the Separating Axis Theorem on many collider pairs at once.
+
+    Results match calling first.collide_sat(second) for each pair. When numpy is
+    installed and there are at least BATCH_THRESHOLD pairs, the pairs are sorted into a
+    few groups by shape kind. For each group the local vertices are stacked, moved into
+    world space, and the edge normals, projections, overlaps and minimum penetrations are
+    computed in a few vectorized operations. Otherwise each pair falls back to
+    Collider.collide_sat.
+
+    Args:
+        pairs (Iterable[tuple[Collider, Collider]]): The collider pairs to test.
+
+    Returns:
+        list[tuple[float, Vec2]]: Penetration depth and collision normal pointing from the
+            first to the second collider for each pair, (0, Vec2()) where they do not touch.
+    """
+    pairs = list(pairs)
+    if np is None or len(pairs) < BATCH_THRESHOLD:
+        return [first.collide_sat(second) for first, second in pairs]
+    return [result[:2] for result in _sat_batch(pairs)]
+
+
+def sat_features(first: Collider, second: Collider) -> tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]:
+    """Runs the same test as Collider.collide_sat, also reporting which axis decided it.
+
+    Args:
+        first (Collider): The first collider.
+        second (Collider): The second collider.
+
+    Returns:
+        tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]: The depth and normal as
+            returned by collide_sat, the axis that separated the shapes or None if they
+            touch, and the reference feature of the contact or None if they do not touch.
+            The feature is (0, i) when the reference axis is the normal of edge i of the
+            first shape, (1, i) for an edge of the second shape, or (2, 0) for the axis
+            towards a circle's closest vertex. Parallel edges report the first of them.
+    """
+    first_axes = first.normals
+    second_axes = second.normals
+    axes = first_axes + second_axes
+    if first._size == 1:
+        axes.append(_closest_vertex_axis(first.center, second.vertices))
+    elif second._size == 1:
+        axes.append(_closest_vertex_axis(second.center, first.vertices))
+
+    depth = 1000000.0
+    best = -1
+    for i, axis in enumerate(axes):
+        first_min, first_max = first.project(axis)
+        second_min, second_max = second.project(axis)
+        if first_max < second_min or second_max < first_min:
+            return 0, Vec2(), Vec2(axis), None
+        axis_depth = min(second_max - first_min, first_max - second_min)
+        if axis_depth < depth:
+            depth = axis_depth
+            best = i
+
+    normal = Vec2(axes[best]) if best >= 0 else Vec2()
+    if normal.length() == 0:
+        normal = Vec2(1, 0)
+    else:
+        normal.normalize_ip()
+    if normal.dot(direction_to(first.center, second.center)) <= 0:
+        normal = -normal
+
+    first_count = len(first_axes)
+    if best < first_count:
+        feature = (0, _edge_feature(first, axes[best]))
+    elif best < first_count + len(second_axes):
+        feature = (1, _edge_feature(second, axes[best]))
+    else:
+        feature = (2, 0)
+    return depth, normal, None, feature
+
+
+def _edge_feature(collider: Collider, axis: Vec2) -> int:
+    """Finds the first edge of a collider perpendicular to one of its normals.
+
+    Args:
+        collider (Collider): The collider owning the axis.
+        axis (Vec2): A unit edge normal of the collider.
+
+    Returns:
+        int: The edge index.
+    """
+    for i, (start, end) in enumerate(collider.edges):
+        edge = end - start
+        length = edge.length()
+        if length and abs(edge.dot(axis)) <= FEATURE_TOLERANCE * length:
+            return i
+    return 0
+
+
+def _closest_vertex_axis(center: Vec2, vertices: list[Vec2]) -> Vec2:
+    """Gets the axis from a circle's center to the closest vertex off its center.
+
+    Args:
+        center (Vec2): The circle's center.
+        vertices (list[Vec2]): The other shape's vertices.
+
+    Returns:
+        Vec2: The unit axis, or a zero vector if every vertex lies on the center.
+    """
+    normal = Vec2()
+    min_dist = 1000000.0
+    for vert in vertices:
+        offset = vert - center
+        length = offset.length()
+        if length < min_dist and length != 0:
+            min_dist = length
+            normal = offset / length
+    return normal
+
+
+def sat_features_batch(pairs: list[tuple[Collider, Collider]]) -> list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]:
+    """Runs sat_features on many collider pairs, vectorized like collide_sat_batch.
+
+    Args:
+        pairs (list[tuple[Collider, Collider]]): The collider pairs to test.
+
+    Returns:
+        list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]: The result of
+            sat_features for each pair.
+    """
+    if np is None or len(pairs) < BATCH_THRESHOLD:
+        return [sat_features(first, second) for first, second in pairs]
+    return _sat_batch(pairs)
+
+
+def warm_caches(pairs: list[tuple[Collider, Collider]]) -> None:
+    """Fills the lazy caches of every collider in a batch so worker threads only read them.
+
+    Colliders compute their world transform, bounds, vertices, edges, normals and local
+    arrays on first use, resetting the dependent caches as they go. Two threads filling
+    them at once can see another's half-reset state, so a batch is warmed on the calling
+    thread before it is split.
+
+    Args:
+        pairs (list[tuple[Collider, Collider]]): The collider pairs about to be tested.
+    """
+    seen = set()
+    for pair in pairs:
+        for collider in pair:
+            if collider in seen:
+                continue
+            seen.add(collider)
+            collider.get_rect()
+            collider.normals
+            if np is not None:
+                _local_arrays(collider)
+
+
+def full_tests(
+    pairs: list[tuple[Collider, Collider]],
+) -> list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]:
+    """Runs the complete test of many pairs, using closed-form tests where they exist.
+
+    Args:
+        pairs (list[tuple[Collider, Collider]]): The collider pairs to test.
+
+    Returns:
+        list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]: The depth, normal,
+            separating axis and feature of each pair as in sat_features. Pairs solved in
+            closed form report neither an axis nor a feature.
+    """
+    results: list[tuple | None] = []
+    sat = []
+    sat_indexes = []
+    for first, second in pairs:
+        result = collide_analytic(first, second)
+        if result is None:
+            sat_indexes.append(len(results))
+            sat.append((first, second))
+            results.append(None)
+        else:
+            results.append((result[0], result[1], None, None))
+    if sat:
+        for i, result in zip(sat_indexes, sat_features_batch(sat)):
+            results[i] = result
+    return results
+
+
+def _sat_batch(pairs: list[tuple[Collider, Collider]]) -> list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]:
+    """Groups pairs by shape kind and runs the vectorized SAT on each group.
+
+    Args:
+        pairs (list[tuple[Collider, Collider]]): The collider pairs to test.
+
+    Returns:
+        list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]: The depth, normal,
+            separating axis and feature of each pair, see sat_features.
+    """
+    results: list[tuple | None] = [None] * len(pairs)
+    groups: dict[tuple[int, int], list[int]] = {}
+    for i, (first, second) in enumerate(pairs):
+        key = (_kind(first), _kind(second))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = []
+        group.append(i)
+
+    for (first_kind, second_kind), indexes in groups.items():
+        group = [pairs[i] for i in indexes]
+        for i, result in zip(indexes, _collide_group(group, first_kind, second_kind)):
+            results[i] = result
+    return results
+
+
+def _pack(colliders: list[Collider]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Moves the local vertices of many colliders into world space in one operation.
+
+    Short vertex lists are padded by repeating their first vertex, which changes
+    neither the projection extents nor the closing edge of a polygon.
+
+    Args:
+        colliders (list[Collider]): The colliders to pack.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The (P, V, 2) world vertices, the
+            (P, 2) world centers and the (P,) radii.
+    """
+    local = []
+    transforms = []
+    for collider in colliders:
+        arrays = _local_arrays(collider)
+        local.append(arrays[0])
+        pos = collider.pos
+        transforms.append((pos.x, pos.y, collider.rotation, arrays[1], arrays[2], arrays[3]))
+    width = max(len(verts) for verts in local)
+    verts = np.array([
+        row if len(row) == width else np.concatenate((row, np.repeat(row[:1], width - len(row), axis=0)))
+        for row in local
+    ])
+    transforms = np.array(transforms, dtype=np.float64)
+    angles = np.radians(transforms[:, 2])
+    cos = np.cos(angles)[:, None]
+    sin = np.sin(angles)[:, None]
+    world = np.empty_like(verts)
+    world[..., 0] = verts[..., 0] * cos - verts[..., 1] * sin + transforms[:, 0, None]
+    world[..., 1] = verts[..., 0] * sin + verts[..., 1] * cos + transforms[:, 1, None]
+    centers = transforms[:, 0:2] + transforms[:, 3:5]
+    return world, centers, transforms[:, 5]
+
+
+def _edge_normals(verts: "np.ndarray", kind: int) -> "np.ndarray":
+    """Computes the unit edge normals of stacked shapes.
+
+    Parallel edges contribute duplicate axes and padded vertices contribute zero
+    length edges whose axes are replaced by the shape's first normal. Neither changes
+    the SAT result, since duplicates always come after the axis they repeat.
+
+    Args:
+        verts (np.ndarray): (P, V, 2) world vertices.
+        kind (int): The shape kind, see _kind.
+
+    Returns:
+        np.ndarray: (P, N, 2) unit normals, N is 0 for single vertex shapes.
+    """
+    if kind == 0:
+        return np.empty((len(verts), 0, 2))
+    if kind == 1:
+        edges = verts[:, 1:2] - verts[:, 0:1]
+    else:
+        edges = np.roll(verts, -1, axis=1) - verts
+    lengths = np.hypot(edges[..., 0], edges[..., 1])
+    normals = np.empty_like(edges)
+    normals[..., 0] = -edges[..., 1]
+    normals[..., 1] = edges[..., 0]
+    degenerate = lengths == 0
+    lengths[degenerate] = 1.0
+    normals /= lengths[..., None]
+    if degenerate.any():
+        rows, cols = np.nonzero(degenerate)
+        normals[rows, cols] = normals[rows, 0]
+    return normals
+
+
+def _point_axes(centers: "np.ndarray", verts: "np.ndarray") -> "np.ndarray":
+    """Finds the axes from single vertex shapes to the closest vertex of the other shape.
+
+    Mirrors the extra axis Collider.collide_sat adds for circles, vertices lying on the
+    center are skipped and a zero axis is returned if every vertex does.
+
+    Args:
+        centers (np.ndarray): (P, 2) centers of the single vertex shapes.
+        verts (np.ndarray): (P, V, 2) vertices of the other shapes.
+
+    Returns:
+        np.ndarray: (P, 1, 2) unit axes, or zero where no vertex is off center.
+    """
+    offsets = verts - centers[:, None, :]
+    lengths = np.hypot(offsets[..., 0], offsets[..., 1])
+    masked = np.where(lengths == 0, np.inf, lengths)
+    closest = masked.argmin(axis=1)
+    rows = np.arange(len(verts))
+    length = masked[rows, closest]
+    axes = np.zeros((len(verts), 1, 2))
+    found = length < 1000000.0
+    axes[found, 0] = offsets[rows, closest][found] / length[found, None]
+    return axes
+
+
+def _collide_group(
+    group: list[tuple[Collider, Collider]], first_kind: int, second_kind: int
+) -> list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]:
+    """Runs SAT on a group of pairs whose shapes are of the same kinds.
+
+    Args:
+        group (list[tuple[Collider, Collider]]): The collider pairs.
+        first_kind (int): The kind of every first shape, see _kind.
+        second_kind (int): The kind of every second shape, see _kind.
+
+    Returns:
+        list[tuple[float, Vec2, Vec2 | None, tuple[int, int] | None]]: The depth, normal,
+            separating axis and feature of each pair, see sat_features.
+    """
+    first_verts, first_centers, first_radii = _pack([first for first, _ in group])
+    second_verts, second_centers, second_radii = _pack([second for _, second in group])
+
+    axes = [_edge_normals(first_verts, first_kind), _edge_normals(second_verts, second_kind)]
+    axes_counts = (axes[0].shape[1], axes[1].shape[1])
+    if first_kind == 0:
+        axes.append(_point_axes(first_centers, second_verts))
+    elif second_kind == 0:
+        axes.append(_point_axes(second_centers, first_verts))
+    axes = np.concatenate(axes, axis=1)
+
+    # Project every vertex of both shapes onto every axis of their pair
+    first_proj = np.einsum("pvd,pkd->pkv", first_verts, axes)
+    second_proj = np.einsum("pvd,pkd->pkv", second_verts, axes)
+    first_min = first_proj.min(axis=2) - first_radii[:, None]
+    first_max = first_proj.max(axis=2) + first_radii[:, None]
+    second_min = second_proj.min(axis=2) - second_radii[:, None]
+    second_max = second_proj.max(axis=2) + second_radii[:, None]
+
+    separating = (first_max < second_min) | (second_max < first_min)
+    separated = separating.any(axis=1)
+    axis_depths = np.minimum(second_max - first_min, first_max - second_min)
+    best = axis_depths.argmin(axis=1)
+    rows = np.arange(len(group))
+    depths = axis_depths[rows, best]
+    normals = axes[rows, best]
+    separating_axes = axes[rows, separating.argmax(axis=1)]
+
+    # Degenerate axes fall back to +x, as in Collider.collide_sat
+    depths[depths >= 1000000.0] = 1000000.0
+    normals[(normals[:, 0] == 0) & (normals[:, 1] == 0)] = (1.0, 0.0)
+
+    # Point the normal from the first shape towards the second
+    offsets = second_centers - first_centers
+    flip = (normals * offsets).sum(axis=1) <= 0
+    normals[flip] *= -1
+
+    # Report the first edge parallel to the reference axis, as sat_features does
+    first_count, second_count = axes_counts
+    owner = np.where(best < first_count, 0, np.where(best < first_count + second_count, 1, 2))
+    edges = np.zeros(len(group), dtype=np.int64)
+    for side, start, count in ((0, 0, first_count), (1, first_count, second_count)):
+        rows_on_side = np.nonzero(owner == side)[0]
+        if len(rows_on_side):
+            side_axes = axes[rows_on_side, start:start + count]
+            chosen = axes[rows_on_side, best[rows_on_side]]
+            cross = side_axes[..., 0] * chosen[:, None, 1] - side_axes[..., 1] * chosen[:, None, 0]
+            edges[rows_on_side] = (np.abs(cross) <= FEATURE_TOLERANCE).argmax(axis=1)
+
+    results = []
+    for is_separated, depth, normal, axis, side, edge in zip(
+        separated.tolist(), depths.tolist(), normals.tolist(), separating_axes.tolist(), owner.tolist(), edges.tolist()
+    ):
+        if is_separated:
+            results.append((0, Vec2(), Vec2(axis), None))
+        else:
+            results.append((depth, Vec2(normal), None, (side, edge if side < 2 else 0)))
+    return results
+
+
+def _closest_point(point: Vec2, start: Vec2, end: Vec2) -> Vec2:
+    """Finds the point on a segment closest to a point.
+
+    Args:
+        point (Vec2): The point to measure from.
+        start (Vec2): Start of the segment.
+        end (Vec2): End of the segment.
+
+    Returns:
+        Vec2: The closest point on the segment.
+    """
+    edge = end - start
+    length_sq = edge.magnitude_squared()
+    if length_sq == 0:
+        return Vec2(start)
+    t = (point - start).dot(edge) / length_sq
+    if t <= 0:
+        return Vec2(start)
+    if t >= 1:
+        return Vec2(end)
+    return start + edge * t
+
+
+def _closest_segment_points(first_start: Vec2, first_end: Vec2, second_start: Vec2, second_end: Vec2) -> tuple[Vec2, Vec2]:
+    """Finds the closest pair of points between two segments.
+
+    Args:
+        first_start (Vec2): Start of the first segment.
+        first_end (Vec2): End of the first segment.
+        second_start (Vec2): Start of the second segment.
+        second_end (Vec2): End of the second segment.
+
+    Returns:
+        tuple[Vec2, Vec2]: The closest point on the first and on the second segment.
+    """
+    first_dir = first_end - first_start
+    second_dir = second_end - second_start
+    offset = first_start - second_start
+    first_len = first_dir.dot(first_dir)
+    second_len = second_dir.dot(second_dir)
+    f = second_dir.dot(offset)
+    if first_len == 0 and second_len == 0:
+        return Vec2(first_start), Vec2(second_start)
+    if first_len == 0:
+        return Vec2(first_start), _closest_point(first_start, second_start, second_end)
+    c = first_dir.dot(offset)
+    if second_len == 0:
+        return _closest_point(second_start, first_start, first_end), Vec2(second_start)
+
+    b = first_dir.dot(second_dir)
+    denom = first_len * second_len - b * b
+    s = min(max((b * f - c * second_len) / denom, 0.0), 1.0) if denom != 0 else 0.0
+    t = (b * s + f) / second_len
+    if t < 0:
+        t = 0.0
+        s = min(max(-c / first_len, 0.0), 1.0)
+    elif t > 1:
+        t = 1.0
+        s = min(max((b - c) / first_len, 0.0), 1.0)
+    return first_start + first_dir * s, second_start + second_dir * t
+
+
+def _round_contact(first: Vec2, first_radius: float, second: Vec2, second_radius: float, fallback: Vec2) -> tuple[float, Vec2]:
+    """Resolves the contact between two discs.
+
+    Args:
+        first (Vec2): Center of the first disc.
+        first_radius (float): Radius of the first disc.
+        second (Vec2): Center of the second disc.
+        second_radius (float): Radius of the second disc.
+        fallback (Vec2): Normal used when the centers coincide.
+
+    Returns:
+        tuple[float, Vec2]: Penetration depth and normal pointing from the first disc to
+            the second, (0, Vec2()) if they do not touch.
+    """
+    offset = second - first
+    radii = first_radius + second_radius
+    dist_sq = offset.magnitude_squared()
+    if dist_sq >= radii * radii:
+        return 0, Vec2()
+    if dist_sq == 0:
+        return radii, fallback
+    dist = sqrt(dist_sq)
+    return radii - dist, offset / dist
+
+
+def _segment_normal(capsule: CapsuleCollider, towards: Vec2) -> Vec2:
+    """Gets the unit normal of a capsule's core segment facing a point.
+
+    Args:
+        capsule (CapsuleCollider): The capsule.
+        towards (Vec2): The point the normal should face.
+
+    Returns:
+        Vec2: The normal.
+    """
+    normal = Vec2(0, 1).rotate(capsule.rotation)
+    if normal.dot(towards - capsule.pos) < 0:
+        return -normal
+    return normal
+
+
+def _circle_circle(first: CircleCollider, second: CircleCollider) -> tuple[float, Vec2]:
+    """Closed-form test between two circles."""
+    return _round_contact(first.pos, first._radius, second.pos, second._radius, Vec2(1, 0))
+
+
+def _circle_capsule(circle: CircleCollider, capsule: CapsuleCollider) -> tuple[float, Vec2]:
+    """Closed-form test between a circle and the closest point of a capsule's core."""
+    center = circle.pos
+    start, end = capsule.vertices
+    closest = _closest_point(center, start, end)
+    return _round_contact(center, circle._radius, closest, capsule._capsule_radius, -_segment_normal(capsule, center))
+
+
+def _capsule_capsule(first: CapsuleCollider, second: CapsuleCollider) -> tuple[float, Vec2]:
+    """Closed-form test between the closest points of two capsule cores."""
+    first_point, second_point = _closest_segment_points(*first.vertices, *second.vertices)
+    return _round_contact(
+        first_point, first._capsule_radius, second_point, second._capsule_radius, _segment_normal(first, second.pos)
+    )
+
+
+def _circle_polygon(circle: CircleCollider, polygon: Collider) -> tuple[float, Vec2]:
+    """Closest feature test between a circle and a convex polygon.
+
+    The face of greatest separation decides the contact, unless the center lies past
+    one of that face's end points, in which case the vertex is the closest feature.
+    """
+    center = circle.pos
+    radius = circle._radius
+    verts = polygon.vertices
+    count = len(verts)
+
+    # Outward normals depend on the winding of the vertices
+    area = 0.0
+    for i in range(count):
+        area += verts[i - 1].cross(verts[i])
+    winding = 1.0 if area > 0 else -1.0
+
+    separation = -1000000.0
+    face = 0
+    face_normal = Vec2(1, 0)
+    for i in range(count):
+        start = verts[i - 1]
+        edge = verts[i] - start
+        length = edge.length()
+        if length == 0:
+            continue
+        normal = Vec2(edge.y, -edge.x) * (winding / length)
+        dist = normal.dot(center - start)
+        if dist > radius:
+            return 0, Vec2()
+        if dist > separation:
+            separation = dist
+            face = i
+            face_normal = normal
+
+    if separation > 0:
+        start = verts[face - 1]
+        end = verts[face]
+        if (center - start).dot(end - start) <= 0:
+            closest = start
+        elif (center - end).dot(start - end) <= 0:
+            closest = end
+        else:
+            closest = None
+        if closest is not None:
+            offset = closest - center
+            dist_sq = offset.magnitude_squared()
+            if dist_sq >= radius * radius:
+                return 0, Vec2()
+            dist = sqrt(dist_sq)
+            return radius - dist, offset / dist
+    return radius - separation, -face_normal
+
+
+def _capsule_polygon(capsule: CapsuleCollider, polygon: Collider) -> tuple[float, Vec2]:
+    """Separating axis test between a capsule and a convex polygon using only the axes
+    that can separate them: the polygon's faces, the capsule's core and the directions
+    from the core to each polygon vertex.
+    """
+    start, end = capsule.vertices
+    axes = list(polygon.normals)
+    if capsule._length:
+        axes += capsule.normals
+    for vert in polygon.vertices:
+        offset = vert - _closest_point(vert, start, end)
+        if offset.x or offset.y:
+            axes.append(offset.normalize())
+
+    depth = 1000000.0
+    normal = Vec2(1, 0)
+    for axis in axes:
+        first_min, first_max = capsule.project(axis)
+        second_min, second_max = polygon.project(axis)
+        if first_max < second_min or second_max < first_min:
+            return 0, Vec2()
+        axis_depth = min(second_max - first_min, first_max - second_min)
+        if axis_depth < depth:
+            depth = axis_depth
+            normal = axis
+    if normal.dot(polygon.center - capsule.pos) > 0:
+        return depth, Vec2(normal)
+    return depth, -normal
+
+
+def _half_extents(rect: Collider, rotation: float) -> tuple[float, float]:
+    """Gets the half width and height of a rect turned by a multiple of 90 degrees."""
+    if rotation % 180:
+        return rect._h / 2, rect._w / 2
+    return rect._w / 2, rect._h / 2
+
+
+def _rect_rect(first: Collider, second: Collider) -> tuple[float, Vec2] | None:
+    """Closed-form overlap test between two axis aligned rects.
+
+    Returns None for rotated rects so they fall back to SAT.
+    """
+    first_rotation = first.rotation
+    second_rotation = second.rotation
+    if first_rotation % 90 or second_rotation % 90:
+        return None
+    first_w, first_h = _half_extents(first, first_rotation)
+    second_w, second_h = _half_extents(second, second_rotation)
+    offset = second.pos - first.pos
+    overlap_x = first_w + second_w - abs(offset.x)
+    if overlap_x <= 0:
+        return 0, Vec2()
+    overlap_y = first_h + second_h - abs(offset.y)
+    if overlap_y <= 0:
+        return 0, Vec2()
+    if overlap_x <= overlap_y:
+        return overlap_x, Vec2(1 if offset.x > 0 else -1, 0)
+    return overlap_y, Vec2(0, 1 if offset.y > 0 else -1)
+
+
+# Closed-form tests keyed by the collider_type of the first and second shape. A test
+# may return None to hand a pair it cannot solve back to SAT.
+_TESTS: dict[tuple[str, str], Callable[[Collider, Collider], tuple[float, Vec2] | None]] = {
+    ("Circle", "Circle"): _circle_circle,
+    ("Circle", "Rect"): _circle_polygon,
+    ("Circle", "Polygon"): _circle_polygon,
+    ("Circle", "Capsule"): _circle_capsule,
+    ("Capsule", "Capsule"): _capsule_capsule,
+    ("Capsule", "Rect"): _capsule_polygon,
+    ("Capsule", "Polygon"): _capsule_polygon,
+    ("Rect", "Rect"): _rect_rect,
+}
+
+
+def register_test(
+    first_type: str, second_type: str, test: Callable[[Collider, Collider], tuple[float, Vec2] | None]
+) -> None:
+    """Registers a closed-form narrowphase test for a pair of collider types.
+
+    The test is also used for the swapped pair, with its normal flipped.
+
+    Args:
+        first_type (str): collider_type of the first shape, e.g. "Circle".
+        second_type (str): collider_type of the second shape.
+        test (Callable): Function taking the two colliders and returning the penetration
+            depth and normal pointing from the first to the second, (0, Vec2()) if they do
+            not touch, or None to fall back to SAT.
+    """
+    _TESTS[(first_type, second_type)] = test
+
+
+def collide_analytic(first: Collider, second: Collider) -> tuple[float, Vec2] | None:
+    """Runs the closed-form test for a pair if one is registered.
+
+    Args:
+        first (Collider): The first collider.
+        second (Collider): The second collider.
+
+    Returns:
+        tuple[float, Vec2] | None: The depth and normal, or None if SAT is needed.
+    """
+    test = _TESTS.get((first.collider_type, second.collider_type))
+    if test is not None:
+        return test(first, second)
+    test = _TESTS.get((second.collider_type, first.collider_type))
+    if test is not None:
+        result = test(second, first)
+        if result is not None and result[0]:
+            return result[0], -result[1]
+        return result
+    return None
+
+
+def collide(first: Collider, second: Collider) -> tuple[float, Vec2]:
+    """Tests two colliders, using a closed-form test where one exists and SAT otherwise.
+
+    Args:
+        first (Collider): The first collider.
+        second (Collider): The second collider.
+
+    Returns:
+        tuple[float, Vec2]: Penetration depth and collision normal pointing from the
+            first to the second collider, (0, Vec2()) if they do not touch.
+    """
+    result = collide_analytic(first, second)
+    if result is None:
+        return first.collide_sat(second)
+    return result
+
+
+def collide_batch(
+    pairs: Iterable[tuple[Collider, Collider]], executor: "NarrowphaseExecutor | None" = None
+) -> list[tuple[float, Vec2]]:
+    """Tests many collider pairs at once.
+
+    Pairs with a closed-form test are solved directly, the rest are handed to
+    collide_sat_batch together.
+
+    Args:
+        pairs (Iterable[tuple[Collider, Collider]]): The collider pairs to test.
+        executor (NarrowphaseExecutor, optional): Splits large batches across threads.
+            Defaults to None, testing every pair on the calling thread.
+
+    Returns:
+        list[tuple[float, Vec2]]: Penetration depth and collision normal pointing from the
+            first to the second collider for each pair, (0, Vec2()) where they do not touch.
+    """
+    if executor is not None:
+        return executor.map_chunks(_collide_serial, pairs, warm_caches)
+    return _collide_serial(pairs)
+
+
+def _collide_serial(pairs: Iterable[tuple[Collider, Collider]]) -> list[tuple[float, Vec2]]:
+    """Tests collider pairs on the calling thread, see collide_batch.
+
+    Args:
+        pairs (Iterable[tuple[Collider, Collider]]): The collider pairs to test.
+
+    Returns:
+        list[tuple[float, Vec2]]: The depth and normal of each pair.
+    """
+    results: list[tuple[float, Vec2] | None] = []
+    fallback = []
+    fallback_indexes = []
+    for first, second in pairs:
+        result = collide_analytic(first, second)
+        if result is None:
+            fallback_indexes.append(len(results))
+            fallback.append((first, second))
+        results.append(result)
+    if fallback:
+        for i, result in zip(fallback_indexes, collide_sat_batch(fallback)):
+            results[i] = result
+    return results
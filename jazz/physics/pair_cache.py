@@ -0,0 +1,195 @@
+from typing import TYPE_CHECKING, Iterable
+
+from ..utils import Vec2
+from .narrowphase import full_tests, warm_caches
+
+if TYPE_CHECKING:
+    from .colliders import Collider
+    from .parallel import NarrowphaseExecutor
+
+
+class PairContact:
+    """Narrowphase state remembered for one collider pair between frames."""
+
+    __slots__ = ("first_version", "second_version", "frame", "depth", "normal", "separating_axis", "feature")
+
+    def __init__(self) -> None:
+        self.first_version = -1
+        self.second_version = -1
+        self.frame = 0
+        self.depth: float = 0
+        self.normal = Vec2()
+        # The axis that separated the shapes at the last full test, if they were apart
+        self.separating_axis: Vec2 | None = None
+        # The reference feature of the contact as reported by sat_features, if they touched
+        self.feature: tuple[int, int] | None = None
+
+    @property
+    def touching(self) -> bool:
+        """bool: True if the pair was in contact at its last test."""
+        return self.depth != 0
+
+    def __repr__(self) -> str:
+        return f"PairContact(depth={self.depth}, normal={self.normal}, feature={self.feature})"
+
+
+class PairCache:
+    """Caches narrowphase results per collider pair to exploit temporal coherence.
+
+    A pair whose colliders have not changed since its last test reuses the stored
+    contact outright. A pair that was separated is first checked against the axis
+    that separated it last time, which usually still does, before running a full test.
+    Pairs are stored once regardless of the order they are queried in. An entry is
+    evicted when the pair was not queried during a whole frame, which is when the
+    broadphase stopped reporting it. Pairs that need a full test can be split across
+    threads by a NarrowphaseExecutor, the cache itself is only updated by the caller.
+    """
+
+    def __init__(self, executor: "NarrowphaseExecutor | None" = None) -> None:
+        """Initializes an empty PairCache.
+
+        Args:
+            executor (NarrowphaseExecutor, optional): Runs the full tests of large batches
+                on worker threads. Defaults to None, testing on the calling thread.
+        """
+        self.executor = executor
+        self._entries: dict[tuple["Collider", "Collider"], PairContact] = {}
+        self._frame = 0
+        self.reset_stats()
+
+    def __repr__(self) -> str:
+        return f"\nPairCache: {len(self._entries)} pairs"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin_frame(self) -> None:
+        """Evicts pairs that were not queried since the last call and starts a new frame."""
+        frame = self._frame
+        self._entries = {key: entry for key, entry in self._entries.items() if entry.frame == frame}
+        self._frame = frame + 1
+
+    def clear(self) -> None:
+        """Forgets every cached pair."""
+        self._entries.clear()
+
+    def contact(self, first: "Collider", second: "Collider") -> PairContact | None:
+        """Gets the cached state of a pair.
+
+        The stored normal points from the collider with the lower id to the other one.
+
+        Args:
+            first (Collider): One collider of the pair.
+            second (Collider): The other collider.
+
+        Returns:
+            PairContact | None: The cached state, or None if the pair is not cached.
+        """
+        if id(first) > id(second):
+            first, second = second, first
+        return self._entries.get((first, second))
+
+    def collide(self, first: "Collider", second: "Collider") -> tuple[float, Vec2]:
+        """Tests two colliders, reusing cached work where it is still valid.
+
+        Args:
+            first (Collider): The first collider.
+            second (Collider): The second collider.
+
+        Returns:
+            tuple[float, Vec2]: Penetration depth and collision normal pointing from the
+                first to the second collider, (0, Vec2()) if they do not touch.
+        """
+        return self.collide_batch(((first, second),))[0]
+
+    def collide_batch(self, pairs: Iterable[tuple["Collider", "Collider"]]) -> list[tuple[float, Vec2]]:
+        """Tests many collider pairs, reusing cached work where it is still valid.
+
+        Pairs that need a full test use a closed-form test where one exists, the rest
+        are run through SAT together, split across threads if the cache has an executor
+        and the batch is large.
+
+        Args:
+            pairs (Iterable[tuple[Collider, Collider]]): The collider pairs to test.
+
+        Returns:
+            list[tuple[float, Vec2]]: Penetration depth and collision normal pointing from the
+                first to the second collider for each pair, (0, Vec2()) where they do not touch.
+        """
+        entries = self._entries
+        frame = self._frame
+        results: list[tuple[float, Vec2] | None] = []
+        flipped: list[bool] = []
+        stale: list[tuple[int, PairContact, "Collider", "Collider"]] = []
+
+        for first, second in pairs:
+            swap = id(first) > id(second)
+            if swap:
+                first, second = second, first
+            flipped.append(swap)
+            key = (first, second)
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = PairContact()
+            entry.frame = frame
+
+            if entry.first_version == first._version and entry.second_version == second._version:
+                self._hits += 1
+                results.append((entry.depth, Vec2(entry.normal)))
+                continue
+
+            axis = entry.separating_axis
+            if axis is not None:
+                first_min, first_max = first.project(axis)
+                second_min, second_max = second.project(axis)
+                if first_max < second_min or second_max < first_min:
+                    self._early_outs += 1
+                    entry.first_version = first._version
+                    entry.second_version = second._version
+                    results.append((0, Vec2()))
+                    continue
+
+            self._misses += 1
+            stale.append((len(results), entry, first, second))
+            results.append(None)
+
+        if stale:
+            pairs = [(first, second) for _, _, first, second in stale]
+            if self.executor is not None:
+                tested = self.executor.map_chunks(full_tests, pairs, warm_caches)
+            else:
+                tested = full_tests(pairs)
+            for (i, entry, first, second), (depth, normal, axis, feature) in zip(stale, tested):
+                entry.depth = depth
+                entry.normal = normal
+                entry.separating_axis = axis
+                entry.feature = feature
+                entry.first_version = first._version
+                entry.second_version = second._version
+                results[i] = (depth, Vec2(normal))
+
+        for i, swap in enumerate(flipped):
+            if swap and results[i][0]:
+                results[i] = (results[i][0], -results[i][1])
+        return results
+
+    def stats(self) -> dict:
+        """Reports how much narrowphase work the cache saved.
+
+        Returns:
+            dict: The number of cached pairs, pairs reused unchanged (hits), pairs
+                rejected by their cached separating axis (early_outs) and pairs that
+                needed a full test (misses).
+        """
+        return {
+            "pairs": len(self._entries),
+            "hits": self._hits,
+            "early_outs": self._early_outs,
+            "misses": self._misses,
+        }
+
+    def reset_stats(self) -> None:
+        """Resets the hit, early out and miss counters."""
+        self._hits = 0
+        self._early_outs = 0
+        self._misses = 0
@@ -0,0 +1,91 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def gil_disabled() -> bool:
+    """Checks whether the interpreter runs without the GIL, as free-threaded CPython builds can.
+
+    Returns:
+        bool: True if Python threads can run bytecode in parallel.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class NarrowphaseExecutor:
+    """Splits large batches of narrowphase tests across worker threads.
+
+    Each batch is cut into one contiguous chunk per worker and the chunk results are
+    joined back in order, so the results are the same, in the same order, as testing
+    the batch on the calling thread. Threads are only used on a GIL-free interpreter
+    and for batches of at least min_batch items, otherwise batches run serially.
+    Workers only read shared state: the lazy caches of the colliders in a batch are
+    filled on the calling thread before it is split, and caches such as the PairCache
+    are updated by the calling thread afterwards.
+    """
+
+    def __init__(self, workers: int | None = None, min_batch: int = 256, force: bool = False) -> None:
+        """Initializes the NarrowphaseExecutor. The thread pool is started on first use.
+
+        Args:
+            workers (int, optional): Number of worker threads. Defaults to the CPU count.
+            min_batch (int, optional): Smallest batch worth splitting. Defaults to 256.
+            force (bool, optional): Use threads even when the GIL is enabled, mainly for
+                testing. Defaults to False.
+        """
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.min_batch = min_batch
+        self._parallel = self.workers > 1 and (force or gil_disabled())
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __repr__(self) -> str:
+        return f"\nNarrowphaseExecutor: {self.workers} workers, {'parallel' if self._parallel else 'serial'}"
+
+    @property
+    def parallel(self) -> bool:
+        """bool: Whether large batches are split across threads."""
+        return self._parallel
+
+    def map_chunks(
+        self,
+        function: Callable[[list[T]], list[R]],
+        items: Sequence[T],
+        prepare: Callable[[list[T]], None] | None = None,
+    ) -> list[R]:
+        """Runs a batch function over items, in chunks on the worker threads when worthwhile.
+
+        Args:
+            function (Callable[[list[T]], list[R]]): Function returning one result per item
+                of the list it is given. It must not modify shared state.
+            items (Sequence[T]): The items to process.
+            prepare (Callable[[list[T]], None], optional): Called with the items on the
+                calling thread before they are split across threads, e.g. to fill lazy
+                caches the workers would otherwise write. Defaults to None.
+
+        Returns:
+            list[R]: One result per item, in the order of the items.
+        """
+        items = list(items)
+        if not self._parallel or len(items) < self.min_batch:
+            return function(items)
+        if prepare is not None:
+            prepare(items)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="jazz-narrowphase")
+        size = -(-len(items) // self.workers)
+        results = []
+        # Executor.map yields in submission order, whichever chunk finishes first
+        for chunk in self._pool.map(function, [items[i : i + size] for i in range(0, len(items), size)]):
+            results += chunk
+        return results
+
+    def shutdown(self) -> None:
+        """Stops the worker threads. They are started again if another large batch comes in."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -1,19 +1,30 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
+
+from ..utils import Vec2
 
 if TYPE_CHECKING:
     from ._physics_object import PhysicsObject
     from .colliders import Collider
 
 class PhysicsGrid:
-    """A spatial hashing grid that groups physics objects into cell coordinates to optimize collision detection."""
+    """A spatial hashing grid that groups physics objects into cell coordinates to optimize collision detection.
+
+    Every cell records the last build in which an object entered, left or moved
+    inside it, so cached query results can check whether the cells they depend on changed.
+    """
 
     def __init__(self) -> None:
         """Initializes the PhysicsGrid with default size, objects list, bounds, and cell registry."""
         self._objects: list["PhysicsObject"] = []
+        self._object_set: set["PhysicsObject"] = set()
+        self._dirty: set["PhysicsObject"] = set()
+        self._masks: dict["PhysicsObject", int] = {}
         self._grid_size = 50
         self.grid = {}
         self._object_bounds = {}
         self._object_cells = {}
+        self._builds = 0
+        self._cell_stamps: dict[str, int] = {}
 
     def __repr__(self) -> str:
         return f"\nGrid: {self._objects}"
@@ -72,14 +83,20 @@ class PhysicsGrid:
         self._object_bounds[physics_object] = bounds
         self._object_cells[physics_object] = cells
 
-    def add_object(self, physics_object: "PhysicsObject") -> None:
+    def add_object(self, physics_object: "PhysicsObject", mask: int = -1) -> None:
         """Adds a physical object to the simulation objects tracking list.
 
+        The object is queued and hashed into its cells on the next build.
+
         Args:
             physics_object (PhysicsObject): The object to add.
+            mask (int, optional): Layer bitmask stored with the entry and matched against query masks. Defaults to all layers.
         """
-        if physics_object not in self._objects:
+        self._masks[physics_object] = mask
+        if physics_object not in self._object_set:
+            self._object_set.add(physics_object)
             self._objects.append(physics_object)
+        self._dirty.add(physics_object)
 
     def remove_object(self, physics_object: "PhysicsObject") -> None:
         """Removes a physical object from all tracked grid cells and list.
@@ -87,11 +104,18 @@ class PhysicsGrid:
         Args:
             physics_object (PhysicsObject): The object to remove.
         """
-        if physics_object in self._objects:
+        if physics_object in self._object_set:
+            self._object_set.remove(physics_object)
             self._objects.remove(physics_object)
+        self._dirty.discard(physics_object)
+        self._masks.pop(physics_object, None)
         self._object_bounds.pop(physics_object, None)
         old_cells = self._object_cells.pop(physics_object, None)
         if old_cells is not None:
+            # Stamped with the next build, which is later than any result cached since the last one
+            stamps = self._cell_stamps
+            for cell_key in old_cells:
+                stamps[cell_key] = self._builds + 1
             for cell_key in old_cells:
                 cell = self.grid.get(cell_key)
                 if cell is not None:
@@ -100,27 +124,95 @@ class PhysicsGrid:
                     if not cell:
                         self.grid.pop(cell_key, None)
 
-    def build_grid(self) -> None:
-        """Rebuilds/updates grid mapping coordinates for all tracked objects whose bounding boxes changed."""
-        for physics_object in self._objects:
-            rect = physics_object.collider.get_rect()
-            g_top = int(rect.top // self._grid_size)
-            g_bottom = int(rect.bottom // self._grid_size)
-            g_left = int(rect.left // self._grid_size)
-            g_right = int(rect.right // self._grid_size)
+    def build_grid(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Re-hashes tracked objects whose bounding boxes may have changed.
 
-            new_bounds = (g_left, g_right, g_top, g_bottom)
-            old_bounds = self._object_bounds.get(physics_object)
+        When a set of moved objects is given only those objects, plus any newly
+        added ones, are re-hashed. Objects that have not moved keep their cached
+        cells, so the cost scales with the number of movers.
 
-            if old_bounds == new_bounds:
-                continue
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every tracked object is checked. Defaults to None.
+        """
+        self._builds += 1
+        if moved is None:
+            for physics_object in self._objects:
+                self._update_cells(physics_object)
+        else:
+            tracked = self._object_set
+            dirty = self._dirty
+            for physics_object in dirty:
+                self._update_cells(physics_object)
+            for physics_object in moved:
+                if physics_object in tracked and physics_object not in dirty:
+                    self._update_cells(physics_object)
+        self._dirty.clear()
+
+    def _update_cells(self, physics_object: "PhysicsObject") -> None:
+        """Re-hashes a single object if its cell bounds changed.
 
-            new_cells = {
-                f"{g_left + x}.{g_top + y}"
-                for x in range(g_right - g_left + 1)
-                for y in range(g_bottom - g_top + 1)
-            }
-            self.add_to_grid(physics_object, bounds=new_bounds, cells=new_cells)
+        Args:
+            physics_object (PhysicsObject): The object to re-hash.
+        """
+        rect = physics_object.collider.get_rect()
+        g_top = int(rect.top // self._grid_size)
+        g_bottom = int(rect.bottom // self._grid_size)
+        g_left = int(rect.left // self._grid_size)
+        g_right = int(rect.right // self._grid_size)
+
+        # The object moved, so the cells it was in changed even if it stays in them
+        stamps = self._cell_stamps
+        build = self._builds
+        for cell_key in self._object_cells.get(physics_object, ()):
+            stamps[cell_key] = build
+
+        new_bounds = (g_left, g_right, g_top, g_bottom)
+        if self._object_bounds.get(physics_object) == new_bounds:
+            return
+
+        new_cells = {
+            f"{g_left + x}.{g_top + y}"
+            for x in range(g_right - g_left + 1)
+            for y in range(g_bottom - g_top + 1)
+        }
+        self.add_to_grid(physics_object, bounds=new_bounds, cells=new_cells)
+        for cell_key in new_cells:
+            stamps[cell_key] = build
+
+    @property
+    def build_count(self) -> int:
+        """int: The number of builds so far, used to date cached query results."""
+        return self._builds
+
+    def query_cells(self, collider: "PhysicsObject") -> set[str]:
+        """Gets the keys of the cells get_AABB_collisions looks in for an object.
+
+        Args:
+            collider (PhysicsObject): The querying object.
+
+        Returns:
+            set[str]: The cell keys.
+        """
+        rect = collider.collider.get_rect()
+        x = int(rect.left // self._grid_size)
+        y = int(rect.top // self._grid_size)
+        w = int(rect.right // self._grid_size - x)
+        h = int(rect.bottom // self._grid_size - y)
+        return {f"{x + x_offset}.{y + y_offset}" for x_offset in range(-1, w + 2) for y_offset in range(-1, h + 2)}
+
+    def cells_changed(self, cells: Iterable[str], since: int) -> bool:
+        """Checks whether an object entered, left or moved inside any of some cells after a build.
+
+        Args:
+            cells (Iterable[str]): The cell keys to check.
+            since (int): The build_count the caller's result dates from.
+
+        Returns:
+            bool: True if any of the cells changed after that build.
+        """
+        stamps = self._cell_stamps
+        return any(stamps.get(cell_key, 0) > since for cell_key in cells)
 
     def get_grid_cell(self, x: float | int, y: float | int) -> list["PhysicsObject"]:
         """Retrieves list of physics objects indexed inside a specific cell coordinate.
@@ -157,11 +249,12 @@ class PhysicsGrid:
         # print(cells)
         return list(cells)
 
-    def get_AABB_collisions(self, collider: "PhysicsObject") -> list["PhysicsObject"]:
+    def get_AABB_collisions(self, collider: "PhysicsObject", mask: int | None = None) -> list["PhysicsObject"]:
         """Finds candidate collisions overlapping the bounds of a query collider.
 
         Args:
             collider (PhysicsObject): The object querying collisions.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
 
         Returns:
             list[PhysicsObject]: Candidate objects whose bounding boxes overlap.
@@ -173,18 +266,20 @@ class PhysicsGrid:
         w = int(rect.right // self._grid_size - x)
         h = int(rect.bottom // self._grid_size - y)
         physics_objects = self.get_grid_cells(x - 1, y - 1, w + 3, h + 3)
+        masks = self._masks
         for physics_object in physics_objects:
-            if physics_object is not collider:
+            if physics_object is not collider and (mask is None or masks[physics_object] & mask):
                 if physics_object.collider.collide_rect(collider.collider):
                     collisions.add(physics_object)
         # print(collisions)
         return list(collisions)
 
-    def get_simple_AABB_collisions(self, collider: "Collider") -> list["PhysicsObject"]:
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: int | None = None) -> list["PhysicsObject"]:
         """Finds candidate collisions overlapping a basic Collider object bounds.
 
         Args:
             collider (Collider): The shape collider to check.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
 
         Returns:
             list[PhysicsObject]: Candidate overlapping objects.
@@ -195,9 +290,98 @@ class PhysicsGrid:
         w = int(collider.right // self._grid_size - x)
         h = int(collider.bottom // self._grid_size - y)
         physics_objects = self.get_grid_cells(x - 1, y - 1, w + 3, h + 3)
+        masks = self._masks
         for physics_object in physics_objects:
-            if physics_object.collider is not collider:
+            if physics_object.collider is not collider and (mask is None or masks[physics_object] & mask):
                 if physics_object.collider.collide_rect(collider):
                     collisions.add(physics_object)
         # print(collisions)
         return list(collisions)
+
+    def raycast(
+        self,
+        origin: Vec2,
+        direction: Vec2,
+        max_dist: float,
+        mask: int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> tuple["PhysicsObject | None", Vec2 | None]:
+        """Finds the first object along a ray by walking the cells it crosses in order.
+
+        Cells are visited with the Amanatides and Woo grid traversal, so only
+        objects in cells the ray passes through are tested, each at most once. The walk
+        stops as soon as a hit lies before the exit of the current cell, since no object
+        in a later cell can be closer. Objects are found in the cells they occupied at
+        the last build.
+
+        Args:
+            origin (Vec2): Start of the ray.
+            direction (Vec2): Direction of the ray, it does not need to be normalized.
+            max_dist (float): Length of the ray.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are hit. Defaults to None (no filtering).
+            ignore (Iterable[PhysicsObject], optional): Objects the ray passes through. Defaults to None.
+
+        Returns:
+            tuple[PhysicsObject | None, Vec2 | None]: The closest object hit and the hit point, or (None, None).
+        """
+        length = (direction.x * direction.x + direction.y * direction.y) ** 0.5
+        if not self._objects or not length or max_dist <= 0:
+            return None, None
+        if ignore is not None and not isinstance(ignore, (set, frozenset)):
+            ignore = set(ignore)
+        origin = Vec2(origin)
+        dir_x = direction.x / length
+        dir_y = direction.y / length
+        end = Vec2(origin.x + dir_x * max_dist, origin.y + dir_y * max_dist)
+
+        size = self._grid_size
+        cell_x = int(origin.x // size)
+        cell_y = int(origin.y // size)
+        # Distance along the ray to the next vertical and horizontal cell boundary,
+        # and the distance between consecutive boundaries
+        if dir_x > 0:
+            step_x, next_x, delta_x = 1, ((cell_x + 1) * size - origin.x) / dir_x, size / dir_x
+        elif dir_x < 0:
+            step_x, next_x, delta_x = -1, (cell_x * size - origin.x) / dir_x, -size / dir_x
+        else:
+            step_x, next_x, delta_x = 0, float("inf"), float("inf")
+        if dir_y > 0:
+            step_y, next_y, delta_y = 1, ((cell_y + 1) * size - origin.y) / dir_y, size / dir_y
+        elif dir_y < 0:
+            step_y, next_y, delta_y = -1, (cell_y * size - origin.y) / dir_y, -size / dir_y
+        else:
+            step_y, next_y, delta_y = 0, float("inf"), float("inf")
+
+        grid = self.grid
+        masks = self._masks
+        tested = set()
+        closest = None
+        closest_dist = float("inf")
+        while True:
+            cell = grid.get(f"{cell_x}.{cell_y}")
+            if cell:
+                for physics_object in cell:
+                    if physics_object in tested:
+                        continue
+                    tested.add(physics_object)
+                    if ignore and physics_object in ignore:
+                        continue
+                    if mask is not None and not masks[physics_object] & mask:
+                        continue
+                    fraction = physics_object.collider.intersect_segment(origin, end)
+                    if fraction is not None and fraction * max_dist < closest_dist:
+                        closest = physics_object
+                        closest_dist = fraction * max_dist
+            cell_exit = min(next_x, next_y)
+            if closest_dist <= cell_exit or cell_exit > max_dist:
+                break
+            if next_x < next_y:
+                cell_x += step_x
+                next_x += delta_x
+            else:
+                cell_y += step_y
+                next_y += delta_y
+
+        if closest is None:
+            return None, None
+        return closest, Vec2(origin.x + dir_x * closest_dist, origin.y + dir_y * closest_dist)
@@ -12,7 +12,12 @@ if TYPE_CHECKING:
 
 
 class Ray(PhysicsObject):
-    """Raycast component representing a straight projection line for detecting physical overlaps."""
+    """Raycast component representing a straight projection line for detecting physical overlaps.
+
+    An active ray keeps its last result together with the grid cells the cast looked
+    in, and only casts again once it moved or an object entered, left or moved in
+    those cells, so rays that sit still are nearly free.
+    """
 
     def __init__(self, **kwargs) -> None:
         """Initializes the Ray component.
@@ -28,15 +33,38 @@ class Ray(PhysicsObject):
         self._active = kwargs.get("active", True)
         self.collision_point = None
         self.collision_object = None
+        self._cast_key = None
+        self._cast_cells = None
+
+    def reset(self, **overrides) -> None:
+        """Restores the ray for reuse, forgetting its last result.
+
+        Args:
+            **overrides: Values to use instead of the ones the ray was created with.
+        """
+        super().reset(**overrides)
+        self.collision_point = None
+        self.collision_object = None
+        self._cast_key = None
+        self._cast_cells = None
 
     def _engine_update(self, delta: float) -> None:
-        """Triggers raycast collision check if marked active.
+        """Triggers raycast collision check if marked active, reusing the last result
+        while neither the ray nor its surroundings changed.
 
         Args:
             delta (float): Time in seconds since the last frame.
         """
-        if self._active:
-            self.collision_object, self.collision_point = self.cast()
+        if not self._active:
+            self._cast_cells = None
+            return
+        scene = Globals.scene
+        key = (self.collider._version, self.collision_layers, self.root)
+        if self._cast_cells is not None and key == self._cast_key and scene.cells_unchanged(self._cast_cells):
+            return
+        self.collision_object, self.collision_point = self.cast()
+        self._cast_key = key
+        self._cast_cells = scene.cell_snapshot(self)
 
     def cast_all(self, blacklist: list[PhysicsObject] | None = None) -> list[tuple["GameObject", Vec2]]:
         """
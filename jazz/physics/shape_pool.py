@@ -0,0 +1,117 @@
+from typing import Callable
+
+from ..utils import JazzException, Vec2
+from .colliders import CapsuleCollider, CircleCollider, Collider, PolyCollider, RayCollider, RectCollider
+
+
+def _circle_geometry(collider: CircleCollider, radius: float) -> None:
+    collider._radius = radius
+    collider._left = collider._top = -radius
+    collider._right = collider._bottom = radius
+
+
+def _rect_geometry(collider: RectCollider, w: float, h: float) -> None:
+    collider._w = float(w)
+    collider._h = float(h)
+    collider._vertices = [Vec2(w / 2, h / 2), Vec2(w / 2, -h / 2), Vec2(-w / 2, -h / 2), Vec2(-w / 2, h / 2)]
+
+
+def _capsule_geometry(collider: CapsuleCollider, radius: float, length: float) -> None:
+    collider._capsule_radius = radius
+    collider._length = length
+    collider._vertices = [Vec2(-length / 2, 0), Vec2(length / 2, 0)]
+
+
+def _poly_geometry(collider: PolyCollider, vertices: list[Vec2]) -> None:
+    collider._vertices = [Vec2(vert) for vert in vertices]
+
+
+def _ray_geometry(collider: RayCollider, length: float) -> None:
+    collider._length = length
+    collider._vertices = [Vec2(0, 0), Vec2(length, 0)]
+
+
+# How to build and reshape each collider type, and how to read the shape of an existing one
+_SHAPES: dict[type, tuple[Callable[[], Collider], Callable[..., None], Callable[[Collider], dict]]] = {
+    CircleCollider: (lambda: CircleCollider(0), _circle_geometry, lambda c: {"radius": c._radius}),
+    RectCollider: (lambda: RectCollider(0, 0), _rect_geometry, lambda c: {"w": c._w, "h": c._h}),
+    CapsuleCollider: (
+        lambda: CapsuleCollider(0, 0), _capsule_geometry, lambda c: {"radius": c._capsule_radius, "length": c._length}
+    ),
+    PolyCollider: (
+        lambda: PolyCollider([Vec2(0, 0), Vec2(1, 0), Vec2(0, 1)]), _poly_geometry, lambda c: {"vertices": c._vertices}
+    ),
+    RayCollider: (lambda: RayCollider(length=0), _ray_geometry, lambda c: {"length": c._length}),
+}
+
+
+class ShapePool:
+    """Reusable colliders for queries that must not touch the scene graph.
+
+    Query shapes are detached colliders with no parent, so placing them never marks
+    anything as moved, wakes bodies or enters an index. Released colliders are kept
+    per type and reshaped on the next acquire instead of constructing new objects.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty ShapePool."""
+        self._free: dict[type, list[Collider]] = {}
+
+    def __repr__(self) -> str:
+        return f"\nShapePool: {sum(len(free) for free in self._free.values())} free"
+
+    def acquire(self, shape_type: type, pos: Vec2, rotation: float = 0, **geometry) -> Collider:
+        """Takes a collider of a type from the pool and shapes and places it.
+
+        Args:
+            shape_type (type): The collider class, e.g. CircleCollider.
+            pos (Vec2): World position of the shape.
+            rotation (float, optional): Rotation of the shape in degrees. Defaults to 0.
+            **geometry: The shape's dimensions, as taken by the collider's constructor
+                (radius, w and h, radius and length, vertices or length).
+
+        Returns:
+            Collider: The placed collider. Hand it back with release when done.
+
+        Raises:
+            JazzException: If the collider type cannot be pooled.
+        """
+        shape = _SHAPES.get(shape_type)
+        if shape is None:
+            raise JazzException(f"{shape_type.__name__} cannot be used as a query shape")
+        make, reshape, _ = shape
+        free = self._free.get(shape_type)
+        collider = free.pop() if free else make()
+        reshape(collider, **geometry)
+        # Drop every cache derived from the previous shape
+        collider._edges = []
+        collider._local_arrays = None
+        collider._rot_cache = 1000000
+        collider.pos = pos
+        collider.rotation = rotation
+        return collider
+
+    def acquire_like(self, shape: Collider, pos: Vec2, rotation: float = 0) -> Collider:
+        """Takes a collider with the same shape as another one from the pool and places it.
+
+        Args:
+            shape (Collider): The collider whose shape to copy. It is not modified.
+            pos (Vec2): World position of the copy.
+            rotation (float, optional): Rotation of the copy in degrees. Defaults to 0.
+
+        Returns:
+            Collider: The placed collider. Hand it back with release when done.
+        """
+        shape_type = type(shape)
+        if shape_type not in _SHAPES:
+            raise JazzException(f"{shape_type.__name__} cannot be used as a query shape")
+        return self.acquire(shape_type, pos, rotation, **_SHAPES[shape_type][2](shape))
+
+    def release(self, *colliders: Collider) -> None:
+        """Returns colliders to the pool.
+
+        Args:
+            *colliders (Collider): Colliders taken with acquire or acquire_like.
+        """
+        for collider in colliders:
+            self._free.setdefault(type(collider), []).append(collider)
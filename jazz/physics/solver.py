@@ -0,0 +1,204 @@
+from math import sqrt
+from typing import TYPE_CHECKING
+
+from ..utils import Vec2
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+
+# Overlap beyond the slop that is too small to correct. Resting contacts settle within
+# it and stop moving their bodies, which would otherwise keep them awake.
+POSITION_TOLERANCE = 0.01
+
+
+class Contact:
+    """A contact between two bodies collected for the solver."""
+
+    __slots__ = (
+        "first", "second", "depth", "normal", "first_inverse_mass", "second_inverse_mass",
+        "restitution", "friction", "bounce", "normal_impulse", "tangent_impulse",
+    )
+
+    def __init__(self, first: "PhysicsObject", second: "PhysicsObject", depth: float, normal: Vec2) -> None:
+        self.first = first
+        self.second = second
+        self.depth = depth
+        # Points from the first body towards the second
+        self.normal = normal
+        self.first_inverse_mass = getattr(first, "inverse_mass", 0.0)
+        self.second_inverse_mass = getattr(second, "inverse_mass", 0.0)
+        self.restitution = max(getattr(first, "restitution", 0.0), getattr(second, "restitution", 0.0))
+        self.friction = sqrt(max(getattr(first, "friction", 0.0) * getattr(second, "friction", 0.0), 0.0))
+        self.bounce = 0.0
+        self.normal_impulse = 0.0
+        self.tangent_impulse = 0.0
+
+    def __repr__(self) -> str:
+        return f"Contact({self.first}, {self.second}, depth={self.depth}, normal={self.normal})"
+
+
+class ContactSolver:
+    """Resolves every contact of a frame together in a fixed number of iterations.
+
+    Bodies report their contacts while they move, and the scene calls solve once per
+    frame. Bodies with a velocity first go through sequential impulse iterations that
+    apply restitution and friction. Then every contact goes through position
+    correction iterations that push overlapping bodies apart in proportion to their
+    inverse masses, leaving at most ``slop`` of overlap so resting contacts persist.
+    The work is proportional to the number of contacts times the iteration counts.
+    """
+
+    def __init__(
+        self,
+        velocity_iterations: int = 8,
+        position_iterations: int = 4,
+        slop: float = 0.5,
+        correction: float = 0.8,
+    ) -> None:
+        """Initializes the ContactSolver.
+
+        Args:
+            velocity_iterations (int, optional): Sequential impulse iterations per frame. Defaults to 8.
+            position_iterations (int, optional): Position correction iterations per frame. Defaults to 4.
+            slop (float, optional): Overlap in pixels that is left uncorrected. Defaults to 0.5.
+            correction (float, optional): Fraction of the remaining overlap removed by each
+                position iteration. Defaults to 0.8.
+        """
+        self.velocity_iterations = velocity_iterations
+        self.position_iterations = position_iterations
+        self.slop = slop
+        self.correction = correction
+        self._contacts: dict[tuple[int, int], Contact] = {}
+
+    def __repr__(self) -> str:
+        return f"\nContactSolver: {len(self._contacts)} contacts"
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    @property
+    def contacts(self) -> list[Contact]:
+        """list[Contact]: The contacts collected for the current frame."""
+        return list(self._contacts.values())
+
+    def add_contact(self, first: "PhysicsObject", second: "PhysicsObject", depth: float, normal: Vec2) -> None:
+        """Records a contact for the current frame.
+
+        A pair is stored once, a later report of the same pair replaces the earlier one.
+        Contacts where neither object can move are ignored.
+
+        Args:
+            first (PhysicsObject): The first object.
+            second (PhysicsObject): The second object.
+            depth (float): Penetration depth.
+            normal (Vec2): Collision normal pointing from the first to the second object.
+        """
+        if id(first) > id(second):
+            first, second, normal = second, first, -normal
+        contact = Contact(first, second, depth, Vec2(normal))
+        if contact.first_inverse_mass or contact.second_inverse_mass:
+            self._contacts[(id(first), id(second))] = contact
+
+    def clear(self) -> None:
+        """Drops every collected contact."""
+        self._contacts.clear()
+
+    def solve(self) -> None:
+        """Resolves the collected contacts, then clears them."""
+        contacts = list(self._contacts.values())
+        self._contacts.clear()
+        if not contacts:
+            return
+        self._solve_velocities(contacts)
+        self._solve_positions(contacts)
+
+    def _solve_velocities(self, contacts: list[Contact]) -> None:
+        """Runs sequential impulse iterations on contacts between bodies with velocities.
+
+        Args:
+            contacts (list[Contact]): The frame's contacts.
+        """
+        velocities: dict["PhysicsObject", Vec2] = {}
+        solved = []
+        for contact in contacts:
+            first_velocity = getattr(contact.first, "velocity", None)
+            second_velocity = getattr(contact.second, "velocity", None)
+            # Bodies without a velocity act as immovable for the impulse step
+            first_mass = contact.first_inverse_mass if first_velocity is not None else 0.0
+            second_mass = contact.second_inverse_mass if second_velocity is not None else 0.0
+            if not first_mass and not second_mass:
+                continue
+            if first_velocity is not None:
+                first_velocity = velocities.setdefault(contact.first, Vec2(first_velocity))
+            else:
+                first_velocity = Vec2()
+            if second_velocity is not None:
+                second_velocity = velocities.setdefault(contact.second, Vec2(second_velocity))
+            else:
+                second_velocity = Vec2()
+            approach = (second_velocity - first_velocity).dot(contact.normal)
+            contact.bounce = -contact.restitution * approach if approach < 0 else 0.0
+            solved.append((contact, first_velocity, second_velocity, first_mass, second_mass))
+
+        for _ in range(self.velocity_iterations):
+            for contact, first_velocity, second_velocity, first_mass, second_mass in solved:
+                normal = contact.normal
+                total_mass = first_mass + second_mass
+
+                # Normal impulse, accumulated and clamped so bodies are only ever pushed apart
+                relative = second_velocity - first_velocity
+                impulse = (contact.bounce - relative.dot(normal)) / total_mass
+                accumulated = max(contact.normal_impulse + impulse, 0.0)
+                impulse = accumulated - contact.normal_impulse
+                contact.normal_impulse = accumulated
+                first_velocity -= normal * (impulse * first_mass)
+                second_velocity += normal * (impulse * second_mass)
+
+                # Friction impulse, bounded by the normal impulse
+                tangent = Vec2(-normal.y, normal.x)
+                relative = second_velocity - first_velocity
+                impulse = -relative.dot(tangent) / total_mass
+                limit = contact.friction * contact.normal_impulse
+                accumulated = min(max(contact.tangent_impulse + impulse, -limit), limit)
+                impulse = accumulated - contact.tangent_impulse
+                contact.tangent_impulse = accumulated
+                first_velocity -= tangent * (impulse * first_mass)
+                second_velocity += tangent * (impulse * second_mass)
+
+        for body, velocity in velocities.items():
+            body.velocity = velocity
+
+    def _solve_positions(self, contacts: list[Contact]) -> None:
+        """Runs position correction iterations and moves each corrected body once.
+
+        Args:
+            contacts (list[Contact]): The frame's contacts.
+        """
+        shifts: dict["PhysicsObject", Vec2] = {}
+        for contact in contacts:
+            if contact.first_inverse_mass:
+                shifts.setdefault(contact.first, Vec2())
+            if contact.second_inverse_mass:
+                shifts.setdefault(contact.second, Vec2())
+        zero = Vec2()
+
+        for _ in range(self.position_iterations):
+            for contact in contacts:
+                first_shift = shifts.get(contact.first, zero)
+                second_shift = shifts.get(contact.second, zero)
+                normal = contact.normal
+                # Estimate the remaining overlap from how far the bodies were already moved
+                depth = contact.depth - (second_shift - first_shift).dot(normal)
+                if depth <= self.slop + POSITION_TOLERANCE:
+                    continue
+                first_mass = contact.first_inverse_mass
+                second_mass = contact.second_inverse_mass
+                amount = (depth - self.slop) * self.correction / (first_mass + second_mass)
+                if first_mass:
+                    first_shift -= normal * (amount * first_mass)
+                if second_mass:
+                    second_shift += normal * (amount * second_mass)
+
+        for body, shift in shifts.items():
+            if shift.x or shift.y:
+                body.move(shift)
@@ -0,0 +1,262 @@
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pygame
+
+    from ._physics_object import PhysicsObject
+    from .colliders import Collider
+
+
+class SweepAndPrune:
+    """A sweep-and-prune broadphase that keeps objects sorted along the x axis.
+
+    Every overlapping pair is found by a single sweep over the sorted axis. Stored boxes
+    are fattened by a margin and only refreshed when an object leaves its box, so small
+    moves neither re-sort nor re-sweep. Because objects move little between frames the
+    sort runs on almost sorted input, which Python's sort handles in near linear time.
+    Queries from objects still inside their stored box reuse the neighbours found by the
+    sweep instead of rescanning.
+    """
+
+    def __init__(self, margin: float = 8.0) -> None:
+        """Initializes the SweepAndPrune broadphase.
+
+        Args:
+            margin (float, optional): Distance each bounding box is fattened by. Objects
+                moving less than it keep their stored box. Defaults to 8.0.
+        """
+        self._objects: list["PhysicsObject"] = []
+        self._object_set: set["PhysicsObject"] = set()
+        self._dirty: set["PhysicsObject"] = set()
+        self._masks: dict["PhysicsObject", int] = {}
+        self._margin = margin
+        self._bounds: dict["PhysicsObject", tuple[float, float, float, float]] = {}
+        self._order: list["PhysicsObject"] = []
+
+        # Results of the last sweep
+        self._swept_order: list["PhysicsObject"] = []
+        self._swept_bounds: list[tuple[float, float, float, float]] = []
+        self._lefts: list[float] = []
+        self._max_width: float = 0.0
+        self._pairs: list[tuple["PhysicsObject", "PhysicsObject"]] = []
+        self._neighbours: dict["PhysicsObject", list["PhysicsObject"]] = {}
+        self._pairs_stale = False
+
+    def __repr__(self) -> str:
+        return f"\nSweepAndPrune: {self._objects}"
+
+    def add_object(self, physics_object: "PhysicsObject", mask: int = -1) -> None:
+        """Adds a physical object to the broadphase. It is sorted in on the next build.
+
+        Args:
+            physics_object (PhysicsObject): The object to add.
+            mask (int, optional): Layer bitmask stored with the entry and matched against query masks. Defaults to all layers.
+        """
+        self._masks[physics_object] = mask
+        if physics_object not in self._object_set:
+            self._object_set.add(physics_object)
+            self._objects.append(physics_object)
+        self._dirty.add(physics_object)
+
+    def remove_object(self, physics_object: "PhysicsObject") -> None:
+        """Removes a physical object and every pair it is part of.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+        """
+        self._masks.pop(physics_object, None)
+        if physics_object not in self._object_set:
+            return
+        self._object_set.remove(physics_object)
+        self._objects.remove(physics_object)
+        self._dirty.discard(physics_object)
+        if self._bounds.pop(physics_object, None) is not None:
+            self._order.remove(physics_object)
+        for other in self._neighbours.pop(physics_object, ()):
+            neighbours = self._neighbours.get(other)
+            if neighbours is not None and physics_object in neighbours:
+                neighbours.remove(physics_object)
+        self._pairs_stale = True
+
+    def _store_bounds(self, physics_object: "PhysicsObject") -> bool:
+        """Stores an object's fattened bounding box if its rect left the stored one,
+        adding it to the sort order if new.
+
+        Args:
+            physics_object (PhysicsObject): The object to refresh.
+
+        Returns:
+            bool: True if the stored bounds changed.
+        """
+        rect = physics_object.collider.get_rect()
+        old_bounds = self._bounds.get(physics_object)
+        if old_bounds is not None and self._contains(old_bounds, rect):
+            return False
+        margin = self._margin
+        if old_bounds is None:
+            self._order.append(physics_object)
+        self._bounds[physics_object] = (rect.left - margin, rect.top - margin, rect.right + margin, rect.bottom + margin)
+        return True
+
+    @staticmethod
+    def _contains(bounds: tuple[float, float, float, float], rect: "pygame.Rect") -> bool:
+        """Checks whether a stored box fully contains a rect.
+
+        Args:
+            bounds (tuple[float, float, float, float]): The stored left, top, right and bottom.
+            rect (pygame.Rect): The rect to check.
+
+        Returns:
+            bool: True if the rect lies inside the box.
+        """
+        return (
+            bounds[0] <= rect.left and bounds[1] <= rect.top
+            and rect.right <= bounds[2] and rect.bottom <= bounds[3]
+        )
+
+    def build_grid(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Refreshes moved object bounds, then re-sorts and sweeps the axis if anything changed.
+
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every tracked object is refreshed. Defaults to None.
+        """
+        changed = False
+        if moved is None:
+            for physics_object in self._objects:
+                changed = self._store_bounds(physics_object) or changed
+        else:
+            tracked = self._object_set
+            dirty = self._dirty
+            for physics_object in dirty:
+                changed = self._store_bounds(physics_object) or changed
+            for physics_object in moved:
+                if physics_object in tracked and physics_object not in dirty:
+                    changed = self._store_bounds(physics_object) or changed
+        self._dirty.clear()
+        if changed or self._pairs_stale:
+            self._sort()
+            self._sweep()
+
+    def _sort(self) -> None:
+        """Sorts the objects by their left bound. Timsort is near linear on the almost
+        sorted order left by the previous frame."""
+        bounds = self._bounds
+        self._order.sort(key=lambda physics_object: bounds[physics_object][0])
+
+    def _sweep(self) -> None:
+        """Sweeps the sorted axis once, recording every pair whose bounds overlap."""
+        order = list(self._order)
+        sorted_bounds = [self._bounds[physics_object] for physics_object in order]
+        neighbours: dict["PhysicsObject", list["PhysicsObject"]] = {
+            physics_object: [] for physics_object in order
+        }
+        pairs = []
+        count = len(order)
+        max_width = 0.0
+        for i in range(count):
+            left, top, right, bottom = sorted_bounds[i]
+            max_width = max(max_width, right - left)
+            first = order[i]
+            for j in range(i + 1, count):
+                other_left, other_top, _, other_bottom = sorted_bounds[j]
+                if other_left > right:
+                    break
+                if other_top <= bottom and other_bottom >= top:
+                    second = order[j]
+                    pairs.append((first, second))
+                    neighbours[first].append(second)
+                    neighbours[second].append(first)
+
+        self._swept_order = order
+        self._swept_bounds = sorted_bounds
+        self._lefts = [bounds[0] for bounds in sorted_bounds]
+        self._max_width = max_width
+        self._pairs = pairs
+        self._neighbours = neighbours
+        self._pairs_stale = False
+
+    def get_pairs(self) -> list[tuple["PhysicsObject", "PhysicsObject"]]:
+        """Returns every pair of objects whose fattened bounds overlapped at the last build.
+
+        Each pair is reported exactly once.
+
+        Returns:
+            list[tuple[PhysicsObject, PhysicsObject]]: The candidate pairs.
+        """
+        if self._pairs_stale:
+            tracked = self._object_set
+            self._pairs = [pair for pair in self._pairs if pair[0] in tracked and pair[1] in tracked]
+            self._pairs_stale = False
+        return self._pairs
+
+    def _query(self, left: float, top: float, right: float, bottom: float) -> list["PhysicsObject"]:
+        """Finds objects whose swept bounds overlap a box using a binary search on the sorted axis.
+
+        Args:
+            left (float): Left boundary of the query box.
+            top (float): Top boundary of the query box.
+            right (float): Right boundary of the query box.
+            bottom (float): Bottom boundary of the query box.
+
+        Returns:
+            list[PhysicsObject]: Objects overlapping the query box.
+        """
+        lefts = self._lefts
+        start = bisect_left(lefts, left - self._max_width)
+        end = bisect_right(lefts, right)
+        tracked = self._object_set
+        found = []
+        for k in range(start, end):
+            _, other_top, other_right, other_bottom = self._swept_bounds[k]
+            if other_right >= left and other_top <= bottom and other_bottom >= top:
+                physics_object = self._swept_order[k]
+                if physics_object in tracked:
+                    found.append(physics_object)
+        return found
+
+    def get_AABB_collisions(self, collider: "PhysicsObject", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping the bounds of a query collider.
+
+        Indexed objects still inside their stored box reuse the neighbour list from the
+        last sweep. Objects that moved out of it, and objects that are not indexed, fall
+        back to a binary search on the sorted axis with their current rect.
+
+        Args:
+            collider (PhysicsObject): The object querying collisions.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate objects whose bounding boxes overlap.
+        """
+        rect = collider.collider.get_rect()
+        candidates = self._neighbours.get(collider)
+        bounds = self._bounds.get(collider)
+        if candidates is None or bounds is None or not self._contains(bounds, rect):
+            candidates = self._query(rect.left, rect.top, rect.right, rect.bottom)
+        return [
+            physics_object
+            for physics_object in candidates
+            if physics_object is not collider
+            and (mask is None or self._masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider.collider)
+        ]
+
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: int | None = None) -> list["PhysicsObject"]:
+        """Finds candidate collisions overlapping a basic Collider object bounds.
+
+        Args:
+            collider (Collider): The shape collider to check.
+            mask (int, optional): Layer bitmask, only entries sharing a layer with it are returned. Defaults to None (no filtering).
+
+        Returns:
+            list[PhysicsObject]: Candidate overlapping objects.
+        """
+        return [
+            physics_object
+            for physics_object in self._query(collider.left, collider.top, collider.right, collider.bottom)
+            if physics_object.collider is not collider
+            and (mask is None or self._masks[physics_object] & mask)
+            and physics_object.collider.collide_rect(collider)
+        ]
@@ -0,0 +1,401 @@
+from math import ceil, floor, inf
+from typing import Callable, Iterable
+
+import pygame
+
+from ..primatives import Draw
+from ..utils import Color, Vec2, import_csv_layout
+from .body import Body
+from .ccd import time_of_impact
+from .colliders import Collider, RectCollider, _segment_polygon
+from .narrowphase import collide, register_test
+
+# Cell values treated as empty when no solid test is given, as written by common tile editors
+EMPTY_TILES = ("", "-1")
+
+Layout = list[list[str]]
+SolidTest = Callable[[str], bool] | Iterable[str] | None
+
+
+def _solid_grid(layout: Layout | str, solid: SolidTest = None) -> list[list[bool]]:
+    """Converts a tile layout into rows of solid flags padded to the same length.
+
+    Args:
+        layout (list[list[str]] | str): Rows of tile values, or the path of a CSV layout.
+        solid (Callable[[str], bool] | Iterable[str], optional): Test or set of values
+            marking a tile as solid. Defaults to every value except "" and "-1".
+
+    Returns:
+        list[list[bool]]: One flag per tile, indexed [row][column].
+    """
+    if isinstance(layout, str):
+        layout = import_csv_layout(layout)
+    if solid is None:
+        is_solid = lambda value: value.strip() not in EMPTY_TILES
+    elif callable(solid):
+        is_solid = solid
+    else:
+        values = set(solid)
+        is_solid = lambda value: value.strip() in values
+    columns = max((len(row) for row in layout), default=0)
+    return [[is_solid(value) for value in row] + [False] * (columns - len(row)) for row in layout]
+
+
+def merge_tiles(layout: Layout | str, solid: SolidTest = None) -> list[tuple[int, int, int, int]]:
+    """Merges the solid tiles of a layout into rectangles by greedy meshing.
+
+    Rows are scanned top to bottom. Each uncovered solid tile starts a rectangle that
+    is first extended right along its row and then down for as long as every tile
+    below it is solid and uncovered. The result is not always the smallest possible
+    set, but it is close on typical level layouts and found in one pass.
+
+    Args:
+        layout (list[list[str]] | str): Rows of tile values, or the path of a CSV layout.
+        solid (Callable[[str], bool] | Iterable[str], optional): Test or set of values
+            marking a tile as solid. Defaults to every value except "" and "-1".
+
+    Returns:
+        list[tuple[int, int, int, int]]: The column, row, width and height in tiles of
+            each rectangle.
+    """
+    return _merge(_solid_grid(layout, solid))
+
+
+def _merge(grid: list[list[bool]]) -> list[tuple[int, int, int, int]]:
+    """Greedy meshing over a grid of solid flags, see merge_tiles.
+
+    Args:
+        grid (list[list[bool]]): Solid flags indexed [row][column].
+
+    Returns:
+        list[tuple[int, int, int, int]]: Column, row, width and height of each rectangle.
+    """
+    rows = len(grid)
+    columns = len(grid[0]) if rows else 0
+    covered = [[False] * columns for _ in range(rows)]
+    rects = []
+    for row in range(rows):
+        solid_row = grid[row]
+        covered_row = covered[row]
+        column = 0
+        while column < columns:
+            if not solid_row[column] or covered_row[column]:
+                column += 1
+                continue
+            end = column + 1
+            while end < columns and solid_row[end] and not covered_row[end]:
+                end += 1
+            bottom = row + 1
+            while bottom < rows and all(
+                grid[bottom][i] and not covered[bottom][i] for i in range(column, end)
+            ):
+                bottom += 1
+            for i in range(row, bottom):
+                covered[i][column:end] = [True] * (end - column)
+            rects.append((column, row, end - column, bottom - row))
+            column = end
+    return rects
+
+
+def _padded_rect(collider: Collider, offset: Vec2 | None = None) -> pygame.Rect:
+    """Bounds a collider with a whole pixel rect padded by 1px on each side.
+
+    Collider.get_rect truncates both the position and the size, which can cut up to
+    2px off the right and bottom of fractional bounds and drop shallow contacts.
+
+    Args:
+        collider (Collider): The collider to bound.
+        offset (Vec2, optional): Displacement applied to the bounds. Defaults to None.
+
+    Returns:
+        pygame.Rect: Rect containing the collider's exact bounds.
+    """
+    collider.get_rect()
+    dx, dy = (offset.x, offset.y) if offset is not None else (0, 0)
+    left = floor(collider.left + dx) - 1
+    top = floor(collider.top + dy) - 1
+    return pygame.Rect(left, top, ceil(collider.right + dx) + 1 - left, ceil(collider.bottom + dy) + 1 - top)
+
+
+class TileCollider(Collider):
+    """Grid-aligned collider covering every solid tile of a tile layout.
+
+    The position is the top left corner of the first tile and the collider is not
+    meant to be rotated. Solid tiles are merged into rectangles with merge_tiles and
+    each tile stores which rectangle covers it, so overlap, raycast and sweep queries
+    only look up the tiles under the queried area instead of testing every rectangle.
+    """
+
+    def __init__(self, layout: Layout | str | None = None, tile_size: float | int = 32, solid: SolidTest = None, **kwargs) -> None:
+        """Initializes the TileCollider.
+
+        Args:
+            layout (list[list[str]] | str, optional): Rows of tile values, or the path of
+                a CSV layout. Defaults to an empty layout.
+            tile_size (float | int, optional): Width and height of a tile. Defaults to 32.
+            solid (Callable[[str], bool] | Iterable[str], optional): Test or set of values
+                marking a tile as solid. Defaults to every value except "" and "-1".
+        """
+        if isinstance(layout, str):
+            layout = import_csv_layout(layout)
+        layout = [list(row) for row in layout or []]
+        kwargs["layout"] = layout
+        kwargs["tile_size"] = tile_size
+        if solid is not None and not callable(solid):
+            kwargs["solid"] = list(solid)
+        self._tile_size = tile_size
+        self._grid = _solid_grid(layout, solid)
+        self._rows = len(self._grid)
+        self._columns = len(self._grid[0]) if self._rows else 0
+        self._rects = _merge(self._grid)
+        # Index of the rectangle covering each tile, -1 for empty tiles
+        self._cells = [[-1] * self._columns for _ in range(self._rows)]
+        for index, (column, row, w, h) in enumerate(self._rects):
+            for i in range(row, row + h):
+                self._cells[i][column : column + w] = [index] * w
+        self._parts = [RectCollider(w * tile_size, h * tile_size) for _, _, w, h in self._rects]
+        width = self._columns * tile_size
+        height = self._rows * tile_size
+        self._vertices = [Vec2(0, 0), Vec2(width, 0), Vec2(width, height), Vec2(0, height)]
+        super().__init__(**kwargs)
+        self.collider_type = "Tile"
+
+    def on_transform_change(self) -> None:
+        """Moves the merged rectangles along with the collider."""
+        super().on_transform_change()
+        size = self._tile_size
+        origin = self.pos
+        for part, (column, row, w, h) in zip(self._parts, self._rects):
+            part.pos = origin + Vec2((column + w / 2) * size, (row + h / 2) * size)
+
+    @property
+    def parts(self) -> list[RectCollider]:
+        """list[RectCollider]: The merged rectangles, in world space."""
+        return self._parts
+
+    @property
+    def tile_size(self) -> float | int:
+        """float | int: The width and height of a tile."""
+        return self._tile_size
+
+    def tile_at(self, point: Vec2) -> bool:
+        """Checks whether a point lies in a solid tile.
+
+        Args:
+            point (Vec2): The point in world space.
+
+        Returns:
+            bool: True if the tile under the point is solid.
+        """
+        column = floor((point[0] - self.pos.x) / self._tile_size)
+        row = floor((point[1] - self.pos.y) / self._tile_size)
+        return 0 <= row < self._rows and 0 <= column < self._columns and self._grid[row][column]
+
+    def parts_in_rect(self, rect: pygame.Rect) -> list[RectCollider]:
+        """Looks up the merged rectangles covering the tiles under a rectangle.
+
+        Args:
+            rect (pygame.Rect): The area in world space.
+
+        Returns:
+            list[RectCollider]: Every rectangle covering at least one of those tiles, once.
+        """
+        size = self._tile_size
+        origin = self.pos
+        first_column = max(floor((rect.left - origin.x) / size), 0)
+        last_column = min(floor((rect.right - origin.x) / size), self._columns - 1)
+        first_row = max(floor((rect.top - origin.y) / size), 0)
+        last_row = min(floor((rect.bottom - origin.y) / size), self._rows - 1)
+        found = {}
+        for row in range(first_row, last_row + 1):
+            for index in self._cells[row][first_column : last_column + 1]:
+                if index >= 0:
+                    found[index] = None
+        parts = self._parts
+        return [parts[index] for index in found]
+
+    def collide_shape(self, collider: Collider) -> tuple[float, Vec2]:
+        """Tests another collider against the rectangles under it, keeping the deepest contact.
+
+        Args:
+            collider (Collider): The other collider.
+
+        Returns:
+            tuple[float, Vec2]: Penetration depth and normal pointing towards the other
+                collider, (0, Vec2()) if it touches no solid tile.
+        """
+        best = (0, Vec2())
+        for part in self.parts_in_rect(_padded_rect(collider)):
+            depth, normal = collide(part, collider)
+            if depth > best[0]:
+                best = (depth, normal)
+        return best
+
+    def intersect_segment(self, start: Vec2, end: Vec2) -> float | None:
+        """Finds where a line segment first enters a solid tile by walking the tiles it crosses.
+
+        Args:
+            start (Vec2): Start of the segment in world space.
+            end (Vec2): End of the segment in world space.
+
+        Returns:
+            float | None: The fraction of the segment before the first solid tile, 0 if it
+                starts in one, or None if it misses.
+        """
+        if not self._rects:
+            return None
+        start = Vec2(start)
+        direction = Vec2(end) - start
+        # Clip the walk to the layout's bounds first
+        enter = _segment_polygon(start, start + direction, self.vertices)
+        if enter is None:
+            return None
+        size = self._tile_size
+        origin = self.pos
+        local = start - origin
+        point = local + direction * enter
+        column = min(max(floor(point.x / size), 0), self._columns - 1)
+        row = min(max(floor(point.y / size), 0), self._rows - 1)
+
+        if direction.x > 0:
+            step_x, next_x, delta_x = 1, ((column + 1) * size - local.x) / direction.x, size / direction.x
+        elif direction.x < 0:
+            step_x, next_x, delta_x = -1, (column * size - local.x) / direction.x, -size / direction.x
+        else:
+            step_x, next_x, delta_x = 0, inf, inf
+        if direction.y > 0:
+            step_y, next_y, delta_y = 1, ((row + 1) * size - local.y) / direction.y, size / direction.y
+        elif direction.y < 0:
+            step_y, next_y, delta_y = -1, (row * size - local.y) / direction.y, -size / direction.y
+        else:
+            step_y, next_y, delta_y = 0, inf, inf
+
+        grid = self._grid
+        while 0 <= column < self._columns and 0 <= row < self._rows:
+            if grid[row][column]:
+                left = origin.x + column * size
+                top = origin.y + row * size
+                square = [
+                    Vec2(left, top),
+                    Vec2(left + size, top),
+                    Vec2(left + size, top + size),
+                    Vec2(left, top + size),
+                ]
+                fraction = _segment_polygon(start, start + direction, square)
+                if fraction is not None:
+                    return fraction
+            if min(next_x, next_y) > 1:
+                return None
+            if next_x < next_y:
+                column += step_x
+                next_x += delta_x
+            else:
+                row += step_y
+                next_y += delta_y
+        return None
+
+    def sweep(self, moving: Collider, direction: Vec2, skin: float = 0.0) -> tuple[float, Vec2] | None:
+        """Finds when a collider translating along a direction first touches a solid tile.
+
+        Args:
+            moving (Collider): The collider that moves.
+            direction (Vec2): The displacement of the moving collider over the step.
+            skin (float, optional): Depth the colliders may overlap by at the impact. Defaults to 0.
+
+        Returns:
+            tuple[float, Vec2] | None: The fraction of the displacement before the impact
+                and the contact normal pointing from the moving collider to the tiles, or
+                None if it reaches no tile.
+        """
+        rect = _padded_rect(moving)
+        swept = rect.union(_padded_rect(moving, direction))
+        best = None
+        for part in self.parts_in_rect(swept):
+            impact = time_of_impact(moving, part, direction, skin)
+            if impact is not None and (best is None or impact[0] < best[0]):
+                best = impact
+        return best
+
+    def render_debug(self, offset: Vec2) -> None:
+        """Renders the merged rectangles in debug mode.
+
+        Args:
+            offset (Vec2): Viewport offset.
+        """
+        for part in self._parts:
+            rect = part.get_rect()
+            Draw.rect(pygame.Rect(Vec2(rect.topleft) + offset, rect.size), Color("white"), 2)
+
+
+def _tile_test(tiles: TileCollider, other: Collider) -> tuple[float, Vec2]:
+    return tiles.collide_shape(other)
+
+
+for _other_type in ("Rect", "Circle", "Polygon", "Capsule", "Ray"):
+    register_test("Tile", _other_type, _tile_test)
+# Tile maps are static, two of them never need to be separated
+register_test("Tile", "Tile", lambda first, second: (0, Vec2()))
+
+
+def tile_bodies(
+    layout: Layout | str,
+    tile_size: float | int = 32,
+    solid: SolidTest = None,
+    pos: tuple[float, float] | Vec2 = (0, 0),
+    **kwargs,
+) -> list[Body]:
+    """Builds one static Body with a RectCollider per merged rectangle of a layout.
+
+    Args:
+        layout (list[list[str]] | str): Rows of tile values, or the path of a CSV layout.
+        tile_size (float | int, optional): Width and height of a tile. Defaults to 32.
+        solid (Callable[[str], bool] | Iterable[str], optional): Test or set of values
+            marking a tile as solid. Defaults to every value except "" and "-1".
+        pos (tuple[float, float] | Vec2, optional): Top left corner of the layout. Defaults to (0, 0).
+        **kwargs: Further arguments for every Body, e.g. layers.
+
+    Returns:
+        list[Body]: The bodies, ready to be added to a scene.
+    """
+    origin = Vec2(pos)
+    bodies = []
+    for column, row, w, h in merge_tiles(layout, solid):
+        body = Body(
+            pos=origin + Vec2((column + w / 2) * tile_size, (row + h / 2) * tile_size),
+            static=True,
+            **kwargs,
+        )
+        body.add_collider("Rect", w=w * tile_size, h=h * tile_size)
+        bodies.append(body)
+    return bodies
+
+
+def tile_map_body(
+    layout: Layout | str,
+    tile_size: float | int = 32,
+    solid: SolidTest = None,
+    pos: tuple[float, float] | Vec2 = (0, 0),
+    **kwargs,
+) -> Body:
+    """Builds a single static Body whose TileCollider covers the whole layout.
+
+    Args:
+        layout (list[list[str]] | str): Rows of tile values, or the path of a CSV layout.
+        tile_size (float | int, optional): Width and height of a tile. Defaults to 32.
+        solid (Callable[[str], bool] | Iterable[str], optional): Test or set of values
+            marking a tile as solid. Defaults to every value except "" and "-1".
+        pos (tuple[float, float] | Vec2, optional): Top left corner of the layout. Defaults to (0, 0).
+        **kwargs: Further arguments for the Body, e.g. layers.
+
+    Returns:
+        Body: The body, ready to be added to a scene.
+    """
+    kwargs.setdefault("name", "TileMap")
+    body = Body(pos=pos, static=True, **kwargs)
+    body.add_collider("Tile", layout=layout, tile_size=tile_size, solid=solid)
+    return body
+
+
+from ..engine.serializer import Serializer
+
+Serializer.register_class(TileCollider)
@@ -0,0 +1,720 @@
+from typing import TYPE_CHECKING, Iterable
+
+import pygame
+
+from ..utils import JazzException, Vec2
+from .area import Area
+from .area_tracker import AreaTracker
+from .batch_raycast import RaycastHits, raycast_shapes, np
+from .ccd import time_of_impact
+from .colliders import CircleCollider, RectCollider
+from .islands import IslandGraph
+from .narrowphase import collide, collide_batch
+from .pair_cache import PairCache
+from .parallel import NarrowphaseExecutor
+from .physics import PhysicsGrid
+from .shape_pool import ShapePool
+from .solver import ContactSolver
+
+if TYPE_CHECKING:
+    from ._physics_object import PhysicsObject
+    from .colliders import Collider
+
+
+class PhysicsWorld:
+    """Owns the broadphase indexes of a scene and routes layered queries through them.
+
+    Every dynamic object lives in one shared spatial index together with its layer
+    bitmask, so an object on several layers is stored once and a multi-layer query is
+    a single lookup filtered with a bitwise and. Layer n is bit ``1 << n`` of a mask,
+    so the mask "0001" is layer 0. Static bodies are kept in a separate static index
+    that is only rebuilt when one is added or explicitly moved. The world also owns
+    the NarrowphaseExecutor that can split large narrowphase batches across threads,
+    the IslandGraph that groups touching bodies for sleeping, the PairCache that
+    carries narrowphase results between frames, the ContactSolver that resolves
+    the contacts of each frame and the AreaTracker that notifies areas of what
+    enters and exits them. Shape queries use pooled colliders from a ShapePool
+    that never enter the scene graph.
+    """
+
+    MAX_LAYERS = 64
+
+    def __init__(
+        self,
+        layers: int = 32,
+        broadphase: type = PhysicsGrid,
+        static_broadphase: type = PhysicsGrid,
+        layer_broadphase: dict[int, type] | None = None,
+        narrowphase_workers: int | None = 1,
+    ) -> None:
+        """Initializes the PhysicsWorld.
+
+        Args:
+            layers (int, optional): Number of collision layers, at most 64. Defaults to 32.
+            broadphase (type, optional): Index type shared by every layer. Defaults to PhysicsGrid.
+            static_broadphase (type, optional): Index type for static bodies. Defaults to PhysicsGrid.
+            layer_broadphase (dict[int, type], optional): Index types for individual layers that
+                should not use the shared index. Layers sharing a type share one index. Defaults to None.
+            narrowphase_workers (int | None, optional): Threads large narrowphase batches are split
+                across on a GIL-free interpreter, None for one per CPU. Defaults to 1, testing serially.
+
+        Raises:
+            JazzException: If the layer count or a layer_broadphase key is out of range.
+        """
+        if not 0 < layers <= self.MAX_LAYERS:
+            raise JazzException(f"PhysicsWorld supports 1 to {self.MAX_LAYERS} layers, got {layers}")
+        self._layer_count = layers
+        self._all_layers = (1 << layers) - 1
+
+        # Group overridden layers by index type so each type gets a single index
+        masks: dict[type, int] = {}
+        for layer, index_type in (layer_broadphase or {}).items():
+            if not 0 <= layer < layers:
+                raise JazzException(f"layer_broadphase layer {layer} is outside of 0-{layers - 1}")
+            if index_type is not broadphase:
+                masks[index_type] = masks.get(index_type, 0) | (1 << layer)
+        shared_mask = self._all_layers
+        for mask in masks.values():
+            shared_mask &= ~mask
+
+        # The shared index is only built when some layer is left to use it
+        self._index = broadphase() if shared_mask else None
+        self._indexes: list[tuple[int, object]] = []
+        if shared_mask:
+            self._indexes.append((shared_mask, self._index))
+        for index_type, mask in masks.items():
+            self._indexes.append((mask, index_type()))
+
+        self._static_index = static_broadphase()
+        self._static_moved: set["PhysicsObject"] = set()
+        self._static_dirty: bool = False
+        self._layers: dict["PhysicsObject", int] = {}
+        self._static: set["PhysicsObject"] = set()
+        self.islands = IslandGraph()
+        self.narrowphase = NarrowphaseExecutor(narrowphase_workers)
+        self.pair_cache = PairCache(self.narrowphase)
+        self.solver = ContactSolver()
+        self.areas = AreaTracker()
+        self._shape_pool = ShapePool()
+
+    def __repr__(self) -> str:
+        return f"\nPhysicsWorld: {list(self._layers)}"
+
+    @property
+    def layer_count(self) -> int:
+        """int: The number of collision layers."""
+        return self._layer_count
+
+    @property
+    def indexes(self) -> list:
+        """list: Every dynamic index followed by the static index."""
+        return [index for _, index in self._indexes] + [self._static_index]
+
+    def to_mask(self, layers: str | int) -> int:
+        """Converts a binary layer string or int into a mask clipped to the world's layers.
+
+        Args:
+            layers (str | int): Binary string or int mask of layers.
+
+        Returns:
+            int: The layer bitmask.
+        """
+        if isinstance(layers, str):
+            layers = int(layers, 2)
+        return layers & self._all_layers
+
+    def add_object(self, physics_object: "PhysicsObject", layers: str | int, static: bool = False) -> None:
+        """Adds an object to the world on the given layers.
+
+        Args:
+            physics_object (PhysicsObject): The object to add.
+            layers (str | int): Layer mask the object is on.
+            static (bool, optional): Whether the object goes into the static index. Defaults to False.
+        """
+        mask = self.to_mask(layers)
+        self._layers[physics_object] = mask
+        if isinstance(physics_object, Area):
+            self.areas.add(physics_object)
+        if static:
+            self._static.add(physics_object)
+            self._static_index.add_object(physics_object, mask)
+            self._static_dirty = True
+            return
+        for index_mask, index in self._indexes:
+            if mask & index_mask:
+                index.add_object(physics_object, mask & index_mask)
+
+    def remove_object(self, physics_object: "PhysicsObject") -> None:
+        """Removes an object from every index it is in, wakes the bodies touching it and
+        reports it as exited from the areas it was in.
+
+        Args:
+            physics_object (PhysicsObject): The object to remove.
+        """
+        if self._layers.pop(physics_object, None) is None:
+            return
+        self.islands.remove(physics_object)
+        self.areas.remove(physics_object)
+        if physics_object in self._static:
+            self._static.discard(physics_object)
+            self._static_moved.discard(physics_object)
+            self._static_index.remove_object(physics_object)
+            return
+        for _, index in self._indexes:
+            index.remove_object(physics_object)
+
+    def mark_static_moved(self, physics_object: "PhysicsObject") -> None:
+        """Invalidates the static index entry of a static body that was explicitly moved,
+        waking the bodies resting on it.
+
+        Args:
+            physics_object (PhysicsObject): The static body that moved.
+        """
+        self.islands.wake_neighbours(physics_object)
+        self._static_moved.add(physics_object)
+        self._static_dirty = True
+
+    def sync_static(self) -> None:
+        """Hashes newly added and explicitly moved static bodies into the static index if needed."""
+        if self._static_dirty:
+            self._static_index.build_grid(self._static_moved)
+            self._static_moved.clear()
+            self._static_dirty = False
+
+    def build(self, moved: "Iterable[PhysicsObject] | None" = None) -> None:
+        """Brings every index up to date, starts a new frame in the pair cache and
+        notifies areas of what entered or exited them since the last build.
+
+        Args:
+            moved (Iterable[PhysicsObject], optional): Objects whose transforms changed
+                since the last build. If None, every object is refreshed. Defaults to None.
+        """
+        self.sync_static()
+        for _, index in self._indexes:
+            index.build_grid(moved)
+        self.pair_cache.begin_frame()
+        self.areas.update(moved, self)
+
+    def get_AABB_collisions(self, physics_object: "PhysicsObject", mask: str | int | None = None) -> list["PhysicsObject"]:
+        """Finds objects on any of the queried layers whose bounds overlap an object.
+
+        Static bodies only query the dynamic indexes, so static-vs-static candidates
+        are never produced. Each object is reported once.
+
+        Args:
+            physics_object (PhysicsObject): The object to check for collisions against.
+            mask (str | int, optional): Layers to query. Defaults to the object's collision_layers.
+
+        Returns:
+            list[PhysicsObject]: The overlapping objects.
+        """
+        mask = self.to_mask(physics_object.collision_layers if mask is None else mask)
+        if not mask:
+            return []
+        collisions = []
+        queried = 0
+        for index_mask, index in self._indexes:
+            if mask & index_mask:
+                collisions += index.get_AABB_collisions(physics_object, mask)
+                queried += 1
+        if physics_object not in self._static:
+            self.sync_static()
+            collisions += self._static_index.get_AABB_collisions(physics_object, mask)
+        if queried > 1:
+            collisions = list(dict.fromkeys(collisions))
+        return collisions
+
+    def get_simple_AABB_collisions(self, collider: "Collider", mask: str | int = -1) -> list["PhysicsObject"]:
+        """Finds objects on any of the queried layers whose bounds overlap a bare collider.
+
+        Args:
+            collider (Collider): The shape collider to check.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+
+        Returns:
+            list[PhysicsObject]: The overlapping objects.
+        """
+        mask = self.to_mask(mask)
+        collisions = []
+        queried = 0
+        for index_mask, index in self._indexes:
+            if mask & index_mask:
+                collisions += index.get_simple_AABB_collisions(collider, mask)
+                queried += 1
+        self.sync_static()
+        collisions += self._static_index.get_simple_AABB_collisions(collider, mask)
+        if queried > 1:
+            collisions = list(dict.fromkeys(collisions))
+        return collisions
+
+    def get_swept_collisions(
+        self, physics_object: "PhysicsObject", direction: Vec2, mask: str | int | None = None
+    ) -> list["PhysicsObject"]:
+        """Finds objects whose bounds overlap the area an object covers while it moves.
+
+        The query box is the union of the object's bounds at the start and end of the move.
+
+        Args:
+            physics_object (PhysicsObject): The moving object.
+            direction (Vec2): The displacement of the move.
+            mask (str | int, optional): Layers to query. Defaults to the object's collision_layers.
+
+        Returns:
+            list[PhysicsObject]: The objects overlapping the swept bounds, without the moving object.
+        """
+        rect = physics_object.collider.get_rect()
+        sweep = self._bounds_collider(rect.union(rect.move(direction.x, direction.y)))
+        mask = physics_object.collision_layers if mask is None else mask
+        collisions = [obj for obj in self.get_simple_AABB_collisions(sweep, mask) if obj is not physics_object]
+        self._shape_pool.release(sweep)
+        return collisions
+
+    def cell_snapshot(
+        self, physics_object: "PhysicsObject", mask: str | int | None = None
+    ) -> list[tuple[object, set[str], int]] | None:
+        """Records the cells a bounds query for an object looks in and when they last changed.
+
+        Args:
+            physics_object (PhysicsObject): The querying object.
+            mask (str | int, optional): Layers the query covers. Defaults to the object's collision_layers.
+
+        Returns:
+            list[tuple[object, set[str], int]] | None: The queried indexes with their cells and
+                build count, or None if one of them does not track cell changes.
+        """
+        mask = self.to_mask(physics_object.collision_layers if mask is None else mask)
+        indexes = [index for index_mask, index in self._indexes if mask & index_mask]
+        if physics_object not in self._static:
+            self.sync_static()
+            indexes.append(self._static_index)
+        snapshot = []
+        for index in indexes:
+            if not hasattr(index, "cells_changed"):
+                return None
+            snapshot.append((index, index.query_cells(physics_object), index.build_count))
+        return snapshot
+
+    def cells_unchanged(
+        self, snapshot: list[tuple[object, set[str], int]], moved: "set[PhysicsObject]"
+    ) -> bool:
+        """Checks that nothing entered, left or moved in the cells of a snapshot.
+
+        Args:
+            snapshot (list[tuple[object, set[str], int]]): A result of cell_snapshot.
+            moved (set[PhysicsObject]): Objects that moved since the last build.
+
+        Returns:
+            bool: True if a query repeated now would find the same objects in the same places.
+        """
+        for index, cells, build_count in snapshot:
+            if index.cells_changed(cells, build_count):
+                return False
+            grid = index.grid
+            for cell_key in cells:
+                for physics_object in grid.get(cell_key, ()):
+                    if physics_object in moved:
+                        return False
+        return True
+
+    def raycast(
+        self,
+        origin: Vec2,
+        direction: Vec2,
+        max_dist: float,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> tuple["PhysicsObject | None", Vec2 | None]:
+        """Finds the first object along a ray on any of the queried layers.
+
+        Indexes with their own raycast, such as PhysicsGrid, walk the cells along the ray.
+        Other indexes are queried with the ray's bounds and every candidate is tested.
+
+        Args:
+            origin (Vec2): Start of the ray.
+            direction (Vec2): Direction of the ray, it does not need to be normalized.
+            max_dist (float): Length of the ray.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects the ray passes through. Defaults to None.
+
+        Returns:
+            tuple[PhysicsObject | None, Vec2 | None]: The closest object hit and the hit point, or (None, None).
+        """
+        mask = self._all_layers if mask is None else self.to_mask(mask)
+        if ignore is not None and not isinstance(ignore, (set, frozenset)):
+            ignore = set(ignore)
+        origin = Vec2(origin)
+        self.sync_static()
+        indexes = [index for index_mask, index in self._indexes if mask & index_mask]
+        indexes.append(self._static_index)
+
+        closest = None
+        closest_point = None
+        closest_dist = float("inf")
+        for index in indexes:
+            raycast = getattr(index, "raycast", None)
+            if raycast is not None:
+                hit, point = raycast(origin, direction, max_dist, mask, ignore)
+            else:
+                hit, point = self._raycast_candidates(index, origin, direction, max_dist, mask, ignore)
+            if hit is not None:
+                dist = (point - origin).magnitude_squared()
+                if dist < closest_dist:
+                    closest, closest_point, closest_dist = hit, point, dist
+        return closest, closest_point
+
+    def raycast_batch(
+        self,
+        origins: "np.ndarray",
+        directions: "np.ndarray",
+        lengths: "np.ndarray | float",
+        mask: str | int | None = None,
+    ) -> RaycastHits:
+        """Casts many rays at once with NumPy.
+
+        Candidates are gathered with a single bounds query covering every ray, then all
+        rays are tested against all candidate edges and circles with array operations.
+
+        Args:
+            origins (np.ndarray): (N, 2) ray origins, or a single origin shared by every ray.
+            directions (np.ndarray): (N, 2) ray directions, they do not need to be normalized.
+            lengths (np.ndarray | float): (N,) ray lengths, or one length for every ray.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+
+        Returns:
+            RaycastHits: The closest hit of every ray.
+
+        Raises:
+            JazzException: If numpy is not installed.
+        """
+        if np is None:
+            raise JazzException("raycast_batch requires numpy, install it with 'pip install jazz[numpy]'")
+        origins = np.asarray(origins, dtype=np.float64)
+        directions = np.asarray(directions, dtype=np.float64)
+        lengths = np.asarray(lengths, dtype=np.float64)
+        count = np.broadcast_shapes(origins.shape[:-1], directions.shape[:-1], lengths.shape)
+        count = count[0] if count else 1
+        origins = np.broadcast_to(origins, (count, 2))
+        directions = np.broadcast_to(directions, (count, 2))
+        lengths = np.broadcast_to(lengths, (count,))
+        if not count:
+            return raycast_shapes([], origins, directions, lengths)
+
+        norms = np.hypot(directions[:, 0], directions[:, 1])
+        scale = np.divide(lengths, norms, out=np.zeros(count), where=norms > 0)
+        ends = origins + directions * scale[:, None]
+        left, top = np.minimum(origins, ends).min(axis=0)
+        right, bottom = np.maximum(origins, ends).max(axis=0)
+        bounds = pygame.Rect(int(left), int(top), int(right - left) + 1, int(bottom - top) + 1)
+
+        mask = self._all_layers if mask is None else mask
+        query = self._bounds_collider(bounds)
+        candidates = self.get_simple_AABB_collisions(query, mask)
+        self._shape_pool.release(query)
+        return raycast_shapes(candidates, origins, directions, lengths)
+
+    def _raycast_candidates(
+        self,
+        index: object,
+        origin: Vec2,
+        direction: Vec2,
+        max_dist: float,
+        mask: int,
+        ignore: set["PhysicsObject"] | None,
+    ) -> tuple["PhysicsObject | None", Vec2 | None]:
+        """Raycasts an index without a raycast of its own by testing everything in the ray's bounds.
+
+        Args:
+            index (object): The index to query.
+            origin (Vec2): Start of the ray.
+            direction (Vec2): Direction of the ray.
+            max_dist (float): Length of the ray.
+            mask (int): Layers to query.
+            ignore (set[PhysicsObject] | None): Objects the ray passes through.
+
+        Returns:
+            tuple[PhysicsObject | None, Vec2 | None]: The closest object hit and the hit point, or (None, None).
+        """
+        if not (direction.x or direction.y) or max_dist <= 0:
+            return None, None
+        end = origin + Vec2(direction).normalize() * max_dist
+        bounds = pygame.Rect(origin, (0, 0)).union(pygame.Rect(end, (0, 0)))
+        query = self._bounds_collider(bounds)
+        closest = None
+        closest_fraction = float("inf")
+        for physics_object in index.get_simple_AABB_collisions(query, mask):
+            if ignore and physics_object in ignore:
+                continue
+            fraction = physics_object.collider.intersect_segment(origin, end)
+            if fraction is not None and fraction < closest_fraction:
+                closest, closest_fraction = physics_object, fraction
+        self._shape_pool.release(query)
+        if closest is None:
+            return None, None
+        return closest, origin + (end - origin) * closest_fraction
+
+    def overlap_shape(
+        self,
+        shape: "Collider",
+        pos: Vec2,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the objects a shape would overlap if it were placed somewhere.
+
+        The shape is copied onto a pooled collider, so neither it nor its owner is moved.
+
+        Args:
+            shape (Collider): The collider whose shape to test.
+            pos (Vec2): Where to place the shape.
+            rotation (float, optional): Rotation of the shape in degrees. Defaults to 0.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with the
+                penetration depth and the normal pointing from the shape to each object.
+        """
+        query = self._shape_pool.acquire_like(shape, pos, rotation)
+        overlaps = self._overlap(query, mask, ignore)
+        self._shape_pool.release(query)
+        return overlaps
+
+    def overlap_circle(
+        self,
+        pos: Vec2,
+        radius: float,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the objects overlapping a circle.
+
+        Args:
+            pos (Vec2): Center of the circle.
+            radius (float): Radius of the circle.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with the
+                penetration depth and the normal pointing from the circle to each object.
+        """
+        query = self._shape_pool.acquire(CircleCollider, pos, radius=radius)
+        overlaps = self._overlap(query, mask, ignore)
+        self._shape_pool.release(query)
+        return overlaps
+
+    def overlap_rect(
+        self,
+        pos: Vec2,
+        w: float,
+        h: float,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Finds the objects overlapping a rectangle.
+
+        Args:
+            pos (Vec2): Center of the rectangle.
+            w (float): Width of the rectangle.
+            h (float): Height of the rectangle.
+            rotation (float, optional): Rotation of the rectangle in degrees. Defaults to 0.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with the
+                penetration depth and the normal pointing from the rectangle to each object.
+        """
+        query = self._shape_pool.acquire(RectCollider, pos, rotation, w=w, h=h)
+        overlaps = self._overlap(query, mask, ignore)
+        self._shape_pool.release(query)
+        return overlaps
+
+    def overlap_point(
+        self,
+        point: Vec2,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> list["PhysicsObject"]:
+        """Finds the objects containing a point.
+
+        Args:
+            point (Vec2): The point to test.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects to leave out. Defaults to None.
+
+        Returns:
+            list[PhysicsObject]: The objects whose shapes contain the point.
+        """
+        point = Vec2(point)
+        query = self._bounds_collider(pygame.Rect(point, (0, 0)))
+        candidates = self.get_simple_AABB_collisions(query, self._all_layers if mask is None else mask)
+        self._shape_pool.release(query)
+        return [
+            obj
+            for obj in candidates
+            if not (ignore and obj in ignore) and obj.collider.intersect_segment(point, point) == 0
+        ]
+
+    def shape_cast(
+        self,
+        shape: "Collider",
+        start: Vec2,
+        end: Vec2,
+        rotation: float = 0,
+        mask: str | int | None = None,
+        ignore: Iterable["PhysicsObject"] | None = None,
+    ) -> tuple["PhysicsObject | None", float, Vec2]:
+        """Sweeps a shape from one position to another and finds the first object it touches.
+
+        The shape is copied onto a pooled collider, so neither it nor its owner is moved.
+        Objects the shape already overlaps at the start are hit at once.
+
+        Args:
+            shape (Collider): The collider whose shape to sweep.
+            start (Vec2): Where the sweep starts.
+            end (Vec2): Where the sweep ends.
+            rotation (float, optional): Rotation of the shape in degrees. Defaults to 0.
+            mask (str | int, optional): Layers to query. Defaults to every layer.
+            ignore (Iterable[PhysicsObject], optional): Objects the shape passes through. Defaults to None.
+
+        Returns:
+            tuple[PhysicsObject | None, float, Vec2]: The first object hit, the fraction of the
+                sweep travelled before touching it and the contact normal pointing from the
+                shape to it, or (None, 1.0, Vec2()) if the path is clear.
+        """
+        start = Vec2(start)
+        direction = Vec2(end) - start
+        query = self._shape_pool.acquire_like(shape, start, rotation)
+        rect = query.get_rect()
+        bounds = self._bounds_collider(rect.union(rect.move(direction.x, direction.y)))
+        candidates = self.get_simple_AABB_collisions(bounds, self._all_layers if mask is None else mask)
+
+        closest = None
+        closest_fraction = 1.0
+        closest_normal = Vec2()
+        for physics_object in candidates:
+            if ignore and physics_object in ignore:
+                continue
+            impact = time_of_impact(query, physics_object.collider, direction)
+            if impact is None:
+                depth, normal = collide(query, physics_object.collider)
+                if depth <= 0:
+                    continue
+                impact = (0.0, normal)
+            if closest is None or impact[0] < closest_fraction:
+                closest = physics_object
+                closest_fraction, closest_normal = impact
+        self._shape_pool.release(query, bounds)
+        return closest, closest_fraction, closest_normal
+
+    def _overlap(
+        self, query: "Collider", mask: str | int | None, ignore: Iterable["PhysicsObject"] | None
+    ) -> list[tuple["PhysicsObject", tuple[float, Vec2]]]:
+        """Tests a placed query collider against every object in its bounds.
+
+        Args:
+            query (Collider): The placed collider.
+            mask (str | int | None): Layers to query, None for every layer.
+            ignore (Iterable[PhysicsObject] | None): Objects to leave out.
+
+        Returns:
+            list[tuple[PhysicsObject, tuple[float, Vec2]]]: The overlapped objects with the
+                penetration depth and normal of each.
+        """
+        candidates = self.get_simple_AABB_collisions(query, self._all_layers if mask is None else mask)
+        if ignore:
+            candidates = [obj for obj in candidates if obj not in ignore]
+        results = collide_batch([(query, obj.collider) for obj in candidates], self.narrowphase)
+        return [(obj, result) for obj, result in zip(candidates, results) if result[0] > 0]
+
+    def _bounds_collider(self, rect: pygame.Rect) -> RectCollider:
+        """Takes a pooled collider covering a rect for bounds queries.
+
+        Args:
+            rect (pygame.Rect): The area to cover.
+
+        Returns:
+            RectCollider: The collider, padded by a pixel on each side for the rounding of
+                integer rects. Hand it back to the shape pool when done.
+        """
+        rect = rect.inflate(2, 2)
+        return self._shape_pool.acquire(RectCollider, rect.center, w=rect.w, h=rect.h)
+
+    def get_layer_collisions(self, physics_object: "PhysicsObject", layer: int = 0) -> list["PhysicsObject"]:
+        """Finds objects on a single layer whose bounds overlap an object.
+
+        Args:
+            physics_object (PhysicsObject): The object to check for collisions against.
+            layer (int, optional): The layer number. Defaults to 0.
+
+        Returns:
+            list[PhysicsObject]: The overlapping objects.
+        """
+        return self.get_AABB_collisions(physics_object, 1 << layer)
+
+    def get_pairs(self) -> list[tuple["PhysicsObject", "PhysicsObject"]]:
+        """Gets the candidate pairs found by the dynamic indexes at the last build.
+
+        Only indexes that produce pair lists, such as SweepAndPrune, contribute pairs,
+        together with the objects they overlap in the other dynamic indexes. A pair is
+        reported once if either object's collision_layers covers a layer of the other,
+        the same rule get_AABB_collisions follows. Pairs between dynamic objects and
+        static bodies are included, static-vs-static pairs are not.
+
+        Returns:
+            list[tuple[PhysicsObject, PhysicsObject]]: Pairs of objects whose bounds overlap.
+        """
+        self.sync_static()
+        matches = self._layers_match
+        static = self._static_index
+        indexes = [index for _, index in self._indexes]
+        pairs = []
+        for i, index in enumerate(indexes):
+            get_pairs = getattr(index, "get_pairs", None)
+            if get_pairs is None:
+                continue
+            pairs += [pair for pair in get_pairs() if matches(*pair)]
+            if hasattr(index, "query_pairs") and isinstance(static, type(index)):
+                pairs += [pair for pair in index.query_pairs(static) if matches(*pair)]
+            else:
+                for physics_object in index._objects:
+                    for other in static.get_AABB_collisions(physics_object):
+                        if matches(physics_object, other):
+                            pairs.append((physics_object, other))
+            # Objects of different indexes never meet in a pair list, so query across
+            for j, other_index in enumerate(indexes):
+                if j == i or (j < i and hasattr(other_index, "get_pairs")):
+                    continue
+                for physics_object in index._objects:
+                    for other in other_index.get_AABB_collisions(physics_object):
+                        if other is not physics_object and matches(physics_object, other):
+                            pairs.append((physics_object, other))
+        if len(self._indexes) > 1:
+            seen = set()
+            unique = []
+            for first, second in pairs:
+                key = (id(first), id(second)) if id(first) < id(second) else (id(second), id(first))
+                if key not in seen:
+                    seen.add(key)
+                    unique.append((first, second))
+            pairs = unique
+        return pairs
+
+    def _layers_match(self, first: "PhysicsObject", second: "PhysicsObject") -> bool:
+        """Checks whether either object's collision_layers covers a layer of the other.
+
+        Args:
+            first (PhysicsObject): One object of the pair.
+            second (PhysicsObject): The other object of the pair.
+
+        Returns:
+            bool: True if the pair can collide.
+        """
+        layers = self._layers
+        return bool(
+            layers[first] & self.to_mask(second.collision_layers)
+            or layers[second] & self.to_mask(first.collision_layers)
+        )
@@ -22,6 +22,8 @@ COLLIDER_RECT = 0
 COLLIDER_POLY = 1
 COLLIDER_CIRCLE = 2
 COLLIDER_RAY = 3
+COLLIDER_CAPSULE = 4
+COLLIDER_TILE = 5
 SURFACE = 0
 SPRITE_SHEET = 1
 TEXTURE = 2
@@ -351,8 +351,8 @@ class PhysicsTest(Test):
         # Refresh stats
         self.fps_label.set_text(f"FPS: {Globals.app.get_fps():2.2f}")
 
-        # Sum occupied cells across all layers
-        cells_count = sum(len(layer_grid.grid) for layer_grid in self._physics_world.values())
+        # Sum occupied cells across the dynamic and static indexes
+        cells_count = sum(len(index.grid) for index in self._physics_world.indexes)
         total_bodies = len(self.dynamic_bodies) + len(self.static_bodies)
         self.stats_label.set_text(
             f"Bodies: {total_bodies} (Dyn: {len(self.dynamic_bodies)}, Stat: {len(self.static_bodies)}) | Grid Cells: {cells_count}"
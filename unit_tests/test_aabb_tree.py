@@ -0,0 +1,97 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics.physics import PhysicsGrid
+from jazz.physics.aabb_tree import DynamicAABBTree
+from test_physics_grid import MockPhysicsObject
+
+
+class TestDynamicAABBTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = DynamicAABBTree(margin=5)
+
+    def _check_tree(self, node):
+        if node.is_leaf:
+            return 0
+        self.assertIs(node.child1.parent, node)
+        self.assertIs(node.child2.parent, node)
+        for child in (node.child1, node.child2):
+            self.assertLessEqual(node.left, child.left)
+            self.assertLessEqual(node.top, child.top)
+            self.assertGreaterEqual(node.right, child.right)
+            self.assertGreaterEqual(node.bottom, child.bottom)
+        h1 = self._check_tree(node.child1)
+        h2 = self._check_tree(node.child2)
+        self.assertLessEqual(abs(h1 - h2), 1)
+        self.assertEqual(node.height, 1 + max(h1, h2))
+        return node.height
+
+    def test_matches_physics_grid(self):
+        rng = random.Random(11)
+        reference = PhysicsGrid()
+        objects = []
+        for i in range(150):
+            size = rng.choice((4, 20, 2000))
+            obj = MockPhysicsObject(pygame.Rect(rng.randint(-1000, 1000), rng.randint(-1000, 1000), size, rng.randint(4, 40)), f"obj{i}")
+            objects.append(obj)
+            self.tree.add_object(obj)
+            reference.add_object(obj)
+        self.tree.build_grid()
+        reference.build_grid()
+        self._check_tree(self.tree._root)
+
+        for obj in objects[:40]:
+            obj.collider.rect = obj.collider.rect.move(rng.randint(-100, 100), rng.randint(-100, 100))
+        self.tree.build_grid(set(objects[:40]))
+        reference.build_grid()
+        self._check_tree(self.tree._root)
+
+        for obj in objects:
+            self.assertCountEqual(self.tree.get_AABB_collisions(obj), reference.get_AABB_collisions(obj))
+
+        pairs = {frozenset(pair) for pair in self.tree.get_pairs()}
+        self.assertEqual(len(pairs), len(self.tree.get_pairs()))
+        for obj in objects:
+            for other in self.tree.get_AABB_collisions(obj):
+                self.assertIn(frozenset((obj, other)), pairs)
+
+    def test_fat_bounds_skip_reinsert(self):
+        obj = MockPhysicsObject(pygame.Rect(0, 0, 10, 10), "obj")
+        self.tree.add_object(obj)
+        self.tree.build_grid()
+        leaf = self.tree._leaves[obj]
+
+        obj.collider.rect = pygame.Rect(3, 3, 10, 10)
+        self.tree.build_grid({obj})
+        self.assertIs(self.tree._leaves[obj], leaf)
+
+        obj.collider.rect = pygame.Rect(30, 30, 10, 10)
+        self.tree.build_grid({obj})
+        self.assertIsNot(self.tree._leaves[obj], leaf)
+
+    def test_tree_vs_tree_and_remove(self):
+        other = DynamicAABBTree(margin=0)
+        wall = MockPhysicsObject(pygame.Rect(0, 0, 2000, 20), "wall")
+        bullet = MockPhysicsObject(pygame.Rect(1500, 10, 2, 2), "bullet")
+        far = MockPhysicsObject(pygame.Rect(1500, 500, 2, 2), "far")
+        self.tree.add_object(wall)
+        other.add_object(bullet)
+        other.add_object(far)
+        self.tree.build_grid()
+        other.build_grid()
+
+        self.assertEqual(self.tree.query_pairs(other), [(wall, bullet)])
+
+        other.remove_object(bullet)
+        self.assertEqual(other._objects, [far])
+        self.assertEqual(self.tree.query_pairs(other), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics import area_tracker
+from jazz.physics.area import Area
+from jazz.physics.body import Body
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class RecordingArea(Area):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+
+    def on_body_entered(self, body):
+        self.events.append(("entered", body))
+
+    def on_body_exited(self, body):
+        self.events.append(("exited", body))
+
+
+class TestAreaEvents(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def add_area(self, pos, **kwargs):
+        area = RecordingArea(pos=pos, **kwargs)
+        area.add_collider("Rect", w=40, h=40)
+        Globals.scene.add_object(area)
+        area.rotation = 0
+        return area
+
+    def add_body(self, pos):
+        body = Body(pos=pos)
+        body.add_collider("Circle", radius=5)
+        Globals.scene.add_object(body)
+        body.rotation = 0
+        return body
+
+    def step(self):
+        # Move what changed this frame into the next build, as the end of a frame does
+        Globals.scene._physics_moved.update(Globals.scene._moved_objects)
+        Globals.scene._moved_objects.clear()
+        Globals.scene._build_physics()
+
+    def test_enter_and_exit_fire_once(self):
+        area = self.add_area((0, 0))
+        body = self.add_body((100, 0))
+        self.step()
+        self.assertEqual(area.events, [])
+
+        body.pos = Vec2(10, 0)
+        self.step()
+        self.step()
+        self.assertEqual(area.events, [("entered", body)])
+        self.assertEqual(area.entered, [body])
+
+        # Moving inside the area is not a change, leaving it is
+        body.pos = Vec2(5, 5)
+        self.step()
+        body.pos = Vec2(100, 0)
+        self.step()
+        self.assertEqual(area.events, [("entered", body), ("exited", body)])
+        self.assertEqual(area.entered, [])
+
+        # Moving the area onto the body counts as well
+        area.pos = Vec2(90, 0)
+        self.step()
+        self.assertEqual(area.events[-1], ("entered", body))
+
+    def test_removal_and_deactivation(self):
+        area = self.add_area((0, 0))
+        first = self.add_body((0, 0))
+        second = self.add_body((5, 0))
+        self.step()
+        self.assertEqual(set(area.entered), {first, second})
+
+        first.kill()
+        self.assertEqual(area.events[-1], ("exited", first))
+        self.assertEqual(area.entered, [second])
+
+        area.active = False
+        self.step()
+        self.assertEqual(area.events[-1], ("exited", second))
+        second.pos = Vec2(1, 0)
+        self.step()
+        self.assertEqual(area.entered, [])
+
+        area.active = True
+        self.step()
+        self.assertEqual(area.events[-1], ("entered", second))
+
+        # Areas can be switched before they are in a scene
+        scene, Globals.scene = Globals.scene, None
+        idle = RecordingArea(pos=(0, 0))
+        idle.active = False
+        Globals.scene = scene
+        idle.add_collider("Rect", w=40, h=40)
+        scene.add_object(idle)
+        self.step()
+        self.assertEqual(idle.entered, [])
+
+    def test_idle_areas_are_not_tested(self):
+        areas = [self.add_area((x * 50, y * 50)) for x in range(20) for y in range(20)]
+        body = self.add_body((1000, 1000))
+        self.step()
+
+        calls = []
+        collide_batch = area_tracker.collide_batch
+        area_tracker.collide_batch = lambda pairs, executor=None: calls.append(pairs) or collide_batch(pairs, executor)
+        try:
+            self.step()
+            self.assertEqual(calls, [])
+            # A moving body only tests the area it moved into
+            body.pos = Vec2(50, 50)
+            self.step()
+            self.assertEqual(sum(len(pairs) for pairs in calls), 1)
+        finally:
+            area_tracker.collide_batch = collide_batch
+        self.assertEqual(areas[21].entered, [body])
+
+
+if __name__ == "__main__":
+    unittest.main()
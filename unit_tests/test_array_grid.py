@@ -0,0 +1,69 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics import array_grid
+from jazz.physics.array_grid import ArrayPhysicsGrid
+from jazz.physics.physics import PhysicsGrid
+from test_physics_grid import MockPhysicsObject
+
+
+@unittest.skipIf(array_grid.np is None, "numpy is not installed")
+class TestArrayPhysicsGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = ArrayPhysicsGrid(capacity=2)
+
+    def test_add_and_build(self):
+        obj = MockPhysicsObject(pygame.Rect(10, 10, 60, 60), "obj")
+        self.grid.add_object(obj)
+        self.grid.build_grid()
+
+        for x, y in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            self.assertEqual(self.grid.get_grid_cell(x, y), [obj])
+        self.assertEqual(self.grid.get_grid_cell(2, 2), [])
+
+    def test_move_and_remove(self):
+        obj = MockPhysicsObject(pygame.Rect(10, 10, 20, 20), "obj")
+        self.grid.add_object(obj)
+        self.grid.build_grid(set())
+        self.assertEqual(self.grid.get_grid_cell(0, 0), [obj])
+
+        obj.collider.rect = pygame.Rect(-60, -60, 20, 20)
+        self.grid.build_grid({obj})
+        self.assertEqual(self.grid.get_grid_cell(0, 0), [])
+        self.assertEqual(self.grid.get_grid_cell(-2, -2), [obj])
+
+        self.grid.remove_object(obj)
+        self.assertNotIn(obj, self.grid._objects)
+        self.assertEqual(self.grid.get_grid_cell(-2, -2), [])
+
+    def test_matches_physics_grid(self):
+        rng = random.Random(7)
+        reference = PhysicsGrid()
+        objects = []
+        for i in range(200):
+            rect = pygame.Rect(rng.randint(-500, 500), rng.randint(-500, 500), rng.randint(1, 150), rng.randint(1, 150))
+            obj = MockPhysicsObject(rect, f"obj{i}")
+            objects.append(obj)
+            self.grid.add_object(obj)
+            reference.add_object(obj)
+        self.grid.build_grid()
+        reference.build_grid()
+
+        for obj in objects[:50]:
+            self.assertCountEqual(self.grid.get_AABB_collisions(obj), reference.get_AABB_collisions(obj))
+
+        query = pygame.Rect(0, 0, 120, 80)
+        self.assertCountEqual(
+            self.grid.get_simple_AABB_collisions(query),
+            reference.get_simple_AABB_collisions(query),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.body import Body
+from jazz.physics.ccd import CCD_SKIN, time_of_impact
+from jazz.physics.colliders import CircleCollider, RectCollider
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+def make_collider(collider):
+    collider.rotation = collider.rotation
+    return collider
+
+
+class TestTimeOfImpact(unittest.TestCase):
+    def test_circles(self):
+        first = make_collider(CircleCollider(5, pos=(0, 0)))
+        second = make_collider(CircleCollider(5, pos=(30, 0)))
+        self.assertEqual(time_of_impact(first, second, Vec2(40, 0)), (0.5, Vec2(1, 0)))
+        # Too short, moving away, or passing beside the other circle
+        self.assertIsNone(time_of_impact(first, second, Vec2(10, 0)))
+        self.assertIsNone(time_of_impact(first, second, Vec2(-40, 0)))
+        self.assertIsNone(time_of_impact(first, second, Vec2(40, 40)))
+
+    def test_circle_against_rotated_rect(self):
+        circle = make_collider(CircleCollider(5, pos=(0, 0)))
+        diamond = RectCollider(10, 10, pos=(30, 9))
+        diamond.rotation = 45
+
+        # The circle meets the lower left face of the diamond
+        time, normal = time_of_impact(circle, diamond, Vec2(40, 0))
+        contact_x = 40 * time
+        self.assertAlmostEqual((31.93 - contact_x) / 2 ** 0.5, 5, places=1)
+        self.assertAlmostEqual(normal.x, normal.y, places=6)
+
+        # Overlapping shapes are left to the discrete test
+        diamond.pos = Vec2(3, 0)
+        self.assertIsNone(time_of_impact(circle, diamond, Vec2(40, 0)))
+
+
+class TestContinuousBodies(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def test_thin_wall(self):
+        wall = Body(pos=(100, 0), static=True)
+        wall.add_collider("Rect", w=2, h=200)
+        Globals.scene.add_object(wall)
+
+        for ccd in (False, True):
+            body = Body(pos=(0, 3), ccd=ccd)
+            body.add_collider("Rect", w=10, h=10)
+            Globals.scene.add_object(body)
+            body.rotation = 0
+            for _ in range(3):
+                Globals.scene._build_physics()
+                collisions = body.move_and_collide(Vec2(70, 0))
+                Globals.scene.contact_solver.solve()
+
+            if ccd:
+                # Stops just inside the wall and keeps reporting the contact
+                self.assertAlmostEqual(body.pos.x, 99 - 5 + CCD_SKIN, places=6)
+                self.assertEqual(len(collisions), 1)
+                self.assertIs(collisions[0][0], wall)
+            else:
+                self.assertEqual(body.pos.x, 210)
+            body.kill()
+
+
+if __name__ == "__main__":
+    unittest.main()
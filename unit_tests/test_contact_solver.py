@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.body import Body
+from jazz.physics.ray import Ray
+from jazz.physics.solver import ContactSolver
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class TestContactSolver(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+        self.solver = ContactSolver()
+
+    def make_body(self, pos, **kwargs):
+        body = Body(pos=pos, **kwargs)
+        body.add_collider(0, w=20, h=20)
+        Globals.scene.add_object(body)
+        return body
+
+    def test_position_correction_by_mass(self):
+        light = self.make_body((0, 0))
+        heavy = self.make_body((16, 0), mass=3)
+        self.solver.add_contact(light, heavy, 4, Vec2(1, 0))
+        self.solver.solve()
+
+        # The overlap is removed down to the slop, the heavy body moving a third as far
+        light_shift = -light.pos.x
+        heavy_shift = heavy.pos.x - 16
+        self.assertAlmostEqual(light_shift, heavy_shift * 3, places=6)
+        self.assertLessEqual(4 - light_shift - heavy_shift, self.solver.slop + 0.01)
+        self.assertEqual(len(self.solver), 0)
+
+    def test_static_and_reversed_contacts(self):
+        floor = self.make_body((0, 20), static=True)
+        body = self.make_body((0, 2))
+        # Reporting the same pair from both sides keeps one contact
+        self.solver.add_contact(floor, body, 2, Vec2(0, -1))
+        self.solver.add_contact(body, floor, 2, Vec2(0, 1))
+        self.assertEqual(len(self.solver), 1)
+        self.solver.solve()
+        self.assertEqual(floor.pos, Vec2(0, 20))
+        self.assertLess(body.pos.y, 2)
+
+        # Contacts between immovable objects are dropped
+        self.solver.add_contact(floor, self.make_body((0, 30), static=True), 5, Vec2(0, 1))
+        self.assertEqual(len(self.solver), 0)
+
+    def test_restitution_and_friction(self):
+        floor = self.make_body((0, 20), static=True)
+        bouncy = self.make_body((0, 0), restitution=1.0)
+        bouncy.velocity = Vec2(0, 100)
+        dull = self.make_body((100, 0), restitution=0.0, friction=0.5)
+        dull.velocity = Vec2(100, 100)
+        floor.friction = 1.0
+
+        self.solver.add_contact(bouncy, floor, 1, Vec2(0, 1))
+        self.solver.add_contact(dull, floor, 1, Vec2(0, 1))
+        self.solver.solve()
+
+        self.assertAlmostEqual(bouncy.velocity.y, -100, places=6)
+        self.assertAlmostEqual(dull.velocity.y, 0, places=6)
+        # Friction is bounded by the normal impulse, sqrt(0.5 * 1.0) of it
+        self.assertAlmostEqual(dull.velocity.x, 100 - 100 * 0.5 ** 0.5, places=6)
+
+    def test_sensors_are_not_solid(self):
+        ray = Ray(pos=(0, 20), length=100)
+        Globals.scene.add_object(ray)
+        ray.rotation = 0
+        body = self.make_body((50, -10))
+        body.rotation = 0
+        Globals.scene._build_physics()
+        collisions = body.move_and_collide(Vec2(0, 25))
+        self.assertEqual([obj for obj, _ in collisions], [ray])
+        self.assertEqual(len(Globals.scene.contact_solver), 0)
+        Globals.scene.contact_solver.solve()
+        self.assertEqual(body.pos, Vec2(50, 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
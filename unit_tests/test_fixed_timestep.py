@@ -0,0 +1,102 @@
+import os
+import sys
+import unittest
+
+# Set SDL to use dummy video driver for headless testing
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+pygame.init()
+
+from jazz import Application, GameObject, Globals, Scene, Sprite
+from jazz.utils import Vec2
+
+
+class Counter(GameObject):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.ticks = []
+
+    def fixed_update(self, delta):
+        self.ticks.append(delta)
+
+
+class TickScene(Scene):
+    name = "Ticks"
+
+    def __init__(self):
+        super().__init__()
+        self.ticks = 0
+
+    def on_load(self, _):
+        pass
+
+    def fixed_update(self, delta):
+        self.ticks += 1
+
+
+class TestFixedTimestep(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Application(200, 200, fixed_rate=30, max_substeps=3)
+
+    def setUp(self):
+        self.scene = TickScene()
+        self.scene._fixed_delta = 1 / 30
+        self.app._accumulator = 0
+        Globals.scene = self.scene
+
+    def test_accumulator_and_substep_cap(self):
+        parent = self.scene.add_object(Counter())
+        child = parent.add_child(Counter())
+
+        # Two frames at 144 Hz are not enough for a tick, the third one completes it
+        self.app._delta = 1 / 144
+        self.app._step_fixed(self.scene)
+        self.app._step_fixed(self.scene)
+        self.assertEqual(self.scene.ticks, 0)
+        self.assertAlmostEqual(self.scene._interpolation, 60 / 144)
+        self.app._step_fixed(self.scene)
+        self.app._step_fixed(self.scene)
+        self.app._step_fixed(self.scene)
+        self.assertEqual(self.scene.ticks, 1)
+        self.assertEqual(parent.ticks, [1 / 30])
+        self.assertEqual(child.ticks, [1 / 30])
+
+        # A long frame runs at most max_substeps ticks and drops the rest of the backlog
+        self.app._delta = 1.0
+        self.app._step_fixed(self.scene)
+        self.assertEqual(self.scene.ticks, 4)
+        self.assertLess(self.scene._interpolation, 1)
+
+    def test_sprite_interpolation(self):
+        sprite = self.scene.add_object(Sprite(pos=(0, 0)))
+        self.assertEqual(sprite._render_transform(), (Vec2(0, 0), 0))
+
+        class Mover(GameObject):
+            def fixed_update(self, delta):
+                sprite.pos += Vec2(30, 0)
+                sprite.rotation = 350
+
+        self.scene.add_object(Mover())
+        self.app._delta = 1.5 / 30
+        self.app._step_fixed(self.scene)
+
+        # Halfway into the next tick the sprite is drawn halfway along the last one
+        pos, rotation = sprite._render_transform()
+        self.assertAlmostEqual(pos.x, 15)
+        self.assertAlmostEqual(rotation, 355)
+
+        # Moving the sprite outside of a tick draws it where it is
+        sprite.pos = Vec2(100, 0)
+        self.assertEqual(sprite._render_transform()[0], Vec2(100, 0))
+        sprite.pos = Vec2(30, 0)
+        sprite.interpolate = False
+        self.assertEqual(sprite._render_transform()[0], Vec2(30, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics.physics import PhysicsGrid
+from jazz.physics.hierarchical_grid import HierarchicalGrid
+from test_physics_grid import MockPhysicsObject
+
+
+class TestHierarchicalGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = HierarchicalGrid(base_size=16)
+
+    def test_matches_physics_grid(self):
+        rng = random.Random(5)
+        reference = PhysicsGrid()
+        objects = []
+        for i in range(150):
+            size = rng.choice((4, 20, 600))
+            obj = MockPhysicsObject(pygame.Rect(rng.randint(-800, 800), rng.randint(-800, 800), size, rng.randint(4, 40)), f"obj{i}")
+            objects.append(obj)
+            self.grid.add_object(obj)
+            reference.add_object(obj)
+        self.grid.build_grid()
+        reference.build_grid()
+
+        for obj in objects[:40]:
+            obj.collider.rect = obj.collider.rect.move(rng.randint(-200, 200), rng.randint(-200, 200))
+        self.grid.build_grid(set(objects[:40]))
+        reference.build_grid()
+
+        for obj in objects:
+            self.assertCountEqual(self.grid.get_AABB_collisions(obj), reference.get_AABB_collisions(obj))
+
+        self.grid.remove_object(objects[0])
+        self.assertNotIn(objects[0], self.grid.get_AABB_collisions(objects[1]) + self.grid.query(-2000, -2000, 2000, 2000))
+
+    def test_objects_placed_by_size(self):
+        small = MockPhysicsObject(pygame.Rect(0, 0, 10, 10), "small")
+        large = MockPhysicsObject(pygame.Rect(0, 0, 1000, 1000), "large")
+        self.grid.add_object(small)
+        self.grid.add_object(large)
+        self.grid.build_grid()
+
+        # A large object occupies a handful of coarse cells instead of thousands of fine ones
+        self.assertEqual(self.grid.stats()["levels"], {0: 1, 6: 1})
+        self.assertLessEqual(self.grid.stats()["occupied_cells"], 5)
+        self.assertCountEqual(self.grid.get_AABB_collisions(small), [large])
+
+        self.grid.reset_stats()
+        self.grid.get_simple_AABB_collisions(pygame.Rect(2, 2, 4, 4))
+        stats = self.grid.stats()
+        self.assertEqual(stats["queries"], 1)
+        self.assertLessEqual(stats["probed_cells"], 5)
+
+    def test_auto_tune(self):
+        grid = HierarchicalGrid(base_size=16, auto_tune=True)
+        for i in range(9):
+            grid.add_object(MockPhysicsObject(pygame.Rect(i * 200, 0, 100, 60), f"obj{i}"))
+        grid.add_object(MockPhysicsObject(pygame.Rect(0, 0, 5, 5), "tiny"))
+        grid.build_grid()
+        self.assertEqual(grid.base_size, 128)
+        self.assertEqual(grid.stats()["levels"], {0: 10})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics import narrowphase
+from jazz.physics.narrowphase import collide, collide_batch, collide_sat_batch, warm_caches
+from jazz.physics.colliders import CapsuleCollider, CircleCollider, PolyCollider, RectCollider
+from jazz.physics.pair_cache import PairCache
+from jazz.physics.parallel import NarrowphaseExecutor, gil_disabled
+from jazz.utils import Vec2
+
+
+@unittest.skipIf(narrowphase.np is None, "numpy is not installed")
+class TestBatchedSAT(unittest.TestCase):
+    def _random_collider(self, rng):
+        pos = (rng.uniform(0, 120), rng.uniform(0, 120))
+        kind = rng.randrange(3)
+        if kind == 0:
+            collider = RectCollider(rng.uniform(5, 60), rng.uniform(5, 60), pos=pos)
+        elif kind == 1:
+            collider = CircleCollider(rng.uniform(5, 30), pos=pos)
+        else:
+            collider = PolyCollider([Vec2(0, -20), Vec2(18, 12), Vec2(-15, 15)], pos=pos)
+        collider.rotation = rng.uniform(0, 360)
+        return collider
+
+    def test_matches_collide_sat(self):
+        rng = random.Random(3)
+        pairs = [(self._random_collider(rng), self._random_collider(rng)) for _ in range(300)]
+        batched = collide_sat_batch(pairs)
+        hits = 0
+        for (first, second), (depth, normal) in zip(pairs, batched):
+            expected_depth, expected_normal = first.collide_sat(second)
+            self.assertAlmostEqual(depth, expected_depth, places=6)
+            self.assertAlmostEqual(normal.x, expected_normal.x, places=6)
+            self.assertAlmostEqual(normal.y, expected_normal.y, places=6)
+            hits += depth != 0
+        self.assertGreater(hits, 50)
+
+    def test_small_batches_use_collide_sat(self):
+        first = RectCollider(20, 20, pos=(0, 0))
+        second = RectCollider(20, 20, pos=(15, 0))
+        first.rotation = second.rotation = 10
+        self.assertEqual(collide_sat_batch([(first, second)]), [first.collide_sat(second)])
+        self.assertEqual(collide_sat_batch([]), [])
+
+
+class TestAnalyticNarrowphase(unittest.TestCase):
+    def _assert_contact(self, result, depth, normal):
+        self.assertAlmostEqual(result[0], depth, places=6)
+        self.assertAlmostEqual(result[1].x, normal[0], places=6)
+        self.assertAlmostEqual(result[1].y, normal[1], places=6)
+
+    def test_circle_and_rect_pairs_match_collide_sat(self):
+        rng = random.Random(11)
+
+        def make(kind):
+            pos = (rng.uniform(0, 80), rng.uniform(0, 80))
+            if kind == "circle":
+                collider = CircleCollider(rng.uniform(5, 25), pos=pos)
+                collider.rotation = rng.uniform(0, 360)
+            else:
+                collider = RectCollider(rng.uniform(5, 40), rng.uniform(5, 40), pos=pos)
+                collider.rotation = rng.choice((0, 90, 180, 270)) if kind == "aligned" else rng.uniform(0, 360)
+            return collider
+
+        hits = 0
+        for kinds in (("circle", "circle"), ("circle", "rect"), ("rect", "circle"), ("aligned", "aligned")):
+            for _ in range(100):
+                first, second = make(kinds[0]), make(kinds[1])
+                depth, normal = collide(first, second)
+                expected_depth, expected_normal = first.collide_sat(second)
+                self.assertAlmostEqual(depth, expected_depth, places=6)
+                if depth:
+                    self.assertAlmostEqual(normal.x, expected_normal.x, places=6)
+                    self.assertAlmostEqual(normal.y, expected_normal.y, places=6)
+                hits += depth != 0
+        self.assertGreater(hits, 100)
+
+    def test_capsule_contacts(self):
+        capsule = CapsuleCollider(5, 20, pos=(0, 0))
+        capsule.rotation = 0
+        self.assertEqual(capsule.rect, (-15, -5, 30, 10))
+
+        # Against the flat side and the rounded end
+        self._assert_contact(collide(capsule, CircleCollider(3, pos=(0, 6))), 2, (0, 1))
+        self._assert_contact(collide(capsule, CircleCollider(3, pos=(16, 0))), 2, (1, 0))
+        self.assertEqual(collide(capsule, CircleCollider(3, pos=(0, 12)))[0], 0)
+
+        # Swapping the pair flips the normal
+        self._assert_contact(collide(CircleCollider(3, pos=(0, 6)), capsule), 2, (0, -1))
+
+        other = CapsuleCollider(5, 20, pos=(0, 8))
+        other.rotation = 0
+        self._assert_contact(collide(capsule, other), 2, (0, 1))
+
+        # The corner sits just outside the rounded end even though SAT on the core
+        # segment reports an overlap
+        corner = RectCollider(6, 6, pos=(17, 7))
+        corner.rotation = 0
+        self.assertNotEqual(capsule.collide_sat(corner)[0], 0)
+        self.assertEqual(collide(capsule, corner)[0], 0)
+        self._assert_contact(collide(capsule, RectCollider(6, 6, pos=(0, 7))), 1, (0, 1))
+
+    def test_collide_batch_matches_collide(self):
+        rng = random.Random(4)
+        pairs = []
+        for _ in range(40):
+            first = CircleCollider(rng.uniform(5, 20), pos=(rng.uniform(0, 60), rng.uniform(0, 60)))
+            second = PolyCollider([Vec2(0, -20), Vec2(18, 12), Vec2(-15, 15)], pos=(rng.uniform(0, 60), rng.uniform(0, 60)))
+            first.rotation = second.rotation = rng.uniform(0, 360)
+            pairs += [(first, second), (second, second)]
+        for (first, second), result in zip(pairs, collide_batch(pairs)):
+            depth, normal = collide(first, second)
+            self._assert_contact(result, depth, (normal.x, normal.y))
+
+
+
+class TestNarrowphaseExecutor(unittest.TestCase):
+    def _random_pairs(self, count):
+        rng = random.Random(11)
+        pairs = []
+        for _ in range(count):
+            pair = []
+            for _ in range(2):
+                pos = (rng.uniform(0, 100), rng.uniform(0, 100))
+                if rng.random() < 0.3:
+                    collider = CircleCollider(rng.uniform(5, 20), pos=pos)
+                else:
+                    collider = RectCollider(rng.uniform(5, 40), rng.uniform(5, 40), pos=pos)
+                collider.rotation = rng.uniform(0, 360)
+                pair.append(collider)
+            pairs.append(tuple(pair))
+        return pairs
+
+    def test_serial_without_free_threading(self):
+        self.assertEqual(NarrowphaseExecutor(8).parallel, gil_disabled())
+        self.assertFalse(NarrowphaseExecutor(1, force=True).parallel)
+
+    def test_threaded_results_match_serial_order(self):
+        pairs = self._random_pairs(300)
+        executor = NarrowphaseExecutor(4, min_batch=16, force=True)
+        try:
+            self.assertEqual(collide_batch(pairs, executor), collide_batch(pairs))
+            # The pair cache stores the threaded results like serial ones
+            threaded = PairCache(executor).collide_batch(pairs)
+            self.assertEqual(threaded, PairCache().collide_batch(pairs))
+        finally:
+            executor.shutdown()
+
+    def test_workers_only_read_collider_caches(self):
+        pairs = self._random_pairs(64)
+        executor = NarrowphaseExecutor(4, min_batch=16, force=True)
+
+        def dirty(chunk):
+            return [first._vertices_dirty or second._vertices_dirty or second._cached_normals is None
+                    for first, second in chunk]
+
+        try:
+            self.assertFalse(any(executor.map_chunks(dirty, pairs, warm_caches)))
+        finally:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
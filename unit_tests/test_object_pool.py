@@ -0,0 +1,135 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz._in_dev._in_dev import DynamicBody
+from jazz.engine.base_object import GameObject
+from jazz.engine.object_pool import ObjectPool
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.body import Body
+from jazz.utils import JazzException, Vec2
+
+
+class MockResource:
+    def clear(self): pass
+    def purge_sprite_textures(self, sprite_id): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class Bullet(Body):
+    loads = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.add_collider("Circle", radius=2)
+        self.distance = 0
+
+    def on_load(self):
+        super().on_load()
+        Bullet.loads += 1
+
+    def reset(self, **overrides):
+        super().reset(**overrides)
+        self.distance = 0
+
+    def update(self, delta):
+        self.distance += 1
+        if self.distance >= 2:
+            self.queue_kill()
+
+
+class Particle(DynamicBody):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.add_collider("Circle", radius=1)
+
+
+class TestObjectPool(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        self.scene = Scene()
+        Globals.scene = self.scene
+        Bullet.loads = 0
+
+    def probe(self, pos):
+        probe = Body(pos=pos, collision_layers="0010")
+        probe.add_collider("Circle", radius=2)
+        probe.rotation = 0
+        return probe
+
+    def test_released_objects_are_reused(self):
+        pool = self.scene.create_pool(Bullet, layers="0010")
+        first = pool.acquire(pos=(10, 0))
+        self.assertEqual(first.pos, Vec2(10, 0))
+        self.assertEqual(first._layers, 2)
+        self.scene._build_physics()
+        self.assertEqual(self.scene.get_AABB_collisions(self.probe((10, 0))), [first])
+        pool.release(first)
+        self.assertEqual(len(self.scene), 0)
+        self.assertEqual(self.scene.get_AABB_collisions(self.probe((10, 0))), [])
+
+        first.distance = 5
+        second = pool.acquire(pos=(50, 0))
+        self.assertIs(second, first)
+        self.assertEqual((second.pos, second.distance), (Vec2(50, 0), 0))
+        self.assertEqual((pool.created, Bullet.loads), (1, 1))
+        self.scene._build_physics()
+        self.assertEqual(self.scene.get_AABB_collisions(self.probe((50, 0))), [second])
+
+    def test_queue_kill_releases(self):
+        pool = self.scene.create_pool(Bullet)
+        pool.prewarm(3)
+        self.assertEqual((len(pool), len(self.scene)), (3, 0))
+        bullets = [pool.acquire(pos=(i * 20, 0)) for i in range(3)]
+        self.scene._game_update(0.016)
+        self.scene._game_update(0.016)
+        self.assertEqual((len(pool), len(self.scene)), (3, 0))
+
+        again = [pool.acquire() for _ in range(3)]
+        self.assertEqual(set(again), set(bullets))
+        self.assertFalse(any(bullet.do_kill for bullet in again))
+        self.scene._game_update(0.016)
+        self.assertEqual(len(self.scene), 3)
+        self.assertEqual((pool.created, Bullet.loads), (3, 3))
+
+    def test_moving_body_is_reset(self):
+        pool = self.scene.create_pool(Particle, velocity=(0, -50))
+        body = pool.acquire(pos=(0, 0))
+        body.velocity = Vec2(300, 0)
+        body.on_ground = True
+        pool.release(body)
+
+        again = pool.acquire(pos=(10, 0))
+        self.assertIs(again, body)
+        self.assertEqual((again.velocity, again.on_ground), (Vec2(0, -50), False))
+        pool.release(again)
+        self.assertEqual(pool.acquire(velocity=(20, 0)).velocity, Vec2(20, 0))
+
+    def test_foreign_objects_are_rejected(self):
+        pool = ObjectPool(GameObject)
+        other = ObjectPool(GameObject)
+        obj = other.acquire()
+        with self.assertRaises(JazzException):
+            pool.release(obj)
+        # Killed objects leave their pool
+        obj.kill()
+        with self.assertRaises(JazzException):
+            other.release(obj)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics import narrowphase
+from jazz.physics.colliders import CircleCollider, RectCollider
+from jazz.physics.narrowphase import sat_features, sat_features_batch
+from jazz.physics.pair_cache import PairCache
+from jazz.utils import Vec2
+
+
+def rotated_rect(w, h, pos, rotation=30):
+    collider = RectCollider(w, h, pos=pos)
+    collider.rotation = rotation
+    return collider
+
+
+class TestPairCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PairCache()
+
+    def test_matches_collide_sat(self):
+        rng = random.Random(8)
+        for _ in range(100):
+            first = rotated_rect(rng.uniform(5, 40), rng.uniform(5, 40), (rng.uniform(0, 60), rng.uniform(0, 60)), rng.uniform(0, 360))
+            second = rotated_rect(rng.uniform(5, 40), rng.uniform(5, 40), (rng.uniform(0, 60), rng.uniform(0, 60)), rng.uniform(0, 360))
+            depth, normal = self.cache.collide(first, second)
+            expected_depth, expected_normal = first.collide_sat(second)
+            self.assertAlmostEqual(depth, expected_depth, places=6)
+            if depth:
+                self.assertAlmostEqual(normal.x, expected_normal.x, places=6)
+                self.assertAlmostEqual(normal.y, expected_normal.y, places=6)
+
+    def test_reuse_and_separating_axis(self):
+        first = rotated_rect(20, 20, (0, 0))
+        second = rotated_rect(20, 20, (40, 0))
+
+        self.assertEqual(self.cache.collide(first, second), (0, Vec2()))
+        self.assertIsNotNone(self.cache.contact(first, second).separating_axis)
+
+        # Unchanged pairs are reused, slightly moved ones are rejected by the cached axis
+        self.cache.collide(first, second)
+        second.pos = Vec2(39, 1)
+        self.assertEqual(self.cache.collide(first, second), (0, Vec2()))
+        self.assertEqual(self.cache.stats(), {"pairs": 1, "hits": 1, "early_outs": 1, "misses": 1})
+
+        # Once they touch a full test runs and the contact persists
+        second.pos = Vec2(20, 0)
+        depth, normal = self.cache.collide(first, second)
+        contact = self.cache.contact(first, second)
+        self.assertGreater(depth, 0)
+        self.assertIsNone(contact.separating_axis)
+        self.assertIsNotNone(contact.feature)
+        self.assertTrue(contact.touching)
+
+        # Querying the pair in the other order reuses the entry with the normal flipped
+        self.assertEqual(self.cache.collide(second, first), (depth, -normal))
+        self.assertEqual(self.cache.stats()["misses"], 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_eviction(self):
+        first = rotated_rect(20, 20, (0, 0))
+        second = CircleCollider(5, pos=(12, 0))
+        self.cache.collide(first, second)
+
+        # Pairs survive the frame they were queried in and are dropped after a frame without queries
+        self.cache.begin_frame()
+        self.assertIsNotNone(self.cache.contact(first, second))
+        self.cache.begin_frame()
+        self.assertIsNone(self.cache.contact(first, second))
+
+    @unittest.skipIf(narrowphase.np is None, "numpy is not installed")
+    def test_batched_features_match(self):
+        rng = random.Random(2)
+        pairs = [
+            (
+                rotated_rect(rng.uniform(5, 40), rng.uniform(5, 40), (rng.uniform(0, 60), rng.uniform(0, 60)), rng.uniform(0, 360)),
+                CircleCollider(rng.uniform(5, 20), pos=(rng.uniform(0, 60), rng.uniform(0, 60))),
+            )
+            for _ in range(100)
+        ]
+        for _, circle in pairs:
+            circle.rotation = 0
+        for (first, second), (depth, normal, axis, feature) in zip(pairs, sat_features_batch(pairs)):
+            expected = sat_features(first, second)
+            self.assertAlmostEqual(depth, expected[0], places=6)
+            self.assertEqual(feature, expected[3])
+            self.assertEqual(axis is None, expected[2] is None)
+
+
+if __name__ == "__main__":
+    unittest.main()
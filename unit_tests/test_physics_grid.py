@@ -111,6 +111,36 @@ class TestPhysicsGrid(unittest.TestCase):
         self.assertNotIn(obj2, simple_collisions)
         self.assertNotIn(obj3, simple_collisions)
 
+    def test_incremental_build_only_rehashes_moved(self):
+        static = MockPhysicsObject(pygame.Rect(10, 10, 20, 20), "static")
+        mover = MockPhysicsObject(pygame.Rect(200, 200, 20, 20), "mover")
+        self.grid.add_object(static)
+        self.grid.add_object(mover)
+
+        # Newly added objects are hashed even if they are not in the moved set
+        self.grid.build_grid(set())
+        self.assertEqual(self.grid.grid["0.0"], [static])
+        self.assertEqual(self.grid.grid["4.4"], [mover])
+
+        # Count rect lookups to verify static objects are not touched
+        calls = []
+        original_get_rect = static.collider.get_rect
+        def counting_get_rect():
+            calls.append(True)
+            return original_get_rect()
+        static.collider.get_rect = counting_get_rect
+
+        mover.collider.rect = pygame.Rect(260, 260, 20, 20)
+        self.grid.build_grid({mover})
+        self.assertEqual(calls, [])
+        self.assertNotIn("4.4", self.grid.grid)
+        self.assertEqual(self.grid.grid["5.5"], [mover])
+
+        # Objects in the moved set that are not tracked are ignored
+        stranger = MockPhysicsObject(pygame.Rect(10, 10, 20, 20), "stranger")
+        self.grid.build_grid({stranger})
+        self.assertEqual(self.grid.grid["0.0"], [static])
+
 
 if __name__ == "__main__":
     unittest.main()
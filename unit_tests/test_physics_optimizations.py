@@ -88,8 +88,7 @@ class TestPhysicsOptimizations(unittest.TestCase):
         body.on_load()
         
         # Build grid
-        for grid in Globals.scene._physics_world.values():
-            grid.build_grid()
+        Globals.scene._physics_world.build()
             
         # Simulate one frame update
         area._moved_this_frame = True
@@ -105,19 +104,15 @@ class TestPhysicsOptimizations(unittest.TestCase):
         self.assertFalse(area._moved_this_frame)
         self.assertFalse(body._moved_this_frame)
         
-        # Mock collide_sat to count calls to verify caching
-        original_sat = area.collider.collide_sat
-        sat_calls = 0
-        def mock_sat(*args, **kwargs):
-            nonlocal sat_calls
-            sat_calls += 1
-            return original_sat(*args, **kwargs)
-        area.collider.collide_sat = mock_sat
+        # Count full narrowphase tests through the scene's pair cache
+        pair_cache = Globals.scene.pair_cache
+        pair_cache.reset_stats()
         
-        # Call get_entered again - should use cache instead of collide_sat!
+        # Call get_entered again - should use cache instead of the narrowphase!
         entered2 = area.get_entered()
         self.assertIn(body, entered2)
-        self.assertEqual(sat_calls, 0)
+        self.assertEqual(pair_cache.stats()["misses"], 0)
+        self.assertEqual(pair_cache.stats()["hits"], 1)
         
         # Move body slightly so it still overlaps in AABB but moves
         body.pos = Vec2(3, 3)
@@ -125,7 +120,7 @@ class TestPhysicsOptimizations(unittest.TestCase):
         
         entered3 = area.get_entered()
         self.assertIn(body, entered3)
-        self.assertEqual(sat_calls, 1)
+        self.assertEqual(pair_cache.stats()["misses"], 1)
 
     def test_edges_no_accumulation(self):
         # Create a collider
@@ -167,8 +162,7 @@ class TestPhysicsOptimizations(unittest.TestCase):
         body2.on_load()
         
         # Initialize grid
-        for grid in Globals.scene._physics_world.values():
-            grid.build_grid()
+        Globals.scene._physics_world.build()
             
         # Verify that calling move_and_collide resolves without RecursionError
         try:
@@ -196,8 +190,7 @@ class TestPhysicsOptimizations(unittest.TestCase):
         body.on_load()
         
         # Rebuild grid
-        for grid in Globals.scene._physics_world.values():
-            grid.build_grid()
+        Globals.scene._physics_world.build()
             
         # Update body once - it should collide and settle
         body.update(0.016)
@@ -213,5 +206,141 @@ class TestPhysicsOptimizations(unittest.TestCase):
         body.move_and_collide(Vec2(0, -5))
         self.assertFalse(body.on_ground)
 
+    def test_static_index_separation(self):
+        from jazz import COLLIDER_RECT
+
+        wall1 = Body(static=True, pos=(100, 100))
+        wall1.add_collider(COLLIDER_RECT, w=40, h=40)
+        wall2 = Body(static=True, pos=(120, 100))
+        wall2.add_collider(COLLIDER_RECT, w=40, h=40)
+        mover = Body(pos=(100, 80))
+        mover.add_collider(COLLIDER_RECT, w=20, h=20)
+        for obj in (wall1, wall2, mover):
+            Globals.scene.add_object(obj)
+
+        self.assertIn(wall1, Globals.scene._physics_world._static_index._objects)
+        self.assertNotIn(wall1, Globals.scene._physics_world._index._objects)
+        self.assertIn(mover, Globals.scene._physics_world._index._objects)
+
+        Globals.scene._game_update(0.016)
+
+        # Static bodies are found by dynamic queries, but never by other static bodies
+        self.assertCountEqual(Globals.scene.get_AABB_collisions(mover), [wall1, wall2])
+        self.assertEqual(Globals.scene.get_AABB_collisions(wall1), [mover])
+
+        # Static bodies are not re-hashed by per-frame builds
+        calls = []
+        original_get_rect = wall2.collider.get_rect
+        def counting_get_rect():
+            calls.append(True)
+            return original_get_rect()
+        wall2.collider.get_rect = counting_get_rect
+        mover.pos = Vec2(100, 70)
+        Globals.scene._game_update(0.016)
+        Globals.scene._game_update(0.016)
+        self.assertEqual(calls, [])
+
+        # Explicitly moving a static body invalidates its static index entry
+        wall2.pos = Vec2(500, 500)
+        self.assertNotIn(wall2, Globals.scene.get_AABB_collisions(mover))
+
+        # Toggling the flag moves the body between indexes
+        wall1.static = False
+        self.assertNotIn(wall1, Globals.scene._physics_world._static_index._objects)
+        self.assertIn(wall1, Globals.scene._physics_world._index._objects)
+
+    def test_physics_world_layer_masks(self):
+        from jazz import COLLIDER_RECT
+
+        # Layers above the old four are indexed and queried like any other
+        multi = Body(pos=(100, 100), layers=(1 << 0) | (1 << 20))
+        multi.add_collider(COLLIDER_RECT, w=20, h=20)
+        high = Body(pos=(110, 100), layers=1 << 31, collision_layers=1 << 20)
+        high.add_collider(COLLIDER_RECT, w=20, h=20)
+        other = Body(pos=(105, 100), layers=1 << 5)
+        other.add_collider(COLLIDER_RECT, w=20, h=20)
+        for obj in (multi, high, other):
+            Globals.scene.add_object(obj)
+        Globals.scene._physics_world.build()
+
+        # An object on several layers is stored once and reported once
+        self.assertEqual(Globals.scene._physics_world._index._objects.count(multi), 1)
+        self.assertEqual(Globals.scene._physics_world.get_AABB_collisions(other, (1 << 0) | (1 << 20)), [multi])
+        self.assertEqual(Globals.scene.get_AABB_collisions(high), [multi])
+        self.assertEqual(Globals.scene.get_layer_collisions(high, 31), [])
+        self.assertCountEqual(Globals.scene.get_layer_collisions(multi, 31), [high])
+
+    def test_body_sleeping_islands(self):
+        from jazz._in_dev._in_dev import DynamicBody, SLEEP_FRAMES
+        from jazz import COLLIDER_RECT
+
+        floor = Body(static=True, pos=(400, 500))
+        floor.add_collider(COLLIDER_RECT, w=800, h=20)
+        lower = DynamicBody(pos=(400, 479))
+        lower.add_collider(COLLIDER_RECT, w=20, h=20)
+        upper = DynamicBody(pos=(400, 458))
+        upper.add_collider(COLLIDER_RECT, w=20, h=20)
+        for obj in (floor, lower, upper):
+            Globals.scene.add_object(obj)
+
+        for _ in range(SLEEP_FRAMES * 2):
+            Globals.scene._game_update(0.016)
+        self.assertTrue(lower.on_ground and upper.on_ground)
+        self.assertEqual(Globals.scene.islands.island(upper), {lower, upper})
+
+        # The whole pile sleeps together and no longer queries the world
+        self.assertTrue(lower.sleeping and upper.sleeping)
+        calls = []
+        original = Globals.scene._physics_world.get_AABB_collisions
+        Globals.scene._physics_world.get_AABB_collisions = lambda *args: calls.append(args) or original(*args)
+        Globals.scene._game_update(0.016)
+        self.assertEqual(calls, [])
+        Globals.scene._physics_world.get_AABB_collisions = original
+
+        # Explicitly moving one body wakes its whole island
+        lower.pos = Vec2(400, 478)
+        self.assertFalse(lower.sleeping or upper.sleeping)
+
+        for _ in range(SLEEP_FRAMES * 2):
+            Globals.scene._game_update(0.016)
+        self.assertTrue(upper.sleeping)
+
+        # Moving a static support wakes the bodies resting on it
+        floor.pos = Vec2(400, 600)
+        self.assertFalse(lower.sleeping or upper.sleeping)
+        Globals.scene._game_update(0.016)
+        self.assertFalse(lower.on_ground)
+
+    def test_blocked_island_sleeps_once_unblocked(self):
+        from jazz._in_dev._in_dev import DynamicBody, SLEEP_FRAMES
+        from jazz import COLLIDER_RECT
+
+        floor = Body(static=True, pos=(400, 500))
+        floor.add_collider(COLLIDER_RECT, w=800, h=20)
+        lower = DynamicBody(pos=(400, 479), can_sleep=False)
+        lower.add_collider(COLLIDER_RECT, w=20, h=20)
+        upper = DynamicBody(pos=(400, 458))
+        upper.add_collider(COLLIDER_RECT, w=20, h=20)
+        for obj in (floor, lower, upper):
+            Globals.scene.add_object(obj)
+
+        for _ in range(SLEEP_FRAMES * 2):
+            Globals.scene._game_update(0.016)
+        self.assertFalse(lower.sleeping or upper.sleeping)
+
+        # While the blocking body stays unready the island is not walked again
+        islands = Globals.scene.islands
+        checked = []
+        islands._ready = lambda body, frames: checked.append(body) or type(islands)._ready(body, frames)
+        Globals.scene._game_update(0.016)
+        del islands._ready
+        self.assertEqual(checked, [lower])
+
+        lower.can_sleep = True
+        for _ in range(SLEEP_FRAMES * 5):
+            Globals.scene._game_update(0.016)
+        self.assertTrue(lower.sleeping and upper.sleeping)
+
+
 if __name__ == "__main__":
     unittest.main()
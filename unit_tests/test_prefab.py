@@ -0,0 +1,110 @@
+import json
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.base_object import GameObject
+from jazz.engine.prefab import Prefab
+from jazz.engine.scene import Scene
+from jazz.engine.serializer import Serializer, register_class
+from jazz.global_dict import Globals
+from jazz.utils import JazzException, Vec2
+
+
+class MockResource:
+    def __init__(self):
+        self.resources = {}
+
+    def clear(self): pass
+
+    def add_resource(self, category, id, resource):
+        self.resources[(category, id)] = resource
+        return resource
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+def enemy_update(delta):
+    Globals._prefab_updates = getattr(Globals, "_prefab_updates", 0) + 1
+
+
+@register_class
+class PrefabEnemy(GameObject):
+    pass
+
+
+ENEMY = {
+    "Class": "PrefabEnemy",
+    "options": {"name": "enemy", "pos": [5, 5], "tags": ["enemy"], "properties": {"loot": ["coin"]}},
+    "scripts": {"update": f"{__name__}.enemy_update"},
+    "children": [{"Class": "GameObject", "options": {"name": "gun", "pos": [4, 0]}}],
+}
+
+
+class TestPrefab(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        self.scene = Scene()
+        Globals.scene = self.scene
+        Globals._prefab_updates = 0
+
+    def test_instantiate(self):
+        prefab = Prefab.from_json(json.dumps(ENEMY))
+        enemy = prefab.instantiate(rotation=90)
+        self.assertIsInstance(enemy, PrefabEnemy)
+        self.assertEqual((enemy.name, enemy.local_pos, enemy.local_rotation), ("enemy", Vec2(5, 5), 90))
+        self.assertEqual(enemy._scripts, {"update": f"{__name__}.enemy_update"})
+        self.assertEqual(enemy.child_count, 1)
+
+        # Instances never share mutable constructor arguments
+        other = prefab.instantiate()
+        other.loot.append("gem")
+        self.assertEqual(enemy.loot, ["coin"])
+
+        # Matches what the serializer builds from the same payload
+        self.assertEqual(Serializer.serialize_object(list(other._children.values())[0]), Serializer.serialize_object(
+            list(Serializer.deserialize_object(ENEMY)._children.values())[0]))
+
+    def test_spawn_many(self):
+        prefab = Prefab.from_dict(ENEMY)
+        positions = [(i, 2 * i) for i in range(1000)]
+        enemies = self.scene.spawn_many(prefab, positions=positions)
+        self.assertEqual(len(self.scene), 1000)
+        self.assertEqual(enemies[10].pos, Vec2(10, 20))
+        self.assertEqual(list(enemies[10]._children.values())[0].pos, Vec2(14, 20))
+        self.assertEqual(len(self.scene.tagged("enemy")), 1000)
+        self.scene._game_update(0.016)
+        self.assertEqual(Globals._prefab_updates, 1000)
+
+        # Positions shorter than n leave the rest at the prefab's position
+        extra = prefab.instantiate(n=3, positions=[(0, 0)])
+        self.assertEqual([obj.local_pos for obj in extra], [Vec2(0, 0), Vec2(5, 5), Vec2(5, 5)])
+
+    def test_from_object_and_resource(self):
+        source = GameObject("crate", pos=(1, 2))
+        source.add_child(GameObject("lid"))
+        copy = Prefab.from_object(source).instantiate()
+        self.assertIsNot(copy, source)
+        self.assertEqual((copy.name, copy.local_pos, copy.child_count), ("crate", Vec2(1, 2), 1))
+
+        Serializer.process_resources([{"type": "prefab", "id": "enemy", "object": ENEMY}])
+        self.assertIsInstance(Globals.resource.resources[("prefab", "enemy")], Prefab)
+
+        with self.assertRaises(JazzException):
+            Prefab({"Class": "MissingPrefabClass"})
+
+
+if __name__ == "__main__":
+    unittest.main()
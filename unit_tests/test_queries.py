@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.body import Body
+from jazz.physics.colliders import CircleCollider, RectCollider
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class TestShapeQueries(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def add_body(self, pos, shape="Rect", **kwargs):
+        body = Body(pos=pos, static=kwargs.pop("static", False), layers=kwargs.pop("layers", "0001"))
+        body.add_collider(shape, **kwargs)
+        Globals.scene.add_object(body)
+        body.rotation = 0
+        return body
+
+    def test_overlaps(self):
+        floor = self.add_body((100, 100), w=200, h=20, static=True)
+        ball = self.add_body((100, 70), "Circle", radius=10)
+        other_layer = self.add_body((150, 70), w=10, h=10, layers="0010")
+        Globals.scene._build_physics()
+        Globals.scene._physics_moved.clear()
+
+        hits = Globals.scene.overlap_circle(Vec2(100, 85), 8)
+        self.assertEqual({obj for obj, _ in hits}, {floor, ball})
+        depth, normal = dict(hits)[floor]
+        self.assertAlmostEqual(depth, 3)
+        self.assertEqual(normal, Vec2(0, 1))
+
+        self.assertEqual(Globals.scene.overlap_rect(Vec2(150, 70), 4, 4, 45, mask="0001"), [])
+        self.assertEqual([obj for obj, _ in Globals.scene.overlap_rect(Vec2(150, 70), 4, 4)], [other_layer])
+        self.assertEqual(Globals.scene.overlap_point(Vec2(104, 72)), [ball])
+        self.assertEqual(Globals.scene.overlap_point(Vec2(104, 72), ignore=[ball]), [])
+
+        # Probing with a body's own shape leaves the body where it is
+        hits = Globals.scene.overlap_shape(ball.collider, Vec2(100, 82), ignore=[ball])
+        self.assertEqual([obj for obj, _ in hits], [floor])
+        self.assertEqual(ball.pos, Vec2(100, 70))
+        self.assertFalse(Globals.scene._physics_moved)
+
+    def test_shape_cast(self):
+        wall = self.add_body((100, 0), w=10, h=100, static=True)
+        Globals.scene._build_physics()
+        shape = CircleCollider(5)
+
+        hit, fraction, normal = Globals.scene.shape_cast(shape, Vec2(0, 0), Vec2(200, 0))
+        self.assertIs(hit, wall)
+        self.assertAlmostEqual(fraction * 200, 90)
+        self.assertAlmostEqual(normal.x, 1)
+        self.assertEqual(Globals.scene.shape_cast(shape, Vec2(0, 0), Vec2(80, 0)), (None, 1.0, Vec2()))
+
+        # Rotated shapes, and shapes starting inside an object
+        hit, fraction, _ = Globals.scene.shape_cast(RectCollider(10, 10), Vec2(0, 0), Vec2(200, 0), 45)
+        self.assertAlmostEqual(fraction * 200, 95 - 50 ** 0.5)
+        self.assertEqual(Globals.scene.shape_cast(shape, Vec2(100, 0), Vec2(200, 0))[:2], (wall, 0.0))
+
+    def test_pool_reuses_colliders(self):
+        self.add_body((0, 0), w=10, h=10)
+        Globals.scene._build_physics()
+        pool = Globals.scene._physics_world._shape_pool
+        Globals.scene.overlap_rect(Vec2(0, 0), 50, 50)
+        query = pool._free[RectCollider][-1]
+        # The pooled rect is reshaped for the next query rather than recreated
+        self.assertEqual(Globals.scene.overlap_rect(Vec2(40, 0), 4, 4), [])
+        self.assertIs(pool._free[RectCollider][-1], query)
+        self.assertEqual(len(pool._free[RectCollider]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics import DynamicAABBTree
+from jazz.physics import batch_raycast
+from jazz.physics.body import Body
+from jazz.physics.ray import Ray
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class TreeScene(Scene):
+    broadphase = DynamicAABBTree
+
+
+class TestRaycast(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def add_body(self, pos, shape="Rect", **kwargs):
+        body = Body(pos=pos, static=kwargs.pop("static", False), layers=kwargs.pop("layers", "0001"))
+        body.add_collider(shape, **kwargs)
+        Globals.scene.add_object(body)
+        body.rotation = 0
+        return body
+
+    def test_first_hit_along_ray(self):
+        near = self.add_body((200, 10), w=20, h=20)
+        far = self.add_body((400, 0), "Circle", radius=10, static=True)
+        Globals.scene._build_physics()
+
+        hit, point = Globals.scene.raycast(Vec2(0, 0), Vec2(1, 0), 1000)
+        self.assertIs(hit, near)
+        self.assertAlmostEqual(point.x, 190)
+
+        # Ignored objects are passed through, the ray stops short of objects past its length
+        hit, point = Globals.scene.raycast(Vec2(0, 0), Vec2(1, 0), 1000, ignore=[near])
+        self.assertIs(hit, far)
+        self.assertAlmostEqual(point.x, 390)
+        self.assertEqual(Globals.scene.raycast(Vec2(0, 0), Vec2(1, 0), 300, ignore=[near]), (None, None))
+
+        # Layers are filtered and the direction does not need to be normalized
+        self.add_body((100, 0), w=10, h=10, layers="0010")
+        Globals.scene._build_physics()
+        self.assertIs(Globals.scene.raycast(Vec2(0, 0), Vec2(5, 0), 1000, mask="0001")[0], near)
+        self.assertAlmostEqual(Globals.scene.physics_raycast(Vec2(0, 0), Vec2(1000, 0), "0010")[1].x, 95)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        bodies = []
+        for _ in range(60):
+            pos = (rng.uniform(0, 600), rng.uniform(0, 600))
+            if rng.random() < 0.5:
+                bodies.append(self.add_body(pos, "Circle", radius=rng.uniform(3, 15)))
+            else:
+                bodies.append(self.add_body(pos, w=rng.uniform(5, 30), h=rng.uniform(5, 30)))
+                bodies[-1].rotation = rng.uniform(0, 90)
+        grid_scene = Globals.scene
+        grid_scene._build_physics()
+
+        # Indexes without a grid walk fall back to testing everything in the ray's bounds
+        tree_scene = TreeScene()
+        for body in bodies:
+            tree_scene._physics_world.add_object(body, 1)
+        tree_scene._build_physics()
+
+        for _ in range(100):
+            origin = Vec2(rng.uniform(0, 600), rng.uniform(0, 600))
+            direction = Vec2(1, 0).rotate(rng.uniform(0, 360))
+            hits = [(body.collider.intersect_segment(origin, origin + direction * 500), body) for body in bodies]
+            hits = [hit for hit in hits if hit[0] is not None]
+            expected = min(hits, key=lambda hit: hit[0])[1] if hits else None
+            self.assertIs(grid_scene.raycast(origin, direction, 500)[0], expected)
+            self.assertIs(tree_scene.raycast(origin, direction, 500)[0], expected)
+
+
+class TestRayCache(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def add_body(self, pos):
+        body = Body(pos=pos)
+        body.add_collider("Rect", w=10, h=10)
+        Globals.scene.add_object(body)
+        body.rotation = 0
+        return body
+
+    def end_frame(self):
+        scene = Globals.scene
+        scene._physics_moved.update(scene._moved_objects)
+        scene._moved_objects.clear()
+        scene._build_physics()
+
+    def test_cast_reused_until_cells_change(self):
+        ray = Ray(pos=(0, 0), length=200, layers="0000")
+        Globals.scene.add_object(ray)
+        ray.rotation = 0
+        wall = self.add_body((150, 0))
+        far = self.add_body((600, 400))
+        self.end_frame()
+
+        casts = []
+        cast = ray.cast
+        ray.cast = lambda: casts.append(1) or cast()
+        ray._engine_update(0)
+        self.assertIs(ray.collision_object, wall)
+
+        # Nothing near the ray changed
+        far.pos = Vec2(600, 450)
+        self.end_frame()
+        ray._engine_update(0)
+        self.assertEqual(len(casts), 1)
+
+        # A body moving inside the ray's cells earlier in the frame, before the next build
+        wall.pos = Vec2(140, 0)
+        ray._engine_update(0)
+        self.assertEqual(len(casts), 2)
+        self.assertAlmostEqual(ray.collision_point.x, 135)
+
+        # A body moving into the cells is seen once the grid is rebuilt
+        blocker = self.add_body((600, 0))
+        self.end_frame()
+        ray._engine_update(0)
+        blocker.pos = Vec2(80, 0)
+        self.end_frame()
+        ray._engine_update(0)
+        self.assertEqual(len(casts), 4)
+        self.assertIs(ray.collision_object, blocker)
+
+        # Removing the hit, and moving the ray itself
+        self.end_frame()
+        ray._engine_update(0)
+        blocker.kill()
+        ray._engine_update(0)
+        self.assertIs(ray.collision_object, wall)
+        ray.rotation = 90
+        ray._engine_update(0)
+        self.assertEqual(len(casts), 6)
+        self.assertIsNone(ray.collision_object)
+
+
+@unittest.skipIf(batch_raycast.np is None, "numpy is not installed")
+class TestRaycastBatch(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def add_body(self, pos, shape, rotation=0, **kwargs):
+        body = Body(pos=pos)
+        body.add_collider(shape, **kwargs)
+        Globals.scene.add_object(body)
+        body.rotation = rotation
+        return body
+
+    def test_distances_normals_and_indices(self):
+        np = batch_raycast.np
+        wall = self.add_body((100, 0), "Rect", w=20, h=200)
+        ball = self.add_body((0, 100), "Circle", radius=10)
+        Globals.scene._build_physics()
+
+        hits = Globals.scene.raycast_batch((0, 0), [(1, 0), (0, 2), (-1, 0), (0, 0)], 200)
+        self.assertEqual(len(hits), 4)
+        np.testing.assert_allclose(hits.distances[:2], [90, 90])
+        np.testing.assert_allclose(hits.normals[:2], [(-1, 0), (0, -1)], atol=1e-12)
+        self.assertIs(hits.objects[hits.indices[0]], wall)
+        self.assertIs(hits.hit(1)[0], ball)
+        # Misses, including a ray without a direction
+        self.assertEqual(list(hits.indices[2:]), [-1, -1])
+        self.assertTrue(np.isinf(hits.distances[2:]).all())
+        self.assertEqual(hits.hit(2), (None, None))
+
+        # Rays starting inside a shape hit it at once
+        inside = Globals.scene.raycast_batch([(100, 0), (0, 100)], (0, 1), 50)
+        np.testing.assert_allclose(inside.distances, [0, 0])
+
+    def test_matches_single_raycast(self):
+        np = batch_raycast.np
+        rng = random.Random(5)
+        for _ in range(80):
+            pos = (rng.uniform(0, 600), rng.uniform(0, 600))
+            shape = rng.choice(("Circle", "Rect", "Capsule"))
+            if shape == "Circle":
+                self.add_body(pos, shape, radius=rng.uniform(3, 15))
+            elif shape == "Rect":
+                self.add_body(pos, shape, rng.uniform(0, 90), w=rng.uniform(5, 30), h=rng.uniform(5, 30))
+            else:
+                self.add_body(pos, shape, rng.uniform(0, 180), radius=rng.uniform(3, 8), length=rng.uniform(0, 20))
+        Globals.scene._build_physics()
+
+        angles = np.linspace(0, 2 * np.pi, 300, endpoint=False)
+        directions = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+        hits = Globals.scene.raycast_batch((300, 300), directions, 300)
+        for i, direction in enumerate(directions):
+            hit, point = Globals.scene.raycast(Vec2(300, 300), Vec2(*direction), 300)
+            self.assertIs(hits.hit(i)[0], hit)
+            if hit is not None:
+                self.assertAlmostEqual(hits.distances[i], (point - Vec2(300, 300)).length(), places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
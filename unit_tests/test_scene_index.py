@@ -0,0 +1,127 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.base_object import GameObject
+from jazz.engine.group import Group
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.area import Area
+from jazz.physics.body import Body
+from jazz.utils import Vec2
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class Enemy(GameObject):
+    pass
+
+
+class Boss(Enemy):
+    pass
+
+
+class TestSceneIndex(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        self.scene = Scene()
+        Globals.scene = self.scene
+
+    def test_name_and_class_lookup(self):
+        player = self.scene.add_object(GameObject(name="player"))
+        enemy = self.scene.add_object(Enemy(name="grunt"))
+        boss = self.scene.add_object(Boss(name="boss"))
+        gun = player.add_child(GameObject(name="gun"))
+
+        self.assertIs(self.scene.find_by_name("gun"), gun)
+        self.assertIs(self.scene["player"], player)
+        # Scene lookups by name still only return top-level objects
+        self.assertIsNone(self.scene["gun"])
+        self.assertEqual(self.scene.find_all(Enemy), [enemy, boss])
+        self.assertEqual(self.scene.find_all(Boss), [boss])
+
+        gun.name = "rifle"
+        self.assertIsNone(self.scene.find_by_name("gun"))
+        self.assertIs(self.scene.find_by_name("rifle"), gun)
+
+        player.remove_child(gun)
+        self.assertIsNone(self.scene.find_by_name("rifle"))
+        boss.kill()
+        self.assertEqual(self.scene.find_all(Enemy), [enemy])
+
+    def test_tags(self):
+        first = self.scene.add_object(GameObject(tags=["enemy"]))
+        group = self.scene.tagged("enemy")
+        self.assertEqual(list(group), [first])
+
+        # The group is live: later tags, new objects and removals show up in it
+        second = self.scene.add_object(GameObject())
+        second.add_tag("enemy")
+        third = GameObject(tags=["enemy"])
+        first.add_child(third)
+        self.assertEqual(list(group), [first, second, third])
+        second.remove_tag("enemy")
+        first.kill()
+        self.assertEqual(len(group), 0)
+        self.assertEqual(third.groups, frozenset())
+        self.assertEqual(second._kwargs["tags"], [])
+
+    def test_group_is_a_set(self):
+        objects = [GameObject() for _ in range(3)]
+        group = Group(objects)
+        self.assertIn(objects[1], group)
+        self.assertIn(group, objects[1].groups)
+        group.remove(objects[1])
+        self.assertNotIn(objects[1], group)
+        self.assertEqual(objects[1].groups, frozenset())
+        self.assertEqual(group[1], objects[2])
+        group.add(objects[1])
+        self.assertEqual((group[-1], group[2]), (objects[1], objects[1]))
+        del group[0]
+        self.assertEqual(group[0], objects[2])
+        group.discard(objects[1])
+
+        objects[0].add_group(group)
+        self.scene.add_object(objects[0]).kill()
+        self.assertEqual(list(group), [objects[2]])
+
+    def test_area_target_group(self):
+        area = Area(pos=(0, 0), target_group=self.scene.tagged("player"))
+        area.add_collider("Rect", w=40, h=40)
+        self.scene.add_object(area)
+        area.rotation = 0
+        bodies = []
+        for tags in (["player"], []):
+            body = Body(pos=(5, 0), tags=tags)
+            body.add_collider("Circle", radius=5)
+            self.scene.add_object(body)
+            body.rotation = 0
+            bodies.append(body)
+        self.scene._build_physics()
+        self.assertEqual(area.entered, [bodies[0]])
+
+        # Plain lists are turned into groups
+        area.target_group = [bodies[1]]
+        self.assertIsInstance(area.target_group, Group)
+        self.scene._build_physics()
+        self.assertEqual(area.entered, [bodies[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
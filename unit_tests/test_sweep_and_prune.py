@@ -0,0 +1,148 @@
+import unittest
+import random
+import pygame
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.physics.physics import PhysicsGrid
+from jazz.physics.sweep_and_prune import SweepAndPrune
+from jazz.physics.body import Body
+from jazz.physics.world import PhysicsWorld
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.utils import Vec2
+from test_physics_grid import MockPhysicsObject
+
+
+class TestSweepAndPrune(unittest.TestCase):
+    def setUp(self):
+        self.sap = SweepAndPrune(margin=0)
+
+    def test_pairs_reported_once(self):
+        obj1 = MockPhysicsObject(pygame.Rect(0, 0, 20, 20), "obj1")
+        obj2 = MockPhysicsObject(pygame.Rect(10, 10, 20, 20), "obj2")
+        obj3 = MockPhysicsObject(pygame.Rect(15, 100, 20, 20), "obj3")  # overlaps on x only
+        for obj in (obj1, obj2, obj3):
+            self.sap.add_object(obj)
+        self.sap.build_grid()
+
+        self.assertEqual(len(self.sap.get_pairs()), 1)
+        self.assertCountEqual(self.sap.get_pairs()[0], (obj1, obj2))
+        self.assertEqual(self.sap.get_AABB_collisions(obj1), [obj2])
+        self.assertEqual(self.sap.get_AABB_collisions(obj3), [])
+
+    def test_sort_and_removal(self):
+        rng = random.Random(3)
+        objects = [
+            MockPhysicsObject(pygame.Rect(rng.randint(0, 400), rng.randint(0, 400), 30, 30), f"obj{i}")
+            for i in range(60)
+        ]
+        reference = PhysicsGrid()
+        for obj in objects:
+            self.sap.add_object(obj)
+            reference.add_object(obj)
+        self.sap.build_grid(set())
+
+        for obj in objects[:20]:
+            obj.collider.rect = obj.collider.rect.move(rng.randint(-40, 40), rng.randint(-40, 40))
+        self.sap.build_grid(set(objects[:20]))
+        reference.build_grid()
+
+        lefts = [self.sap._bounds[obj][0] for obj in self.sap._order]
+        self.assertEqual(lefts, sorted(lefts))
+        for obj in objects:
+            self.assertCountEqual(self.sap.get_AABB_collisions(obj), reference.get_AABB_collisions(obj))
+
+        removed = objects[0]
+        self.sap.remove_object(removed)
+        for first, second in self.sap.get_pairs():
+            self.assertNotIn(removed, (first, second))
+        for obj in objects[1:]:
+            self.assertNotIn(removed, self.sap.get_AABB_collisions(obj))
+
+    def test_moved_object_queries_current_rect(self):
+        sap = SweepAndPrune()
+        mover = MockPhysicsObject(pygame.Rect(0, 0, 20, 20), "mover")
+        wall = MockPhysicsObject(pygame.Rect(100, 0, 20, 20), "wall")
+        sap.add_object(mover)
+        sap.add_object(wall)
+        sap.build_grid()
+        self.assertEqual(sap.get_AABB_collisions(mover), [])
+
+        # Moved after the build, before the next one
+        mover.collider.rect = mover.collider.rect.move(95, 0)
+        self.assertEqual(sap.get_AABB_collisions(mover), [wall])
+
+        # Moves within the margin keep the stored box and skip the re-sort
+        sap.build_grid({mover})
+        stored = sap._bounds[mover]
+        mover.collider.rect = mover.collider.rect.move(2, 0)
+        sap.build_grid({mover})
+        self.assertEqual(sap._bounds[mover], stored)
+        self.assertEqual(sap.get_AABB_collisions(mover), [wall])
+
+    def test_unindexed_query(self):
+        obj = MockPhysicsObject(pygame.Rect(0, 0, 500, 20), "floor")
+        self.sap.add_object(obj)
+        self.sap.build_grid()
+        self.assertEqual(self.sap.get_simple_AABB_collisions(pygame.Rect(450, 5, 10, 10)), [obj])
+        self.assertEqual(self.sap.get_simple_AABB_collisions(pygame.Rect(450, 50, 10, 10)), [])
+
+    def test_scene_broadphase_selection(self):
+        class MockResource:
+            def clear(self): pass
+        class MockSound:
+            def clear_sounds(self): pass
+        class MockDisplay:
+            def get_width(self): return 800
+            def get_height(self): return 600
+
+        class SAPScene(Scene):
+            broadphase = SweepAndPrune
+
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = SAPScene()
+        self.assertIsInstance(Globals.scene._physics_world._index, SweepAndPrune)
+
+        body1 = Body(pos=(100, 100))
+        body1.add_collider(0, w=20, h=20)
+        body2 = Body(pos=(110, 100))
+        body2.add_collider(0, w=20, h=20)
+        Globals.scene.add_object(body1)
+        Globals.scene.add_object(body2)
+        Globals.scene._game_update(0.016)
+
+        self.assertEqual(len(Globals.scene.get_collision_pairs()), 1)
+        collisions = body1.move_and_collide(Vec2(1, 0))
+        self.assertEqual([obj for obj, _ in collisions], [body2])
+
+
+    def test_world_pairs_follow_collision_layers(self):
+        world = PhysicsWorld(layers=4, broadphase=SweepAndPrune, layer_broadphase={2: PhysicsGrid})
+        objects = {}
+        for name, x, layers, collision_layers in (
+            ("player", 0, "0001", "0010"),
+            ("enemy", 10, "0010", "0010"),
+            ("ghost", 20, "1000", "1000"),
+            ("pickup", 30, "0100", "0001"),
+        ):
+            obj = MockPhysicsObject(pygame.Rect(x, 0, 35, 20), name)
+            obj.collision_layers = collision_layers
+            world.add_object(obj, layers)
+            objects[name] = obj
+        world.build()
+
+        pairs = {frozenset(obj.name for obj in pair) for pair in world.get_pairs()}
+        # The player collides with the enemy's layer although they share none, the ghost
+        # only collides with its own layer, and the pickup lives in the other index
+        self.assertEqual(pairs, {frozenset(("player", "enemy")), frozenset(("player", "pickup"))})
+        self.assertIsNone(PhysicsWorld(layers=1, layer_broadphase={0: SweepAndPrune})._index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+from jazz.physics.body import Body
+from jazz.physics.colliders import CircleCollider
+from jazz.physics.narrowphase import collide
+from jazz.physics.tilemap import TileCollider, merge_tiles, tile_bodies, tile_map_body
+from jazz.utils import Vec2
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+LAYOUT = [
+    ["1", "1", "1", "1"],
+    ["1", "-1", "-1", "1"],
+    ["1", "1", "1", "1"],
+    ["", "", "2", "2"],
+]
+
+
+class TestMergeTiles(unittest.TestCase):
+    def test_merged_rects_cover_solid_tiles_once(self):
+        rects = merge_tiles(LAYOUT)
+        self.assertEqual(rects, [(0, 0, 4, 1), (0, 1, 1, 2), (3, 1, 1, 3), (1, 2, 2, 1), (2, 3, 1, 1)])
+        covered = [(column + x, row + y) for column, row, w, h in rects for x in range(w) for y in range(h)]
+        solid = [(x, y) for y, row in enumerate(LAYOUT) for x, value in enumerate(row) if value not in ("", "-1")]
+        self.assertEqual(sorted(covered), sorted(solid))
+
+        self.assertEqual(merge_tiles(LAYOUT, solid=["2"]), [(2, 3, 2, 1)])
+        self.assertEqual(merge_tiles([["1"] * 50] * 20), [(0, 0, 50, 20)])
+        self.assertEqual(merge_tiles([]), [])
+
+
+class TestTileCollider(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+        self.tiles = tile_map_body(LAYOUT, tile_size=10, pos=(100, 100))
+        Globals.scene.add_object(self.tiles)
+        self.tiles.rotation = 0
+        Globals.scene._build_physics()
+
+    def test_lookup_and_overlap(self):
+        collider = self.tiles.collider
+        self.assertIsInstance(collider, TileCollider)
+        self.assertTrue(collider.tile_at(Vec2(105, 105)))
+        self.assertFalse(collider.tile_at(Vec2(115, 115)))
+        self.assertFalse(collider.tile_at(Vec2(95, 105)))
+        # Only the rectangles under the queried area are looked at
+        self.assertEqual(len(collider.parts_in_rect(CircleCollider(2, pos=(115, 115)).get_rect())), 0)
+
+        self.assertEqual(Globals.scene.overlap_point(Vec2(115, 115)), [])
+        hits = Globals.scene.overlap_circle(Vec2(120, 114), 5)
+        self.assertEqual([obj for obj, _ in hits], [self.tiles])
+        depth, normal = hits[0][1]
+        self.assertAlmostEqual(depth, 1)
+        self.assertEqual(normal, Vec2(0, -1))
+
+    def test_shallow_contacts_at_fractional_origin(self):
+        tiles = TileCollider([["1"]], tile_size=10, pos=(10.7, 0))
+        tiles.rotation = 0
+        # Overlapping by 0.2px, inside the whole pixel the collider rect is truncated to
+        circle = CircleCollider(5, pos=(5.9, 5))
+        circle.rotation = 0
+        depth, normal = collide(circle, tiles)
+        self.assertAlmostEqual(depth, 0.2)
+        self.assertEqual(normal, Vec2(1, 0))
+
+        circle = CircleCollider(5, pos=(5.4, 5))
+        circle.rotation = 0
+        fraction, normal = tiles.sweep(circle, Vec2(0.5, 0), 0.1)
+        self.assertAlmostEqual(fraction, 0.8)
+        self.assertEqual(normal, Vec2(1, 0))
+
+    def test_raycast_and_sweep(self):
+        hit, point = Globals.scene.raycast(Vec2(115, 115), Vec2(1, 0), 100)
+        self.assertIs(hit, self.tiles)
+        self.assertAlmostEqual(point[0], 130)
+        self.assertEqual(Globals.scene.raycast(Vec2(90, 135), Vec2(1, 0), 15), (None, None))
+        hit, point = Globals.scene.raycast(Vec2(90, 135), Vec2(1, 0), 100)
+        self.assertAlmostEqual(point[0], 120)
+
+        hit, fraction, normal = Globals.scene.shape_cast(CircleCollider(3), Vec2(115, 115), Vec2(115, 60))
+        self.assertIs(hit, self.tiles)
+        self.assertAlmostEqual(fraction * 55, 2, places=3)
+        self.assertAlmostEqual(normal.y, -1)
+
+    def test_body_stops_on_tiles(self):
+        ball = Body(pos=(115, 80), ccd=True)
+        ball.add_collider("Circle", radius=4)
+        Globals.scene.add_object(ball)
+        ball.rotation = 0
+        Globals.scene._build_physics()
+        ball.move_and_collide(Vec2(0, 200))
+        self.assertLess(ball.pos.y, 100)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_raycast(self):
+        hits = Globals.scene.raycast_batch(
+            np.array([[115.0, 115.0], [90.0, 135.0]]), np.array([[0.0, -1.0], [1.0, 0.0]]), np.array([100.0, 100.0])
+        )
+        self.assertEqual(list(hits.distances), [5.0, 30.0])
+
+
+class TestTileBodies(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        Globals.scene = Scene()
+
+    def test_one_static_body_per_merged_rect(self):
+        bodies = tile_bodies(LAYOUT, tile_size=10, pos=(100, 100))
+        self.assertEqual(len(bodies), 5)
+        self.assertTrue(all(body.static for body in bodies))
+        self.assertEqual(bodies[0].pos, Vec2(120, 105))
+        self.assertEqual((bodies[0].collider._w, bodies[0].collider._h), (40, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import jazz
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from jazz.engine.base_object import GameObject
+from jazz.engine.dispatch import LATE_UPDATE, UPDATE
+from jazz.engine.scene import Scene
+from jazz.global_dict import Globals
+
+
+class MockResource:
+    def clear(self): pass
+
+
+class MockSound:
+    def clear_sounds(self): pass
+
+
+class MockDisplay:
+    def get_width(self): return 800
+    def get_height(self): return 600
+
+
+class Recorder(GameObject):
+    def __init__(self, log, **kwargs):
+        super().__init__(**kwargs)
+        self.log = log
+
+    def _engine_update(self, delta):
+        self.log.append(("engine", self.name))
+
+    def update(self, delta):
+        self.log.append(("update", self.name))
+
+
+class LateRecorder(GameObject):
+    def __init__(self, log, **kwargs):
+        super().__init__(**kwargs)
+        self.log = log
+
+    def late_update(self, delta):
+        self.log.append(("late", self.name))
+
+
+class TestUpdateDispatch(unittest.TestCase):
+    def setUp(self):
+        Globals.resource = MockResource()
+        Globals.sound = MockSound()
+        Globals.display = MockDisplay()
+        self.scene = Scene()
+        Globals.scene = self.scene
+        self.log = []
+
+    def roots(self, phase, paused=False):
+        return [obj for obj, _ in self.scene._dispatch.calls(phase, paused)]
+
+    def test_only_objects_with_hooks_are_listed(self):
+        for _ in range(50):
+            self.scene.add_object(GameObject())
+        parent = GameObject(name="parent")
+        parent.add_child(Recorder(self.log, name="child"))
+        parent.add_child(GameObject())
+        self.scene.add_object(parent)
+        late = self.scene.add_object(LateRecorder(self.log, name="late"))
+
+        self.assertEqual(self.roots(UPDATE), [parent])
+        self.assertEqual(self.roots(LATE_UPDATE), [late])
+        self.assertEqual(len(self.scene._dispatch.calls(UPDATE, False)[0][1]), 2)
+
+        self.scene._game_update(0.016)
+        self.assertEqual(self.log, [("engine", "child"), ("update", "child"), ("late", "late")])
+
+    def test_children_run_before_their_parent(self):
+        parent = self.scene.add_object(Recorder(self.log, name="parent"))
+        parent.add_child(Recorder(self.log, name="first"))
+        self.scene._game_update(0.016)
+        self.assertEqual([name for _, name in self.log], ["first", "first", "parent", "parent"])
+
+        # Children added at runtime still run before their parent
+        self.log.clear()
+        parent.add_child(Recorder(self.log, name="second"))
+        self.scene._game_update(0.016)
+        self.assertEqual([name for kind, name in self.log if kind == "update"], ["first", "second", "parent"])
+
+        # Hooks assigned on an instance are picked up as well
+        plain = self.scene.add_object(GameObject(name="plain"))
+        plain.update = lambda delta: self.log.append(("update", "plain"))
+        self.log.clear()
+        self.scene._game_update(0.016)
+        self.assertEqual(self.log[-1], ("update", "plain"))
+
+    def test_flags_and_pause(self):
+        first = self.scene.add_object(Recorder(self.log, name="first"))
+        second = self.scene.add_object(Recorder(self.log, name="second", pause_process=True))
+        self.assertEqual(self.roots(UPDATE), [first, second])
+        self.assertEqual(self.roots(UPDATE, True), [second])
+
+        first.game_process = False
+        self.assertEqual(self.roots(UPDATE), [second])
+        # Re-enabled objects keep their place in the scene's order
+        first.game_process = True
+        self.assertEqual(self.roots(UPDATE), [first, second])
+
+        self.scene.pause()
+        self.scene._game_update(0.016)
+        self.assertEqual({name for _, name in self.log}, {"second"})
+
+    def test_kills(self):
+        victim = self.scene.add_object(GameObject())
+        updater = self.scene.add_object(Recorder(self.log, name="updater"))
+        victim.queue_kill()
+        updater.do_kill = True
+        self.scene.create_timer(0.01, lambda: None, ())
+        self.assertEqual(len(self.scene), 3)
+
+        self.scene._game_update(0.016)
+        self.assertEqual(len(self.scene), 0)
+        self.assertEqual(self.log, [])
+        self.assertEqual(self.roots(UPDATE), [])
+
+
+if __name__ == "__main__":
+    unittest.main()